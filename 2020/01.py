@@ -1,25 +1,51 @@
 import itertools
 import sys
 import time
+from pathlib import Path
+from typing import List
 
-t0 = time.perf_counter()
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
 
-nums = []
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        nums.append(int(l))
+FILE_TO_READ = "01_input"
 
-t1 = time.perf_counter()
 
-for i, j, k in itertools.combinations(nums, 3):
-    if i + j + k == 2020:
-        print(i * j * k)
-        break
+@cached()
+def given() -> List[int]:
+    with open(FILE_TO_READ, "r") as f:
+        return [int(l) for l in f]
 
-t2 = time.perf_counter()
 
-tf = lambda x: f"{round(x*1000, 5)} ms"
+def part_one(nums: List[int]):
+    return "NOT IMPLEMENTED"
 
-print(
-    f"\nTiming\n======\n\nFile read: {tf(t1-t0)}\nAlgo: {tf(t2-t1)}\nTotal: {tf(t2-t0)}"
-)
+
+def part_two(nums: List[int]) -> int:
+    for i, j, k in itertools.combinations(nums, 3):
+        if i + j + k == 2020:
+            return i * j * k
+    raise ValueError("No three entries sum to 2020")
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    from util import quiet_broken_pipe
+
+    t0 = time.perf_counter()
+
+    nums = given()
+
+    t1 = time.perf_counter()
+
+    with quiet_broken_pipe():
+        print(part_two(nums))
+
+    t2 = time.perf_counter()
+
+    tf = lambda x: f"{round(x*1000, 5)} ms"
+
+    with quiet_broken_pipe():
+        print(
+            f"\nTiming\n======\n\nFile read: {tf(t1-t0)}\nAlgo: {tf(t2-t1)}\nTotal: {tf(t2-t0)}"
+        )
@@ -1,6 +1,12 @@
 import sys
 import time
-from typing import Tuple
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "02_input"
 
 
 def segment(l: str) -> Tuple[int, int, str, str]:
@@ -27,13 +33,30 @@ def is_valid_2(l: str):
     return (pswd[idx_1] == letter) ^ (pswd[idx_2] == letter)
 
 
-t0 = time.perf_counter()
+@cached()
+def given() -> List[str]:
+    with open(FILE_TO_READ, "r") as f:
+        return f.readlines()
+
+
+def part_one(lines: List[str]) -> int:
+    return sum(is_valid_1(l) for l in lines)
+
+
+def part_two(lines: List[str]) -> int:
+    return sum(is_valid_2(l) for l in lines)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    valid = part_two(given())
 
-valid = 0
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        valid += is_valid_2(l)
+    t1 = time.perf_counter()
 
-t1 = time.perf_counter()
+    from util import quiet_broken_pipe
 
-print(f"Valid: {valid}\n\nTime: {(t1-t0)*1000} ms")
+    with quiet_broken_pipe():
+        print(f"Valid: {valid}\n\nTime: {(t1-t0)*1000} ms")
@@ -2,8 +2,14 @@ import math
 import sys
 import time
 from collections import namedtuple
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "03_input"
+
 # . = empty, # = tree
 #
 # ..##.......
@@ -14,14 +20,15 @@ from typing import List, Tuple
 Slope = namedtuple("Slope", ["slope_w", "slope_h"])
 
 
-def next_position(pos: Tuple[int, int], slope: Slope) -> Tuple[int, int]:
+def next_position(pos: Tuple[int, int], slope: Slope, width: int) -> Tuple[int, int]:
     """ New position based on given slope """
     h = pos[0] + slope.slope_h
     w = (pos[1] + slope.slope_w) % width
     return (h, w)
 
 
-def count_trees(slope: Slope) -> int:
+def count_trees(t_map: List[str], slope: Slope) -> int:
+    width: int = len(t_map[0])
     trees_encountered: int = 0
     curr_position: Tuple[int, int] = (0, 0)
     while curr_position[0] < len(t_map):
@@ -30,22 +37,11 @@ def count_trees(slope: Slope) -> int:
             trees_encountered += 1
 
         # Get next position
-        curr_position = next_position(curr_position, slope)
+        curr_position = next_position(curr_position, slope, width)
 
     return trees_encountered
 
 
-t0 = time.perf_counter()
-
-t_map: List[str] = []
-
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        t_map.append(l[:-1])
-
-height: int = len(t_map)
-width: int = len(t_map[0])
-
 # Slopes: width, height
 slopes: List[Slope] = [
     Slope(slope_w=1, slope_h=1),
@@ -55,20 +51,47 @@ slopes: List[Slope] = [
     Slope(slope_w=1, slope_h=2),
 ]
 
-t1 = time.perf_counter()
-
-trees_encountered: List[int] = []
 
-for slope in slopes:
-    trees_encountered.append(count_trees(slope))
+@cached()
+def given() -> List[str]:
+    t_map: List[str] = []
+    with open(FILE_TO_READ, "r") as f:
+        for l in f:
+            t_map.append(l.rstrip("\n"))
+    return t_map
 
-t2 = time.perf_counter()
 
 # Starting at the top-left corner of your map and following a given slope,
 # how many trees would you encounter?
-print(
-    f"Result: {math.prod(trees_encountered)}\n\n"
-    f"Slopes and trees: {list(zip(slopes, trees_encountered))}\n\n"
-    f"File read: {(t1-t0)*1000} ms\nAlgorithm: {(t2-t1)*1000} ms\n"
-    f"Total: {(t2-t0)*1000} ms"
-)
+
+
+def part_one(t_map: List[str]) -> int:
+    return count_trees(t_map, Slope(slope_w=3, slope_h=1))
+
+
+def part_two(t_map: List[str]) -> int:
+    return math.prod(count_trees(t_map, slope) for slope in slopes)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    t_map: List[str] = given()
+
+    t1 = time.perf_counter()
+
+    trees_encountered: List[int] = [count_trees(t_map, slope) for slope in slopes]
+
+    t2 = time.perf_counter()
+
+    from util import quiet_broken_pipe
+
+    with quiet_broken_pipe():
+        print(
+            f"Result: {math.prod(trees_encountered)}\n\n"
+            f"Slopes and trees: {list(zip(slopes, trees_encountered))}\n\n"
+            f"File read: {(t1-t0)*1000} ms\nAlgorithm: {(t2-t1)*1000} ms\n"
+            f"Total: {(t2-t0)*1000} ms"
+        )
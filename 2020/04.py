@@ -1,7 +1,14 @@
 import re
 import sys
 import time
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_records
+
+FILE_TO_READ = "04_input"
 
 # Expected fields + validation rules:
 #
@@ -28,8 +35,14 @@ def get_fields(passport: str) -> Dict[str, str]:
     return field_dict
 
 
-def is_valid(passport: str) -> bool:
-    fields: Dict[str, str] = get_fields(passport)
+def has_required_fields(passport: List[str]) -> bool:
+    # The fields of a passport may be spread over several lines
+    fields: Dict[str, str] = get_fields(" ".join(passport))
+    return all(rf in fields for rf in req_fields)
+
+
+def is_valid(passport: List[str]) -> bool:
+    fields: Dict[str, str] = get_fields(" ".join(passport))
 
     # All fields are required
     if any([rf not in fields for rf in req_fields]):
@@ -81,33 +94,35 @@ def is_valid(passport: str) -> bool:
     return True
 
 
-t0 = time.perf_counter()
+@cached()
+def given() -> Iterator[List[str]]:
+    # Passports are streamed one at a time ("-" reads them from stdin)
+    return read_records(FILE_TO_READ)
 
-valid: int = 0
 
-with open(sys.argv[1], "r") as f:
-    passport: str = ""
-    for l in f:
-        if l == "\n":
-            if is_valid(passport):
-                valid += 1
-            passport = ""
-            continue
+# Count the number of valid passports - those that have all required fields.
+# Treat cid as optional.
+# In your batch file, how many passports are valid?
 
-        passport += l[:-1] + " "
 
-    # Don't forget the last passport
-    if is_valid(passport):
-        valid += 1
+def part_one(passports: Iterable[List[str]]) -> int:
+    return sum(has_required_fields(passport) for passport in passports)
 
 
-t1 = time.perf_counter()
+def part_two(passports: Iterable[List[str]]) -> int:
+    return sum(is_valid(passport) for passport in passports)
 
 
-# Count the number of valid passports - those that have all required fields.
-# Treat cid as optional.
-# In your batch file, how many passports are valid?
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    valid: int = part_two(given())
+
+    t1 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(f"Valid: {valid}\n\n" f"Time taken: {tf(t1-t0)}")
+    with quiet_broken_pipe():
+        print(f"Valid: {valid}\n\n" f"Time taken: {tf(t1-t0)}")
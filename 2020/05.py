@@ -1,7 +1,13 @@
 import sys
 import time
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "05_input"
+
 # Binary Boarding
 #
 # In: FBFBBFFRLR
@@ -49,48 +55,62 @@ def get_seat_id(row: int, col: int) -> int:
     return row * 8 + col
 
 
-# Main algo
+@cached()
+def given() -> List[int]:
+    ids: List[int] = []
+    with open(FILE_TO_READ, "r") as f:
+        for l in f:
+            row: int
+            col: int
+            row, col = get_row_col(l)
+            ids.append(get_seat_id(row=row, col=col))
+    return ids
 
-t0 = time.perf_counter()
 
 # What is the highest seat ID on a boarding pass?
 
-highest: int = 0
-ids: List[int] = []
 
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        row: int
-        col: int
-        row, col = get_row_col(l)
-        id: int = get_seat_id(row=row, col=col)
-        ids.append(id)
-        if id > highest:
-            highest = id
+def part_one(ids: List[int]) -> int:
+    return max(ids)
 
-t1 = time.perf_counter()
 
 # What is your own ID? It should be...
 # - missing from the list
 # - smaller than the highest ID
 # - but both the ID -1 and +1 from it should exist in the list.
 
-own: int = -1
 
-for i in range(highest + 1):
-    if i not in ids:
-        if (i - 1 in ids) and (i + 1 in ids):
-            own = i
+def part_two(ids: List[int]) -> int:
+    own: int = -1
+    taken = set(ids)
+    for i in range(max(ids) + 1):
+        if i not in taken:
+            if (i - 1 in taken) and (i + 1 in taken):
+                own = i
+    return own
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    ids: List[int] = given()
+    highest: int = part_one(ids)
+
+    t1 = time.perf_counter()
 
-t2 = time.perf_counter()
+    own: int = part_two(ids)
 
+    t2 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Own ID: {own}\n"
-    f"Highest ID: {highest}\n\n"
-    f"Find highest: {tf(t1-t0)}\n"
-    f"Find own: {tf(t2-t1)}\n"
-    f"Total: {tf(t2-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Own ID: {own}\n"
+            f"Highest ID: {highest}\n\n"
+            f"Find highest: {tf(t1-t0)}\n"
+            f"Find own: {tf(t2-t1)}\n"
+            f"Total: {tf(t2-t0)}"
+        )
@@ -1,7 +1,14 @@
 import sys
 import time
 from functools import reduce
-from typing import List, Set
+from pathlib import Path
+from typing import Iterable, Iterator, List, Set
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_records
+
+FILE_TO_READ = "06_input"
 
 # Customs declaration
 #
@@ -20,43 +27,34 @@ def all_yess(group: List[str]) -> int:
     return len(yess)
 
 
-# 1. Find the questions combined for the group which were answered y.
-
-t0 = time.perf_counter()
+@cached()
+def given() -> Iterator[List[str]]:
+    # The groups are streamed one at a time ("-" reads them from stdin), so they are
+    # counted while parsing
+    return read_records(FILE_TO_READ)
 
-groups: List[List[str]] = []
 
-with open(sys.argv[1], "r") as f:
-    group: List[str] = []
-    for l in f:
-        if l == "\n":
-            groups.append(group)
-            group = []
-            continue
+def part_one(groups: Iterable[List[str]]) -> int:
+    return sum(unique_yess(group) for group in groups)
 
-        group.append(l[:-1])
 
-    # The last group is not followed by an empty line
-    groups.append(group)
+# Find the questions the whole group answered y, and count them.
 
 
-# 2. Count the number.
+def part_two(groups: Iterable[List[str]]) -> int:
+    return sum(all_yess(group) for group in groups)
 
-t1 = time.perf_counter()
 
-total_yess: int = 0
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
 
-for group in groups:
-    total_yess += all_yess(group)
+    t0 = time.perf_counter()
 
-t2 = time.perf_counter()
+    total_yess: int = part_two(given())
 
+    t1 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Sum of agreed yess: {total_yess}\n\n"
-    f"Parse groups: {tf(t1-t0)}\n"
-    f"Count yess: {tf(t2-t1)}\n"
-    f"Total: {tf(t2-t0)}"
-)
+    with quiet_broken_pipe():
+        print(f"Sum of agreed yess: {total_yess}\n\n" f"Total: {tf(t1-t0)}")
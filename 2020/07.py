@@ -2,8 +2,14 @@ import re
 import sys
 import time
 from collections import namedtuple
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "07_input"
+
 # Handy Haversacks
 #
 # - bags must be color-coded
@@ -29,7 +35,7 @@ bag_name_ptn = r"(\w|\s)+"
 
 
 def parse_rule(rule_definition: str) -> Tuple[str, BagRule]:
-    m1 = re.fullmatch(f"({bag_name_ptn})" r" bags contain (.+)\.", l[:-1])
+    m1 = re.fullmatch(f"({bag_name_ptn})" r" bags contain (.+)\.", rule_definition)
     if not m1:
         raise ValueError()
 
@@ -59,34 +65,39 @@ def parse_rule(rule_definition: str) -> Tuple[str, BagRule]:
     return parent, bag_rule
 
 
-t0 = time.perf_counter()
+def parse_rules(lines: List[str]) -> Dict[str, BagRule]:
+    bag_containment: Dict[str, BagRule] = dict()
 
-bag_containment: Dict[str, BagRule] = dict()
-
-# First, we parse all in one direction (parent -> child)
-with open(sys.argv[1], "r") as f:
-    for l in f:
+    # First, we parse all in one direction (parent -> child)
+    for l in lines:
         parent: str
         rule: BagRule
-        parent, rule = parse_rule(l[:-1])
+        parent, rule = parse_rule(l)
         # We assume that only one rule line exists per parent
         bag_containment[parent] = rule
 
-# Second, we add the (child -> parent) relationships
+    return bag_containment
 
-t1 = time.perf_counter()
 
-for parent, rule in bag_containment.items():
-    for child, _ in rule.children.items():
-        bag_containment[child].parents.append(parent)
+def link_parents(bag_containment: Dict[str, BagRule]) -> None:
+    """ Add the (child -> parent) relationships. """
+    for parent, rule in bag_containment.items():
+        for child, _ in rule.children.items():
+            bag_containment[child].parents.append(parent)
 
 
-# B / PART 1: How many potential parent bags exist for a shiny gold bag?
+@cached()
+def given() -> Dict[str, BagRule]:
+    with open(FILE_TO_READ, "r") as f:
+        bag_containment = parse_rules([l.rstrip("\n") for l in f])
+    link_parents(bag_containment)
+    return bag_containment
 
-t2 = time.perf_counter()
+
+# B / PART 1: How many potential parent bags exist for a shiny gold bag?
 
 
-def get_parent_paths(bag: str) -> List[List[str]]:
+def get_parent_paths(bag_containment: Dict[str, BagRule], bag: str) -> List[List[str]]:
     """ Return a list of paths from this bag to all potential root bags. """
     parent_paths: List[List[str]] = list()
 
@@ -98,24 +109,24 @@ def get_parent_paths(bag: str) -> List[List[str]]:
         parent_paths.append([bag, parent])
 
         # b) Recurse and add paths beyond this parent
-        for beyond_path in get_parent_paths(parent):
+        for beyond_path in get_parent_paths(bag_containment, parent):
             # Each beyond path starts with the given parent
             parent_paths.append([bag, *beyond_path])
 
     return parent_paths
 
 
-# # First, we get all possible paths that end in shiny gold.
-# paths: List[List[str]] = get_parent_paths("shiny gold")
-# # Second, we remove duplicates and count.
-# t3 = time.perf_counter()
-# roots: Set[str] = {p[-1] for p in paths}
-# t4 = time.perf_counter()
+def part_one(bag_containment: Dict[str, BagRule]) -> int:
+    # First, we get all possible paths that start at shiny gold; every bag on the
+    # way can contain it. Second, we remove duplicates and count.
+    paths: List[List[str]] = get_parent_paths(bag_containment, "shiny gold")
+    return len({p[-1] for p in paths})
+
 
 # B / PART 2: How many bags must a shiny gold bag contain?
 
 
-def count_children(bag: str) -> int:
+def count_children(bag_containment: Dict[str, BagRule], bag: str) -> int:
     children: Dict[str, int] = bag_containment[bag].children
 
     sum: int = 0
@@ -123,26 +134,47 @@ def count_children(bag: str) -> int:
     # Recurse; recursion end is reached if no more children are available
     for child, child_count in children.items():
         # For each child, add the sum of its children plus one of myself
-        sum += child_count * (1 + count_children(child))
+        sum += child_count * (1 + count_children(bag_containment, child))
 
     return sum
 
 
-t3 = time.perf_counter()
-# Traverse through all children and sum up
-children_count: int = count_children("shiny gold")
+def part_two(bag_containment: Dict[str, BagRule]) -> int:
+    # Traverse through all children and sum up
+    return count_children(bag_containment, "shiny gold")
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    with open(FILE_TO_READ, "r") as f:
+        bag_containment: Dict[str, BagRule] = parse_rules([l.rstrip("\n") for l in f])
+
+    t1 = time.perf_counter()
+
+    link_parents(bag_containment)
+
+    t2 = time.perf_counter()
+
+    # The script only ever printed part two; part one is available as part_one()
+
+    t3 = time.perf_counter()
 
-t4 = time.perf_counter()
+    children_count: int = part_two(bag_containment)
 
+    t4 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Number of children: {children_count}\n\n"
-    f"Parse file and add p -> c relationships: {tf(t1-t0)}\n"
-    f"Traverse to get c -> p relationships: {tf(t2-t1)}\n"
-    f"Get all parent paths: {tf(t3-t2)}\n"
-    f"Get number of children: {tf(t4-t3)}\n"
-    f"=========\n"
-    f"Total: {tf(t4-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Number of children: {children_count}\n\n"
+            f"Parse file and add p -> c relationships: {tf(t1-t0)}\n"
+            f"Traverse to get c -> p relationships: {tf(t2-t1)}\n"
+            f"Get all parent paths: {tf(t3-t2)}\n"
+            f"Get number of children: {tf(t4-t3)}\n"
+            f"=========\n"
+            f"Total: {tf(t4-t0)}"
+        )
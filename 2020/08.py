@@ -1,12 +1,18 @@
 import re
 import sys
 import time
-from typing import Any, Callable, Dict, List
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "08_input"
 
 # Handheld Halting
 #
 # Operations
-# acc = inc/dec global value `accumulator` by argument
+# acc = inc/dec the console's `accumulator` by argument
 # jmp = jump to instruction relative to current position
 # nop = do nothing
 
@@ -18,15 +24,6 @@ class Instruction:
         self.executed = executed
 
 
-# GLOBALS
-accumulator: int = 0
-program: List[Instruction] = []
-instructions_executed: List[int] = []
-
-# Run the program until it reaches the same instruction a second time.
-# Terminate and print accumulator value
-
-
 def parse_instruction(instruction_line: str) -> Instruction:
     # nop +0
     m = re.fullmatch(r"(\w+) (\+|-)(\d+)\n", instruction_line)
@@ -45,130 +42,161 @@ def parse_instruction(instruction_line: str) -> Instruction:
     return Instruction(operation=ins, value=num)
 
 
-def execute(pointer: int) -> int:
-    global accumulator
-    global program
+class Console:
+    """ One run of a program: its instructions, the accumulator and the trace.
 
-    instruction: Instruction = program[pointer]
-    # Mark executed
-    program[pointer].executed = True
+    Kept together instead of in module globals, so that several programs can be run
+    at the same time.
+    """
 
-    if instruction.operation == "nop":
-        return 1 + pointer
-    elif instruction.operation == "jmp":
-        return instruction.value + pointer
-    elif instruction.operation == "acc":
-        accumulator += instruction.value
-        return 1 + pointer
-    else:
-        raise ValueError(f"Unknown operation: {instruction.operation}")
+    def __init__(self, program: List[Instruction]) -> None:
+        self.program: List[Instruction] = program
+        self.accumulator: int = 0
+        self.instructions_executed: List[int] = []
 
+    def execute(self, pointer: int) -> int:
+        instruction: Instruction = self.program[pointer]
+        # Mark executed
+        instruction.executed = True
 
-def _roll_back_instruction(pointer: int) -> None:
-    global program
-    global accumulator
+        if instruction.operation == "nop":
+            return 1 + pointer
+        elif instruction.operation == "jmp":
+            return instruction.value + pointer
+        elif instruction.operation == "acc":
+            self.accumulator += instruction.value
+            return 1 + pointer
+        else:
+            raise ValueError(f"Unknown operation: {instruction.operation}")
 
-    instruction: Instruction = program[pointer]
+    def _roll_back_instruction(self, pointer: int) -> None:
+        instruction: Instruction = self.program[pointer]
 
-    if instruction.operation == "acc":
-        # Reverse accumulation
-        accumulator -= instruction.value
+        if instruction.operation == "acc":
+            # Reverse accumulation
+            self.accumulator -= instruction.value
 
-    program[pointer].executed = False
+        instruction.executed = False
 
+    def roll_back(self, condition: Callable[[int], bool]):
+        """ Roll back the state until the given condition is met based on the passed pointer. """
 
-def roll_back(condition: Callable[[int], bool]):
-    """ Roll back the state until the given condition is met based on the passed pointer. """
+        pointer: int
+        # We assume that one instruction can always be safely rolled back.
+        while True:
+            # Always roll back pointer and remove executed instruction from list
+            pointer = self.instructions_executed.pop(-1)
+            # Reverse accumulation and reset hit_detector
+            self._roll_back_instruction(pointer)
 
-    global instructions_executed
+            # Stop if condition is met
+            if condition(pointer):
+                break
 
-    pointer: int
-    # We assume that one instruction can always be safely rolled back.
-    while True:
-        # Always roll back pointer and remove executed instruction from list
-        pointer = instructions_executed.pop(-1)
-        # Reverse accumulation and reset hit_detector
-        _roll_back_instruction(pointer)
+        # Hit the state before the last unchanged jmp or nop
 
-        # Stop if condition is met
-        if condition(pointer):
-            break
+        # The instruction currently pointed to was rolled back
+        return pointer
 
-    # Hit the state before the last unchanged jmp or nop
+    def swap_jmp_nop(self, pointer: int):
+        """ Swap the instruction the pointer points to. """
 
-    # The instruction currently pointed to was rolled back
-    return pointer
+        ins: Instruction = self.program[pointer]
 
+        if ins.operation == "jmp":
+            ins.operation = "nop"
+        elif ins.operation == "nop":
+            ins.operation = "jmp"
+        else:
+            raise ValueError(f"Tried to swap {ins.operation}")
 
-def swap_jmp_nop(pointer: int):
-    """ Swap the instruction the pointer points to. """
 
-    ins: Instruction = program[pointer]
+@cached()
+def given() -> Console:
+    with open(FILE_TO_READ, "r") as f:
+        return Console([parse_instruction(l) for l in f])
 
-    if ins.operation == "jmp":
-        ins.operation = "nop"
-    elif ins.operation == "nop":
-        ins.operation = "jmp"
-    else:
-        raise ValueError(f"Tried to swap {ins.operation}")
 
+# Part 1: Run the program until it reaches the same instruction a second time.
+# What is the accumulator value just before that?
 
-t0 = time.perf_counter()
 
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        instruction = parse_instruction(l)
-        program.append(instruction)
+def part_one(console: Console) -> int:
+    program: List[Instruction] = console.program
+    instruction_index: int = 0
 
-t1 = time.perf_counter()
+    while instruction_index < len(program) and not program[instruction_index].executed:
+        console.instructions_executed.append(instruction_index)
+        instruction_index = console.execute(instruction_index)
 
-instruction_index: int = 0
-code_changed: bool = False  # Was an instruction changed, and if yes, which?
-past_changes: List[int] = []  # Changed indices that did not fix the infinite loop
+    return console.accumulator
 
-state: Dict[str, Any] = {}
 
-while True:
-    # Successfull termination
-    if instruction_index >= len(program):
-        break
+# Part 2: Swap exactly one jmp or nop so that the program terminates.
+# What is the accumulator value after it terminated?
 
-    if program[instruction_index].executed:
-        # If a change was tried, we first need to revert back to the state before it was changed
-        if code_changed:
-            # Revert change again
-            swap_jmp_nop(past_changes[-1])
-            code_changed = False
 
-            # Go back to state before the change was tried
-            instruction_index = roll_back(lambda p: p == past_changes[-1])
+def part_two(console: Console) -> int:
+    program: List[Instruction] = console.program
+    instruction_index: int = 0
+    code_changed: bool = False  # Was an instruction changed, and if yes, which?
+    past_changes: List[int] = []  # Changed indices that did not fix the infinite loop
 
-            # Continue rolling back from the point of the unsuccessful change
+    while True:
+        # Successfull termination
+        if instruction_index >= len(program):
+            break
 
-        # Roll back until first untried jmp or nop
-        instruction_index = roll_back(
-            lambda p: program[p].operation in ["jmp", "nop"] and p not in past_changes
-        )
-        # Change position
-        swap_jmp_nop(instruction_index)
-        code_changed = True
-        past_changes.append(instruction_index)
+        if program[instruction_index].executed:
+            # If a change was tried, we first need to revert back to the state before it was changed
+            if code_changed:
+                # Revert change again
+                console.swap_jmp_nop(past_changes[-1])
+                code_changed = False
 
-        # Continue running
+                # Go back to state before the change was tried
+                instruction_index = console.roll_back(lambda p: p == past_changes[-1])
 
-    instructions_executed.append(instruction_index)
-    instruction_index = execute(instruction_index)
+                # Continue rolling back from the point of the unsuccessful change
 
-t2 = time.perf_counter()
+            # Roll back until first untried jmp or nop
+            instruction_index = console.roll_back(
+                lambda p: program[p].operation in ["jmp", "nop"] and p not in past_changes
+            )
+            # Change position
+            console.swap_jmp_nop(instruction_index)
+            code_changed = True
+            past_changes.append(instruction_index)
 
+            # Continue running
 
-from util import tf
+        console.instructions_executed.append(instruction_index)
+        instruction_index = console.execute(instruction_index)
 
-print(
-    f"Accumulator value: {accumulator}\n"
-    f"\n"
-    f"Parse file: {tf(t1-t0)}\n"
-    f"Execute: {tf(t2-t1)}\n"
-    f"=========\n"
-    f"Total: {tf(t2-t0)}"
-)
+    return console.accumulator
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    console: Console = given()
+
+    t1 = time.perf_counter()
+
+    accumulator: int = part_two(console)
+
+    t2 = time.perf_counter()
+
+    from util import quiet_broken_pipe, tf
+
+    with quiet_broken_pipe():
+        print(
+            f"Accumulator value: {accumulator}\n"
+            f"\n"
+            f"Parse file: {tf(t1-t0)}\n"
+            f"Execute: {tf(t2-t1)}\n"
+            f"=========\n"
+            f"Total: {tf(t2-t0)}"
+        )
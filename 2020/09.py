@@ -1,8 +1,14 @@
 import sys
 import time
 from itertools import combinations
+from pathlib import Path
 from typing import List
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "09_input"
+
 # Encoding Error
 #
 # XMAS encoding
@@ -12,8 +18,8 @@ from typing import List
 
 # Part 1: Find the first number that does not correspond to the encoding
 
-buffer_size: int = int(sys.argv[2])
-numbers: List[int] = []
+# The preamble; the examples use 5 (pass it as the second argument)
+buffer_size: int = 25
 
 
 def valid_number(num: int, buffer: List[int]) -> bool:
@@ -24,34 +30,27 @@ def valid_number(num: int, buffer: List[int]) -> bool:
     return False
 
 
-t0 = time.perf_counter()
-
-invalid_value: int = -1
+@cached()
+def given() -> List[int]:
+    with open(FILE_TO_READ, "r") as f:
+        return [int(l) for l in f]
 
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        value: int = int(l[:-1])
 
-        # Only start checking when buffer is large enough
-        if (
-            (len(numbers) >= buffer_size)
-            and (invalid_value == -1)
-            and (
-                not valid_number(value, numbers[-buffer_size:])
-            )  # slice until end, as number is not appended yet
-        ):
-            invalid_value = value
+def part_one(numbers: List[int]) -> int:
+    # Only start checking when buffer is large enough
+    for i in range(buffer_size, len(numbers)):
+        if not valid_number(numbers[i], numbers[i - buffer_size : i]):
+            return numbers[i]
 
-        numbers.append(value)
+    raise RuntimeError("NOT FOUND!")
 
-t1 = time.perf_counter()
 
 # Part 2: Find encryption weakness:
 #   a) Identify the first contiguous set of numbers that sum up to the invalid number.
 #   b) Add together the smallest and largest number in the range.
 
 
-def find_range() -> List[int]:
+def find_range(numbers: List[int], invalid_value: int) -> List[int]:
     for i in range(len(numbers)):
         for j in range(i + 2, len(numbers) + 1):
             found_rng: List[int] = numbers[i:j]
@@ -62,20 +61,37 @@ def find_range() -> List[int]:
     raise RuntimeError("NOT FOUND!")
 
 
-found_rng: List[int] = find_range()
-encryption_weakness: int = min(found_rng) + max(found_rng)
+def part_two(numbers: List[int]) -> int:
+    found_rng: List[int] = find_range(numbers, part_one(numbers))
+    return min(found_rng) + max(found_rng)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+    if len(sys.argv) > 2:
+        buffer_size = int(sys.argv[2])
+
+    t0 = time.perf_counter()
+
+    numbers: List[int] = given()
+    invalid_value: int = part_one(numbers)
+
+    t1 = time.perf_counter()
 
-t2 = time.perf_counter()
+    found_rng: List[int] = find_range(numbers, invalid_value)
+    encryption_weakness: int = min(found_rng) + max(found_rng)
 
+    t2 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Part 1: Invalid number = {invalid_value}\n"
-    f"Part 2: Encryption weakness = {encryption_weakness}\n"
-    f"\n"
-    f"Parse file and find invalid value: {tf(t1-t0)}\n"
-    f"Identify encryption weakness: {tf(t2-t1)}\n"
-    f"=========\n"
-    f"Total: {tf(t2-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Part 1: Invalid number = {invalid_value}\n"
+            f"Part 2: Encryption weakness = {encryption_weakness}\n"
+            f"\n"
+            f"Parse file and find invalid value: {tf(t1-t0)}\n"
+            f"Identify encryption weakness: {tf(t2-t1)}\n"
+            f"=========\n"
+            f"Total: {tf(t2-t0)}"
+        )
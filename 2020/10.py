@@ -1,8 +1,14 @@
 import sys
 import time
 from collections import Counter
+from pathlib import Path
 from typing import List
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "10_input"
+
 # Adapter Array
 #
 # - List of joltage adapters
@@ -13,20 +19,12 @@ from typing import List
 # A) Find a chain that connects all adapters from the socket (0) to the device (max + 3)
 #    and multiply the number of 1-jolt steps with the number of 3-jolt steps.
 
-adapters: List[int] = []
-
-t0 = time.perf_counter()
-
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        adapters.append(int(l[:-1]))
 
-# end / device = max+3
-device: int = max(adapters) + 3
+@cached()
+def given() -> List[int]:
+    with open(FILE_TO_READ, "r") as f:
+        return sorted(int(l) for l in f)
 
-t1 = time.perf_counter()
-
-adapters.sort()
 
 # Part 1
 
@@ -46,15 +44,17 @@ def count_joltage_steps(adapters: List[int]) -> int:
     return deltas[1] * deltas[3]
 
 
-joltage_step_result: int = count_joltage_steps(adapters + [device])
+def part_one(adapters: List[int]) -> int:
+    # end / device = max+3
+    device: int = max(adapters) + 3
+    return count_joltage_steps(adapters + [device])
+
 
 # B) Find all possible chains that connect the socket to the device
 #    and count the number of distinct chains.
 
 # Part 2
 
-t2 = time.perf_counter()
-
 
 def count_chain_graph(adapters: List[int], start: int, end: int) -> int:
     """ Count chains based on a graph. Assumes adapters list is sorted. """
@@ -81,20 +81,37 @@ def count_chain_graph(adapters: List[int], start: int, end: int) -> int:
     return valid_path_count[-1]
 
 
-chain_count: int = count_chain_graph(adapters, start=0, end=device)
+def part_two(adapters: List[int]) -> int:
+    return count_chain_graph(adapters, start=0, end=max(adapters) + 3)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    adapters: List[int] = given()
+
+    t1 = time.perf_counter()
+
+    joltage_step_result: int = part_one(adapters)
+
+    t2 = time.perf_counter()
 
-t3 = time.perf_counter()
+    chain_count: int = part_two(adapters)
 
+    t3 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Part 1: Joltage steps = {joltage_step_result}\n"
-    f"Part 2: Number of distinct chains = {chain_count}\n"
-    f"\n"
-    f"Parse file and collect adapters: {tf(t1-t0)}\n"
-    f"Count joltage steps: {tf(t2-t1)}\n"
-    f"Count chains: {tf(t3-t2)}\n"
-    f"=====\n"
-    f"Total: {tf(t3-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Part 1: Joltage steps = {joltage_step_result}\n"
+            f"Part 2: Number of distinct chains = {chain_count}\n"
+            f"\n"
+            f"Parse file and collect adapters: {tf(t1-t0)}\n"
+            f"Count joltage steps: {tf(t2-t1)}\n"
+            f"Count chains: {tf(t3-t2)}\n"
+            f"=====\n"
+            f"Total: {tf(t3-t0)}"
+        )
@@ -1,6 +1,16 @@
 import sys
 import time
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.grid import ALL_DIRECTIONS, Grid
+from advent.util import lazy_import
+
+np = lazy_import("numpy")
+
+FILE_TO_READ = "11_input"
 
 # pylint: disable=unsubscriptable-object
 
@@ -18,201 +28,150 @@ from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
 
 # Simulate until situation is stable; how many seats are occupied?
 
-t0 = time.perf_counter()
-
-
-class Position:
-    def __init__(self, state: str):
-        self.state: str = state
-        self.visible_seats: List[Tuple[int, int]] = []
-        self._initialized: bool = False
-
-    def set_visible_seats(self, visible: List[Tuple[int, int]]) -> None:
-        self.visible_seats = visible
-        self._initialized = True
-
-    def is_occupied_seat(self) -> bool:
-        return self.state == "#"
-
-    def is_empty_seat(self) -> bool:
-        return self.state == "L"
-
-    def is_seat(self) -> bool:
-        return self.is_occupied_seat() or self.is_empty_seat()
-
-    def get_visible_seats(self, seat_map):
-        # type: (List[List[Position]]) -> List[Position]
-        if not self._initialized:
-            raise RuntimeError()
-        return [seat_map[i][j] for i, j in self.visible_seats]
-
-
-seat_map: List[List[Position]] = []
-
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        seat_map.append([Position(state=s) for s in l[:-1]])
-
-
-def iterate(seat_map: List[List[Position]]) -> Iterable[Tuple[int, int, Position]]:
-    for i in range(len(seat_map)):
-        for j in range(len(seat_map[i])):
-            yield i, j, seat_map[i][j]
-
-
-t1 = time.perf_counter()
-
-
-def get_seat_positions(seat_map: List[List[Position]]) -> Dict[int, List[int]]:
-    seat_positions: Dict[int, List[int]] = {i: [] for i in range(len(seat_map))}
-
-    for i, j, position in iterate(seat_map):
-        if position.is_seat():
-            seat_positions[i].append(j)
-
-    return seat_positions
-
-
-def simulate_seat(row: int, col: int, seat_limit: int) -> Optional[str]:
-    global seat_map
-    own_seat: Position = seat_map[row][col]
-
-    visible_seats: List[Position] = own_seat.get_visible_seats(seat_map)
-    occupied: int = sum([1 if s.is_occupied_seat() else 0 for s in visible_seats])
-
-    if own_seat.is_empty_seat() and occupied == 0:
-        return "#"
-    elif own_seat.is_occupied_seat() and occupied >= seat_limit:
-        return "L"
-    else:
+SEATS = "L#"
+
+
+class Seating:
+    """ A seat layout and the index of each of its seats.
+
+    Holds what the helpers below used to read from module globals, so that several
+    layouts can be worked on at the same time.
+    """
+
+    def __init__(self, seat_map: Grid) -> None:
+        self.seat_map: Grid = seat_map
+        # The seats in reading order; the simulation refers to seats by their index here
+        self.seat_positions: List[Tuple[int, int]] = seat_map.positions(SEATS)
+        self.seat_index: np.ndarray = np.full(seat_map.shape, -1)
+        for index, position in enumerate(self.seat_positions):
+            self.seat_index[position] = index
+
+    # Part 1: All surrounding seats
+    def get_surrounding_seats(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """ Get seats that immediately neighbor the given coordinate. """
+        return [
+            position
+            for position in self.seat_map.neighbours((row, col), ALL_DIRECTIONS)
+            if self.seat_index[position] >= 0
+        ]
+
+    # Part 2: The first seat in each direction
+    def get_first_seat_in_direction(
+        self, row: int, col: int, direction: Tuple[int, int]
+    ) -> Optional[Tuple[int, int]]:
+        # Walks until the end of the map
+        for position in self.seat_map.walk((row, col), direction):
+            if self.seat_index[position] >= 0:
+                return position
         return None
 
+    def get_first_seats_in_each_direction(self, row: int, col: int) -> List[Tuple[int, int]]:
+        seats: List[Tuple[int, int]] = []
+        for direction in ALL_DIRECTIONS:
+            if seat := self.get_first_seat_in_direction(row, col, direction):
+                seats.append(seat)
+        return seats
 
-def simulate(seat_positions: Dict[int, List[int]], seat_limit: int) -> bool:
-    """ Simulate one round. Returns flag denoting if any change happened. """
-    global seat_map
+    def get_visible_seats(
+        self, seat_getter: Callable[[int, int], List[Tuple[int, int]]]
+    ) -> "np.ndarray":
+        """ Indices of the visible seats of each seat, padded with -1.
 
-    # We need a copy to not influence later seats with in-place modifications.
-    changes: List[Tuple[int, int, str]] = []
+        Index -1 is the last entry of the occupation array, a dummy seat that is never
+        occupied.
+        """
+        visible = np.full((len(self.seat_positions), len(ALL_DIRECTIONS)), -1)
+        for i, (row, col) in enumerate(self.seat_positions):
+            for j, seat in enumerate(seat_getter(row, col)):
+                visible[i, j] = self.seat_index[seat]
+        return visible
 
-    for i, js in seat_positions.items():
-        # change_occurred |= any([simulate_seat(seat_map_copy, row=i, col=j) for j in js])
-        for j in js:
-            if change := simulate_seat(row=i, col=j, seat_limit=seat_limit):
-                changes.append((i, j, change))
+    def occupation(self) -> "np.ndarray":
+        """ Whether each seat is occupied, plus the dummy seat at the end. """
+        occupied: np.ndarray = np.zeros(len(self.seat_positions) + 1, dtype=bool)
+        occupied[:-1] = self.seat_map.mask("#")[self.seat_map.mask(SEATS)]
+        return occupied
 
-    for i, j, new_state in changes:
-        seat_map[i][j].state = new_state
 
-    return len(changes) > 0
+@cached()
+def given() -> Seating:
+    return Seating(Grid.from_input(FILE_TO_READ))
 
 
-seat_positions: Dict[int, List[int]] = get_seat_positions(seat_map=seat_map)
+def simulate(occupied: "np.ndarray", visible: "np.ndarray", seat_limit: int) -> bool:
+    """ Simulate one round in place. Returns flag denoting if any change happened. """
+    # All seats change at once, so count with the old state before writing the new one
+    neighbours = occupied[visible].sum(axis=1)
+    seats = occupied[:-1]
+    new_state = np.where(seats, neighbours < seat_limit, neighbours == 0)
+    changed = not np.array_equal(new_state, seats)
+    seats[:] = new_state
+    return changed
 
-t2 = time.perf_counter()
 
-# Set visible seats
+def occupied_when_stable(
+    seating: Seating, visible_seats: "np.ndarray", seat_limit: int
+) -> int:
+    occupied: np.ndarray = seating.occupation()
+    while simulate(occupied, visible_seats, seat_limit=seat_limit):
+        pass
+    return int(occupied.sum())
 
-# Part 1: All surrounding seats
-def get_surrounding_seats(row: int, col: int) -> List[Tuple[int, int]]:
-    """ Get seats that immediately neighbor the given coordinate. """
-    min_row: int = max(0, row - 1)
-    min_col: int = max(0, col - 1)
-    max_row: int = min(row + 1, len(seat_map) - 1)
-    max_col: int = min(col + 1, len(seat_map[max_row]) - 1)
 
-    seats: List[Tuple[int, int]] = []
+def part_one(seating: Seating) -> int:
+    visible_seats = seating.get_visible_seats(seat_getter=seating.get_surrounding_seats)
+    return occupied_when_stable(seating, visible_seats, seat_limit=4)
 
-    for i in range(min_row, max_row + 1):
-        for j in range(min_col, max_col + 1):
-            if i == row and j == col:
-                continue
 
-            if seat_map[i][j].is_seat():
-                seats.append((i, j))
+def part_two(seating: Seating) -> int:
+    visible_seats = seating.get_visible_seats(
+        seat_getter=seating.get_first_seats_in_each_direction
+    )
+    return occupied_when_stable(seating, visible_seats, seat_limit=5)
 
-    return seats
 
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
 
-# Part 2: The first seat in each direction
-def get_first_seat_in_direction(
-    row: int, col: int, direction: Tuple[int, int]
-) -> Optional[Tuple[int, int]]:
-    global seat_map
-    r: int = row
-    c: int = col
-    while True:
-        r += direction[0]
-        c += direction[1]
-        # Reached the end of the map
-        if r < 0 or r >= len(seat_map) or c < 0 or c >= len(seat_map[r]):
-            return None
+    t0 = time.perf_counter()
 
-        if seat_map[r][c].is_seat():
-            return r, c
+    seat_map: Grid = Grid.from_input(FILE_TO_READ)
 
+    t1 = time.perf_counter()
 
-def get_first_seats_in_each_direction(row: int, col: int) -> List[Tuple[int, int]]:
-    seats: List[Tuple[int, int]] = []
-    for direction in [
-        (-1, -1),
-        (-1, 0),
-        (-1, 1),
-        (0, -1),
-        (0, 1),
-        (1, -1),
-        (1, 0),
-        (1, 1),
-    ]:
-        direction = cast(Tuple[int, int], direction)
-        if seat := get_first_seat_in_direction(row, col, direction):
-            seats.append(seat)
-    return seats
+    seating = Seating(seat_map)
 
+    t2 = time.perf_counter()
 
-def set_visible_seats(
-    seat_positions: Dict[int, List[int]],
-    seat_getter: Callable[[int, int], List[Tuple[int, int]]],
-):
-    global seat_map
-    for i, js in seat_positions.items():
-        for j in js:
-            seat_map[i][j].set_visible_seats(seat_getter(i, j))
+    visible_seats = seating.get_visible_seats(
+        seat_getter=seating.get_first_seats_in_each_direction
+    )
 
+    t3 = time.perf_counter()
 
-seat_limit: int
+    # One entry per seat plus the dummy seat
+    occupied: "np.ndarray" = seating.occupation()
 
-# Part 1
-# seat_limit = 4
-# set_visible_seats(seat_positions, seat_getter=get_surrounding_seats)
-# Part 2
-seat_limit = 5
-set_visible_seats(seat_positions, seat_getter=get_first_seats_in_each_direction)
-
-t3 = time.perf_counter()
+    while simulate(occupied, visible_seats, seat_limit=5):
+        pass
 
-while simulate(seat_positions, seat_limit=seat_limit):
-    pass
+    t4 = time.perf_counter()
 
-t4 = time.perf_counter()
-
-occupied_seats: int = sum(
-    [sum([p.is_occupied_seat() for p in row]) for row in seat_map]
-)
+    occupied_seats: int = int(occupied.sum())
 
-t5 = time.perf_counter()
+    t5 = time.perf_counter()
 
+    from util import quiet_broken_pipe, tf
 
-from util import tf
-
-print(
-    f"Part 2: Occupied seats = {occupied_seats}\n"
-    f"\n"
-    f"Parse file: {tf(t1-t0)}\n"
-    f"Get seat positions: {tf(t2-t1)}\n"
-    f"Get neighbors: {tf(t3-t2)}\n"
-    f"Simulate: {tf(t4-t3)}\n"
-    f"Count occupied seats: {tf(t5-t4)}\n"
-    f"=====\n"
-    f"Total: {tf(t5-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Part 2: Occupied seats = {occupied_seats}\n"
+            f"\n"
+            f"Parse file: {tf(t1-t0)}\n"
+            f"Get seat positions: {tf(t2-t1)}\n"
+            f"Get neighbors: {tf(t3-t2)}\n"
+            f"Simulate: {tf(t4-t3)}\n"
+            f"Count occupied seats: {tf(t5-t4)}\n"
+            f"=====\n"
+            f"Total: {tf(t5-t0)}"
+        )
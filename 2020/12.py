@@ -2,8 +2,14 @@ import re
 import sys
 import time
 from enum import Enum
+from pathlib import Path
 from typing import List, Tuple, Union, cast
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "12_input"
+
 # pylint: disable=unsubscriptable-object
 
 # Rain Risk
@@ -132,33 +138,25 @@ class Ship:
                 raise ValueError(f"More than 3 turns: {number_of_turns}")
 
 
-t0 = time.perf_counter()
-
-instructions: List[Instruction] = []
-
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        m = re.fullmatch(r"(\w)(\d+)\n", l)
-        if not m:
-            raise ValueError(f"Invalid line: {l}")
+@cached()
+def given() -> List[Instruction]:
+    instructions: List[Instruction] = []
 
-        ins: str
-        val_s: str
-        ins, val_s = m.groups()
-        val: int = int(val_s)
+    with open(FILE_TO_READ, "r") as f:
+        for l in f:
+            m = re.fullmatch(r"(\w)(\d+)\n?", l)
+            if not m:
+                raise ValueError(f"Invalid line: {l}")
 
-        instructions.append(Instruction(instruction_s=ins, value=val))
+            ins: str
+            val_s: str
+            ins, val_s = m.groups()
+            val: int = int(val_s)
 
-t1 = time.perf_counter()
+            instructions.append(Instruction(instruction_s=ins, value=val))
 
-# Ship: 0, 0; Waypoint: 1 north, 10 east
-ship_start: Ship = Ship(row=0, col=0, wp_row=-1, wp_col=10)
-ship: Ship = ship_start.copy()
+    return instructions
 
-for instruction in instructions:
-    ship.move(instruction)
-
-t2 = time.perf_counter()
 
 # Get Manhattan distance between original and final ship position
 
@@ -169,19 +167,42 @@ def manhattan_distance(start: Ship, end: Ship) -> int:
     return north_south + east_west
 
 
-md: int = manhattan_distance(ship_start, ship)
+def part_one(instructions: List[Instruction]):
+    return "NOT IMPLEMENTED"
+
+
+def part_two(instructions: List[Instruction]) -> int:
+    # Ship: 0, 0; Waypoint: 1 north, 10 east
+    ship_start: Ship = Ship(row=0, col=0, wp_row=-1, wp_col=10)
+    ship: Ship = ship_start.copy()
+
+    for instruction in instructions:
+        ship.move(instruction)
 
-t3 = time.perf_counter()
+    return manhattan_distance(ship_start, ship)
 
 
-from util import tf
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
 
-print(
-    f"Manhattan distance = {md}\n"
-    f"\n"
-    f"Parse file: {tf(t1-t0)}\n"
-    f"Move ship: {tf(t2-t1)}\n"
-    f"Calculate Manhattan distance: {tf(t3-t2)}\n"
-    f"=====\n"
-    f"Total: {tf(t3-t0)}"
-)
+    t0 = time.perf_counter()
+
+    instructions: List[Instruction] = given()
+
+    t1 = time.perf_counter()
+
+    md: int = part_two(instructions)
+
+    t2 = time.perf_counter()
+
+    from util import quiet_broken_pipe, tf
+
+    with quiet_broken_pipe():
+        print(
+            f"Manhattan distance = {md}\n"
+            f"\n"
+            f"Parse file: {tf(t1-t0)}\n"
+            f"Move ship and calculate Manhattan distance: {tf(t2-t1)}\n"
+            f"=====\n"
+            f"Total: {tf(t2-t0)}"
+        )
@@ -1,8 +1,14 @@
 import sys
 import time
 from itertools import count
+from pathlib import Path
 from typing import List, Tuple, Union
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "13_input"
+
 # pylint: disable=unsubscriptable-object
 
 # Shuttle Search
@@ -11,12 +17,13 @@ from typing import List, Tuple, Union
 # - Schedule based on timestamp = number of minutes since reference time
 # - Timestamp 0: Every bus departs
 
-t0 = time.perf_counter()
 
-with open(sys.argv[1], "r") as f:
-    lines: List[str] = [l[:-1] for l in f.readlines()]
 
-t1 = time.perf_counter()
+@cached()
+def given() -> List[str]:
+    with open(FILE_TO_READ, "r") as f:
+        return [l.rstrip("\n") for l in f.readlines()]
+
 
 # Part 1: (ID of earliest bus that we can take) * (number of minutes we need to wait for the bus)
 
@@ -32,22 +39,19 @@ def find_earliest_and_time(depart_time: int, buses: List[int]) -> Tuple[int, int
         current_time += 1
 
 
-earliest_bus_id: int
-time_to_wait: int
-earliest_bus_id, time_to_wait = find_earliest_and_time(
-    depart_time=int(lines[0]), buses=[int(b) for b in lines[1].split(",") if b != "x"]
-)
+def part_one(lines: List[str]) -> int:
+    earliest_bus_id: int
+    time_to_wait: int
+    earliest_bus_id, time_to_wait = find_earliest_and_time(
+        depart_time=int(lines[0]), buses=[int(b) for b in lines[1].split(",") if b != "x"]
+    )
+    return earliest_bus_id * time_to_wait
 
-t2 = time.perf_counter()
 
 # Part 2: Find earliest timestamp so that each tick the next bus from the list departs (x is empty)
 
-current_start: int = 0
-if len(sys.argv) > 2:
-    current_start = int(sys.argv[2])
 
-
-def get_buses_with_offsets() -> List[Tuple[int, int]]:
+def get_buses_with_offsets(lines: List[str]) -> List[Tuple[int, int]]:
     buses_and_skips: List[Union[int, str]] = [
         int(b) if b != "x" else b for b in lines[1].split(",")
     ]
@@ -55,13 +59,11 @@ def get_buses_with_offsets() -> List[Tuple[int, int]]:
     return [(int(b), i) for (i, b) in enumerate(buses_and_skips) if b != "x"]
 
 
-def find_first_valid_timestamp() -> int:
+def find_first_valid_timestamp(lines: List[str], current_start: int = 0) -> int:
     """ Naive solution (too slow!): Iterate through with a base step and check if all values match. """
 
-    global current_start
-
     buses_with_offsets: List[Tuple[int, int]] = sorted(
-        get_buses_with_offsets(),
+        get_buses_with_offsets(lines),
         key=lambda bi: bi[0],
         reverse=True,
     )
@@ -104,9 +106,9 @@ def get_cycle_offset(base: int, offset: int, step: int, find: int, f_off: int) -
     raise ValueError("Not found!")
 
 
-def iterate_cycles():
+def iterate_cycles(lines: List[str]) -> int:
     """ Find valid timestamp by finding common cycles and their offsets. """
-    buses_with_offsets: List[Tuple[int, int]] = get_buses_with_offsets()
+    buses_with_offsets: List[Tuple[int, int]] = get_buses_with_offsets(lines)
 
     base: int
     offset: float
@@ -124,21 +126,42 @@ def iterate_cycles():
     return int(result)
 
 
-first_valid_timestamp: int = int(iterate_cycles())
+def part_two(lines: List[str]) -> int:
+    return iterate_cycles(lines)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
 
-t3 = time.perf_counter()
+    t0 = time.perf_counter()
 
+    lines: List[str] = given()
 
-from util import tf
+    t1 = time.perf_counter()
 
-print(
-    f"Part 1: {earliest_bus_id * time_to_wait}\n"
-    f" (Earliest bus: {earliest_bus_id}, wait time: {time_to_wait}\n"
-    f"Part 2: {first_valid_timestamp}\n"
-    f"\n"
-    f"Parse file: {tf(t1-t0)}\n"
-    f"Part 1: Find earliest and time: {tf(t2-t1)}\n"
-    f"Part 2: Find earliest valid timestamp: {tf(t3-t2)}\n"
-    f"=====\n"
-    f"Total: {tf(t3-t0)}"
-)
+    earliest_bus_id: int
+    time_to_wait: int
+    earliest_bus_id, time_to_wait = find_earliest_and_time(
+        depart_time=int(lines[0]), buses=[int(b) for b in lines[1].split(",") if b != "x"]
+    )
+
+    t2 = time.perf_counter()
+
+    first_valid_timestamp: int = part_two(lines)
+
+    t3 = time.perf_counter()
+
+    from util import quiet_broken_pipe, tf
+
+    with quiet_broken_pipe():
+        print(
+            f"Part 1: {earliest_bus_id * time_to_wait}\n"
+            f" (Earliest bus: {earliest_bus_id}, wait time: {time_to_wait}\n"
+            f"Part 2: {first_valid_timestamp}\n"
+            f"\n"
+            f"Parse file: {tf(t1-t0)}\n"
+            f"Part 1: Find earliest and time: {tf(t2-t1)}\n"
+            f"Part 2: Find earliest valid timestamp: {tf(t3-t2)}\n"
+            f"=====\n"
+            f"Total: {tf(t3-t0)}"
+        )
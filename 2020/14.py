@@ -2,8 +2,14 @@ import re
 import sys
 import time
 from collections import Counter
+from pathlib import Path
 from typing import Dict, List, Tuple, Union, cast
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
+FILE_TO_READ = "14_input"
+
 # pylint: disable=unsubscriptable-object
 
 # Docking Data
@@ -16,26 +22,30 @@ from typing import Dict, List, Tuple, Union, cast
 #       + 36-length string, Big Endian (most significant first)
 #       + X = do nothing, 1/0 = overwrite
 
-t0 = time.perf_counter()
+Command = Union[str, Tuple[int, int]]
+
 
-commands: List[Union[str, Tuple[int, int]]] = []
+@cached()
+def given() -> List[Command]:
+    commands: List[Command] = []
 
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        if l.startswith("mask"):
-            commands.append(l[7:-1])
-            continue
+    with open(FILE_TO_READ, "r") as f:
+        for l in f:
+            l = l.rstrip("\n")
+            if l.startswith("mask"):
+                commands.append(l[7:])
+                continue
 
-        m = re.fullmatch(r"mem\[(\d+)\] = (\d+)\n", l)
-        if not m:
-            raise ValueError()
+            m = re.fullmatch(r"mem\[(\d+)\] = (\d+)", l)
+            if not m:
+                raise ValueError()
 
-        address: int
-        value: int
-        address, value = [int(x) for x in m.groups()]
-        commands.append((address, value))
+            address: int
+            value: int
+            address, value = [int(x) for x in m.groups()]
+            commands.append((address, value))
 
-t1 = time.perf_counter()
+    return commands
 
 
 class Memory:
@@ -125,9 +135,7 @@ class MemoryPt2(Memory):
             self.container[target] = value
 
 
-def execute_instructions(
-    memory: Memory, commands: List[Union[str, Tuple[int, int]]]
-) -> int:
+def execute_instructions(memory: Memory, commands: List[Command]) -> int:
     for command in commands:
         if isinstance(command, str):
             command = cast(str, command)
@@ -141,28 +149,41 @@ def execute_instructions(
     return memory.sum()
 
 
-# Part 1:
-memory1: Memory = MemoryPt1()
-mem_sum_1: int = execute_instructions(memory=memory1, commands=commands)
+def part_one(commands: List[Command]) -> int:
+    return execute_instructions(memory=MemoryPt1(), commands=commands)
+
+
+def part_two(commands: List[Command]) -> int:
+    return execute_instructions(memory=MemoryPt2(), commands=commands)
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    commands: List[Command] = given()
+
+    t1 = time.perf_counter()
 
-t2 = time.perf_counter()
+    mem_sum_1: int = part_one(commands)
 
-# Part 2:
-memory2: Memory = MemoryPt2()
-mem_sum_2: int = execute_instructions(memory=memory2, commands=commands)
+    t2 = time.perf_counter()
 
-t3 = time.perf_counter()
+    mem_sum_2: int = part_two(commands)
 
+    t3 = time.perf_counter()
 
-from util import tf
+    from util import quiet_broken_pipe, tf
 
-print(
-    f"Part 1: Sum = {mem_sum_1}\n"
-    f"Part 2: Sum = {mem_sum_2}\n"
-    f"\n"
-    f"Parse file: {tf(t1-t0)}\n"
-    f"Part 1: Calculate sum: {tf(t2-t1)}\n"
-    f"Part 2: Calculate sum: {tf(t3-t2)}\n"
-    f"=====\n"
-    f"Total: {tf(t3-t0)}"
-)
+    with quiet_broken_pipe():
+        print(
+            f"Part 1: Sum = {mem_sum_1}\n"
+            f"Part 2: Sum = {mem_sum_2}\n"
+            f"\n"
+            f"Parse file: {tf(t1-t0)}\n"
+            f"Part 1: Calculate sum: {tf(t2-t1)}\n"
+            f"Part 2: Calculate sum: {tf(t3-t2)}\n"
+            f"=====\n"
+            f"Total: {tf(t3-t0)}"
+        )
@@ -1,6 +1,14 @@
+import re
 import sys
 import time
-from typing import List, Tuple, overload
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.intervals import IntervalSet
+
+FILE_TO_READ = "16_input"
 
 # Ticket Translation
 #
@@ -22,23 +30,30 @@ class Ticket:
 
 
 class Rule:
-    def __init__(self, field_name: str, valid_ranges: List[Tuple[int, int]]) -> None:
+    def __init__(self, field_name: str, valid_ranges: IntervalSet) -> None:
         self.field_name: str = field_name
-        # TODO IDEAS: Merge ranges, store all valid values (lookup with "in"), ...
-        self.valid_ranges: List[Tuple[int, int]] = valid_ranges
+        # Merged, so that a lookup is a binary search over few ranges
+        self.valid_ranges: IntervalSet = valid_ranges
 
-    @overload
     def is_valid(self, value: int) -> bool:
-        raise NotImplementedError()
-
-    @overload
-    def is_valid(self, ticket: Ticket) -> bool:
-        raise NotImplementedError()
+        return value in self.valid_ranges
 
     @staticmethod
     def from_string(rule_string):
         # type: (str) -> Rule
-        raise NotImplementedError()
+        field_name, ranges = rule_string.split(": ")
+        # Bounds are inclusive: "1-3" is range(1, 4)
+        valid_ranges = IntervalSet(
+            range(int(a), int(b) + 1) for a, b in re.findall(r"(\d+)-(\d+)", ranges)
+        )
+        return Rule(field_name, valid_ranges)
+
+
+class Notes:
+    def __init__(self, rules: List[Rule], own_ticket: Ticket, nearby_tickets: List[Ticket]) -> None:
+        self.rules = rules
+        self.own_ticket = own_ticket
+        self.nearby_tickets = nearby_tickets
 
 
 # Parsing:
@@ -46,18 +61,59 @@ class Rule:
 # 2. Get own ticket
 # 3. Get other tickets
 
-t0 = time.perf_counter()
 
-rules_parsed: bool = False
-own_ticket_parsed: bool = False
+@cached()
+def given() -> Notes:
+    with open(FILE_TO_READ, "r") as f:
+        rule_block, own_block, nearby_block = f.read().strip().split("\n\n")
+
+    rules: List[Rule] = [Rule.from_string(l) for l in rule_block.split("\n")]
+    own_ticket: Ticket = Ticket([int(v) for v in own_block.split("\n")[1].split(",")])
+    nearby_tickets: List[Ticket] = [
+        Ticket([int(v) for v in l.split(",")]) for l in nearby_block.split("\n")[1:]
+    ]
+    return Notes(rules, own_ticket, nearby_tickets)
+
+
+# 4. Sum up the values that no rule allows. All rules together are one more union.
+
+
+def part_one(notes: Notes) -> int:
+    valid_for_any: IntervalSet = IntervalSet()
+    for rule in notes.rules:
+        valid_for_any |= rule.valid_ranges
+
+    return sum(
+        value
+        for ticket in notes.nearby_tickets
+        for value in ticket.values
+        if value not in valid_for_any
+    )
+
+
+def part_two(notes: Notes):
+    return "NOT IMPLEMENTED"
+
+
+if __name__ == "__main__":
+    FILE_TO_READ = sys.argv[1]
+
+    t0 = time.perf_counter()
+
+    notes: Notes = given()
+
+    t1 = time.perf_counter()
+
+    error_rate: int = part_one(notes)
 
-rules: List[Rule] = []
+    t2 = time.perf_counter()
 
-with open(sys.argv[1], "r") as f:
-    for l in f:
-        if not rules_parsed:
-            if l == "\n":
-                rules_parsed = True
-                continue
+    from util import quiet_broken_pipe, tf
 
-        pass
+    with quiet_broken_pipe():
+        print(
+            f"Ticket scanning error rate: {error_rate}\n\n"
+            f"Parse: {tf(t1-t0)}\n"
+            f"Find invalid values: {tf(t2-t1)}\n"
+            f"Total: {tf(t2-t0)}"
+        )
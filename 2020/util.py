@@ -1 +1,7 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.util import quiet_broken_pipe
+
 tf = lambda x: f"{round(x*1000, 5)} ms"
@@ -1,10 +1,46 @@
 """ Advent of Code 2023: Day 1 """
 
+FILE_TO_READ = "01_input"
+
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.automaton import Automaton
+from advent.cache import cached
+from advent.loader import read_input
+from advent.util import alternative, lazy_import
+
+np = lazy_import("numpy")
+
+@cached()
+def given():
+	return list(read_input(FILE_TO_READ).lines())
 
 # --- Part One --- #
 
-def part_one(given):
+def part_one():
+	# The whole input as one byte array, reduced to its newlines and ASCII digits in
+	# order: a digit after a newline (or at the start) is the first on its line, one
+	# before a newline (or at the end) the last
+	data = np.frombuffer(read_input(FILE_TO_READ).data, dtype=np.uint8)
+	marks = np.compress((data == ord("\n")) | ((data >= ord("0")) & (data <= ord("9"))), data)
+	is_digit = marks != ord("\n")
+	follows_newline = np.concatenate(([True], ~is_digit[:-1]))
+	precedes_newline = np.concatenate((~is_digit[1:], [True]))
+	first_digits = marks[is_digit & follows_newline]
+	last_digits = marks[is_digit & precedes_newline]
+	lines = len(marks) - np.count_nonzero(is_digit) + (len(data) > 0 and data[-1] != ord("\n"))
+	if len(first_digits) != lines:
+		raise ValueError("Not every line has a digit")
+	return int(
+		10 * (first_digits.sum(dtype=np.int64) - ord("0") * lines)
+		+ last_digits.sum(dtype=np.int64) - ord("0") * lines
+	)
+
+@alternative("part_one")
+def part_one_regex(given):
 	summed_calibration_values = 0
 	for l in given:
 		digits = re.findall(r"\d", l)
@@ -14,9 +50,6 @@ def part_one(given):
 
 # --- Part Two --- #
 
-def reverse_string(string):
-	return "".join(reversed(string))
-
 digit_map = {
 	"one": 1,
 	"two": 2,
@@ -29,31 +62,21 @@ digit_map = {
 	"nine": 9,
 }
 
-def convert_digit(string):
-	try:
-		return int(string)
-	except ValueError:
-		return digit_map[string]
+# Digits and spelled-out digits, found in one pass even where they overlap ("oneight")
+digit_words = Automaton(
+	{word.encode(): value for word, value in digit_map.items()}
+	| {str(value).encode(): value for value in digit_map.values()}
+)
 
-def part_two(given):
+def part_two():
+	# Streamed straight from the mapped file, so the input need not fit in memory as lines
 	summed_calibration_values = 0
-	for l in given:
-		# pattern in form of (\d|one|...)
-		dig_pattern = r"(\d|" + "|".join(digit_map.keys()) + ")"
-		first_digit = re.search(dig_pattern, l).group(1)
-		# to find the last, we search from the back
-		# "reversed" pattern in form of (\d|eno|...)
-		rev_pattern = r"(\d|" + "|".join(map(reverse_string, digit_map.keys())) + ")"
-		last_digit = reverse_string(re.search(rev_pattern, reverse_string(l)).group(1))
-
-		calibration_value = convert_digit(first_digit) * 10 + convert_digit(last_digit)
-		summed_calibration_values += calibration_value
+	for first_digit, last_digit in digit_words.first_and_last(read_input(FILE_TO_READ).chunks()):
+		summed_calibration_values += first_digit * 10 + last_digit
 	return summed_calibration_values
 
 # --- Main Program --- #
 
-with open("01_input", encoding="utf-8") as fh:
-	given = [l.rstrip() for l in fh.readlines()]
-
-print(f"Part One: {part_one(given)}")
-print(f"Part Two: {part_two(given)}")
+if __name__ == "__main__":
+	print(f"Part One: {part_one()}")
+	print(f"Part Two: {part_two()}")
@@ -3,36 +3,63 @@
 FILE_TO_READ = "02_input"
 
 import re
+import sys
+from pathlib import Path
 
-def parse_line(line: str) -> tuple[int, dict[str, int]]:
-	"""Transform line to (<id>, (# red, # green, # blue)) tuple."""
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
+from advent.util import lazy_import
+
+np = lazy_import("numpy")
+
+COLORS = ("red", "green", "blue")
+# Columns of the game table
+GAME_ID, RED, GREEN, BLUE = range(4)
+
+# Either the start of a game or one shown group of cubes, e.g. "Game 1" or "4 red"
+TOKEN = re.compile(rb"Game (\d+)|(\d+) (red|green|blue)")
+
+def parse_games(data) -> "np.ndarray":
+	"""Table with one (<id>, <max red>, <max green>, <max blue>) row per game."""
 
 	# Given, e.g.: "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green"
-	match = re.fullmatch(r"Game (\d+): (.*)\n", line)
-	game_id = int(match.group(1))
-	games = match.group(2)
-
-	max_shown: dict[str, int] = {
-		"red": 0,
-		"green": 0,
-		"blue": 0,
-	}
-
-	# `games` is, e.g.: "3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green"
-	for game in games.split("; "):
-		# `shown` is, e.g.: "4 red"
-		for shown in game.split(", "):
-			match = re.fullmatch(r"(\d+) (\w+)", shown)
-			count = int(match.group(1))
-			name = match.group(2)
-			max_shown[name] = max(max_shown[name], count)
-
-	return (game_id, max_shown)
-
-def given():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		for line in given_file:
-			yield parse_line(line)
+	rows: list[list[int]] = []
+	columns = {color.encode(): column for column, color in enumerate(COLORS, RED)}
+	for match in TOKEN.finditer(data):
+		game_id, count, color = match.groups()
+		if game_id is not None:
+			rows.append([int(game_id), 0, 0, 0])
+			continue
+		row, column = rows[-1], columns[color]
+		row[column] = max(row[column], int(count))
+	return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+@cached()
+def given() -> "np.ndarray":
+	return parse_games(read_input(FILE_TO_READ).data)
+
+def possible_games(games: "np.ndarray", bags: "np.ndarray") -> "np.ndarray":
+	"""For each bag of (# red, # green, # blue) cubes, which games it allows.
+
+	Returns a (bags, games) boolean matrix; all bags are checked at once.
+	"""
+	bags = np.asarray(bags).reshape(-1, 3)
+	possible = np.ones((len(bags), len(games)), dtype=bool)
+	for column in (RED, GREEN, BLUE):
+		possible &= games[:, column] <= bags[:, column - RED, np.newaxis]
+	return possible
+
+def sum_of_possible_ids(games: "np.ndarray", bags: "np.ndarray") -> "np.ndarray":
+	"""For each bag, the sum of the IDs of the games it allows."""
+	bags = np.asarray(bags).reshape(-1, 3)
+	# In blocks of bags, so that the matrix of possible games stays small
+	block = max(1, 2**20 // max(1, len(games)))
+	sums = [
+		possible_games(games, bags[i : i + block]) @ games[:, GAME_ID]
+		for i in range(0, len(bags), block)
+	]
+	return np.concatenate(sums) if sums else np.zeros(0, dtype=np.int64)
 
 # --- Part One --- #
 
@@ -46,15 +73,8 @@ max_possible: dict[str, int] = {
 }
 
 def part_one():
-	sum_of_ids: int = 0
-	for game_id, max_shown in given():
-		valid = True
-		for name, count in max_possible.items():
-			if max_shown[name] > count:
-				valid = False
-		if valid:
-			sum_of_ids += game_id
-	return sum_of_ids
+	bag = [max_possible[color] for color in COLORS]
+	return int(sum_of_possible_ids(given(), bag)[0])
 
 # --- Part Two --- #
 
@@ -62,10 +82,7 @@ def part_one():
 # What is the sum of the power (multiplied minimums) for the sets?
 
 def part_two():
-	sum_of_powers: int = 0
-	for game_id, max_shown in given():
-		sum_of_powers += max_shown["red"] * max_shown["green"] * max_shown["blue"]
-	return sum_of_powers
+	return int(np.prod(given()[:, RED:], axis=1).sum())
 
 # --- Main Program --- #
 
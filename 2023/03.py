@@ -2,98 +2,107 @@
 
 FILE_TO_READ = "03_input"
 
-import re
-import itertools
-
-def given():
-	matrix = []
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		for line in given_file:
-			matrix.append(list(line.rstrip("\n")))
-
-	# Make our life easy by adding a context line to the first and last line
-	empty_line = ["."] * len(matrix[0])
-	matrix.insert(0, empty_line)
-	matrix.append(empty_line)
-	return matrix
-
-def iterate_matrix(matrix) -> list[list[str]]:
-	# Check each line plus its context (except for the first and last, because we added those ourselves)
-	for i in range(1, len(matrix) - 1):
-		# Get "context" (line and adjacent lines)
-		full_context = matrix[i-1 : i+2]  # inclusive : exclusive
-		current_line = "".join(full_context[1])
-		yield (full_context, current_line)
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.grid import Grid
+from advent.util import lazy_import
+
+np = lazy_import("numpy")
+
+DIGITS = "0123456789"
+
+@dataclass
+class Schematic:
+	"""The schematic's numbers, indexed by the cells they cover.
+
+	Numbers have IDs 1, 2, ... in reading order. Which numbers touch a cell (are on
+	it or on one of its eight neighbours) is a lookup in the 3x3 window around it.
+	"""
+
+	grid: Grid
+	# For every cell, the ID of the number it is part of (0 for none), with a border of
+	# 0s around the grid so that every cell has a full window
+	index: "np.ndarray"
+	# The value of each number by ID, with a 0 for "no number" at index 0
+	values: "np.ndarray"
+
+	@classmethod
+	def from_grid(cls, grid: Grid):
+		labels, _, starts, stops = Grid.label_runs(grid.mask(DIGITS))
+		# Each digit times its place value, in reading order; a number's digits are adjacent
+		rows, cols = np.nonzero(labels)
+		ids = labels[rows, cols]
+		place_values = 10 ** (stops[ids - 1] - 1 - cols)
+		digits = (grid.cells[rows, cols] - ord("0")) * place_values
+		values = np.zeros(len(starts) + 1, dtype=np.int64)
+		if len(starts):
+			offsets = np.concatenate(([0], np.cumsum(stops - starts)[:-1]))
+			values[1:] = np.add.reduceat(digits, offsets)
+		return cls(grid, np.pad(labels, 1), values)
+
+	@property
+	def labels(self) -> "np.ndarray":
+		"""For every cell, the ID of the number it is part of (0 for none)."""
+		return self.index[1:-1, 1:-1]
+
+	def symbols(self) -> "np.ndarray":
+		"""Everything except for digits and "." is a symbol."""
+		return ~self.grid.mask("." + DIGITS)
+
+	def touching(self, row: int, col: int) -> list[int]:
+		"""The IDs of the numbers touching cell (row, col)."""
+		window = self.index[row : row + 3, col : col + 3]
+		return sorted(set(window[window > 0].tolist()))
+
+	def touching_cells(self, positions: "np.ndarray") -> "np.ndarray":
+		"""The IDs of the numbers touching each of the (row, col) `positions`.
+
+		One sorted row of nine per position, in which repeats and empty cells are 0,
+		so that `np.count_nonzero(..., axis=1)` counts the numbers.
+		"""
+		positions = np.asarray(positions).reshape(-1, 2)
+		rows = positions[:, 0, np.newaxis] + np.repeat(np.arange(3), 3)
+		cols = positions[:, 1, np.newaxis] + np.tile(np.arange(3), 3)
+		window = np.sort(self.index[rows, cols], axis=1)
+		window[:, 1:][window[:, 1:] == window[:, :-1]] = 0
+		return window
+
+	def at_symbols(self, chars: str) -> tuple["np.ndarray", "np.ndarray"]:
+		"""The positions of all cells holding one of `chars`, and the numbers touching each
+		(as from `touching_cells`). Several kinds of symbols take one pass over the grid."""
+		positions = np.argwhere(self.grid.mask(chars))
+		return positions, self.touching_cells(positions)
+
+@cached(version=2)
+def given() -> Schematic:
+	return Schematic.from_grid(Grid.from_input(FILE_TO_READ))
 
 # --- Part One --- #
 
 # Any number adjacent to a symbol (except for ".") is a "part number".
 # What is the sum of all part numbers in the engine schematic?
 
-def check_digit(full_context, current_line, start, end) -> int:
-	"""Return part number if digit is adjacent to symbol. Otherwise, return 0."""
-	context_start = max(0, start - 1)  # start is inclusive
-	context_end = min(len(current_line), end)  # end is exclusive
-	digit_context = [
-		fc[context_start : context_end + 1] for fc in full_context
-	]
-	for char in itertools.chain.from_iterable(digit_context):
-		if char != "." and not re.match(r"\d", char):
-			return int(current_line[start : end])
-	return 0
-
 def part_one():
-	matrix = given()
-	sum_of_part_numbers: int = 0
-
-	for full_context, current_line in iterate_matrix(matrix):
-		# Get positions of all continuous numbers
-		digit_positions = []
-		for match in re.finditer(r"\d+", current_line):  # matches are greedy
-			digit_positions.append(match.span())
-
-		# Check surroundings of each number
-		for start, end in digit_positions:
-			sum_of_part_numbers += check_digit(full_context, current_line, start, end)
-
-	return sum_of_part_numbers
+	schematic = given()
+	# Numbers with a digit on a symbol's cell or next to it, each counted once
+	touched = np.unique(schematic.labels[Grid.dilated(schematic.symbols())])
+	return int(schematic.values[touched].sum())
 
 # --- Part Two --- #
 
 # Any star ("*") adjacent to exactly two part numbers is a "gear". Its gear ratio is the multiple of the part numbers.
 # What is the sum of all the gear ratios?
 
-def check_star(full_context: list[list[str]], position: int):
-	# Collect adjacent numbers
-	adjacent_part_numbers: list[int] = []
-	for line in full_context:
-		line_str = "".join(line)
-		for match in re.finditer(r"\d+", line_str):
-			start, end = match.span()
-			# Adjacent if the span is adjacent to `position`
-			if position in range(start - 1, end + 1):
-				adjacent_part_numbers.append(int(line_str[start : end]))
-
-	if len(adjacent_part_numbers) == 2:
-		return adjacent_part_numbers[0] * adjacent_part_numbers[1]
-
-	return 0
-
-
 def part_two():
-	matrix = given()
-	sum_of_gear_ratios: int = 0
-
-	for full_context, current_line in iterate_matrix(matrix):
-		# Get positions of all star symbols
-		star_positions = []
-		for match in re.finditer(r"\*", current_line):
-			star_positions.append(match.span()[0])
-
-		# Check surroundings of each star
-		for position in star_positions:
-			sum_of_gear_ratios += check_star(full_context, position)
-	return sum_of_gear_ratios
+	schematic = given()
+	_, touching = schematic.at_symbols("*")
+	gears = touching[np.count_nonzero(touching, axis=1) == 2]
+	ratios = np.where(gears > 0, schematic.values[gears], 1).prod(axis=1)
+	return int(ratios.sum())
 
 
 # --- Main Program --- #
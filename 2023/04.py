@@ -3,6 +3,12 @@
 FILE_TO_READ = "04_input"
 
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 def to_int(nums: str) -> list[int]:
 	nums = re.sub(" +", " ", nums.strip())
@@ -14,10 +20,10 @@ def parse_line(line: str):
 	winning_numbers, my_numbers = line_match.group(2).split(" | ")
 	return card_number, to_int(winning_numbers), to_int(my_numbers)
 
+@cached()
 def given():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		for line in given_file:
-			yield parse_line(line.rstrip("\n"))
+	for line in read_input(FILE_TO_READ).lines():
+		yield parse_line(line)
 
 def my_winners(winning_numbers: list[int], my_numbers: list[int]) -> list[int]:
 	return [my for my in my_numbers if my in winning_numbers]
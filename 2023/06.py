@@ -4,6 +4,12 @@ FILE_TO_READ = "06_input"
 
 import itertools
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 # Races are limited in time.
 # Boats have a button that charges the speed, but the time of the race passes.
@@ -46,9 +52,9 @@ def process_number_table(line: str) -> list[int]:
 	line_normalized = re.sub(" +", " ", line.strip())
 	return [int(value) for value in line_normalized.split(" ")]
 
+@cached()
 def given_one():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		lines = [l.rstrip("\n") for l in given_file.readlines()]
+	lines = list(read_input(FILE_TO_READ).lines())
 	times = process_number_table(lines[0])
 	distances = process_number_table(lines[1])
 	races = []
@@ -109,9 +115,9 @@ def process_number_line(line: str) -> list[int]:
 	line_normalized = re.sub(" +", "", line.strip())
 	return int(line_normalized)
 
+@cached()
 def given_two():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		lines = [l.rstrip("\n") for l in given_file.readlines()]
+	lines = list(read_input(FILE_TO_READ).lines())
 	time = process_number_line(lines[0])
 	distance = process_number_line(lines[1])
 	return Race(time, distance)
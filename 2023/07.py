@@ -16,8 +16,15 @@ FILE_TO_READ = "07_input"
 
 import re
 from collections import Counter
+from dataclasses import dataclass
 from enum import Enum
-from functools import total_ordering
+import sys
+from pathlib import Path
+from typing import Callable
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 # --- Shared Classes --- #
 
@@ -33,26 +40,16 @@ class HandType(Enum):
 	def __gt__(self, other):
 		return self.value > other.value
 
-@total_ordering
 class Card:
-	VALUES = None
+	# How strong a card is depends on the part; see `Rules`
 
 	def __init__(self, label: str):
 		self.label = label
 
-	@property
-	def value(self):
-		return Card.VALUES[self.label]
-	
-	def __gt__(self, other) -> bool:
-		if not hasattr(other, "label"):
-			return NotImplemented
-		return self.value > other.value
-
 	def __eq__(self, other) -> bool:
 		if not hasattr(other, "label"):
 			return NotImplemented
-		return self.value == other.value
+		return self.label == other.label
 
 	def __hash__(self) -> str:
 		return hash(self.label)
@@ -69,34 +66,36 @@ class Play:
 		self.hand: list[Card] = [Card(c) for c in hand]
 		self.bid: int = int(bid)
 
-	def __gt__(self, other) -> bool:
-		if not isinstance(other, Play):
-			return NotImplemented
+	def __repr__(self) -> str:
+		return f"Play({self.hand!r}, {self.bid!r})"
 
-		if self.hand_type() != other.hand_type():
-			return self.hand_type() > other.hand_type()
+@dataclass(frozen=True)
+class Rules:
+	"""How one part of the puzzle values cards and hands.
 
-		for ours, theirs in zip(self.hand, other.hand):
-			if ours == theirs:
-				continue
-			return ours > theirs
+	Passed along instead of set on `Card` and `Play`, so that both parts can be
+	solved at the same time.
+	"""
+	values: dict[str, int]
+	hand_type: Callable[[Play], HandType]
 
-	def __repr__(self) -> str:
-		return f"Play({self.hand!r}, {self.bid!r})"
+	def strength(self, play: Play) -> tuple[int, ...]:
+		"""Sort key: the hand type first, then the cards one by one."""
+		return (self.hand_type(play).value, *(self.values[card.label] for card in play.hand))
 
 # --- Shared Functions --- #
 
 def parse_line(line: str) -> Play:
 	return Play(*line.split(" "))
 
+@cached()
 def given():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		for line in given_file:
-			yield parse_line(line.rstrip("\n"))
+	for line in read_input(FILE_TO_READ).lines():
+		yield parse_line(line)
 
-def calculate_winnings() -> int:
+def calculate_winnings(rules: Rules) -> int:
 	total_winnings: int = 0
-	for rank, play in enumerate(sorted(given()), start=1):
+	for rank, play in enumerate(sorted(given(), key=rules.strength), start=1):
 		total_winnings += rank * play.bid
 	return total_winnings
 
@@ -134,10 +133,10 @@ def hand_type_one(play: Play) -> HandType:
 		case _:
 			return HandType.HIGH_CARD
 
+RULES_ONE = Rules(VALUES_ONE, hand_type_one)
+
 def part_one():
-	Card.VALUES = VALUES_ONE
-	Play.hand_type = hand_type_one
-	return calculate_winnings()
+	return calculate_winnings(RULES_ONE)
 
 # --- Part Two --- #
 
@@ -199,10 +198,10 @@ def hand_type_two(play: Play) -> HandType:
 	}[joker_count][base_type]
 
 
+RULES_TWO = Rules(VALUES_TWO, hand_type_two)
+
 def part_two():
-	Card.VALUES = VALUES_TWO
-	Play.hand_type = hand_type_two
-	return calculate_winnings()
+	return calculate_winnings(RULES_TWO)
 
 # --- Main Program --- #
 
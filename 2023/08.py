@@ -4,7 +4,16 @@ FILE_TO_READ = "08_input"
 
 import re
 import itertools
+import math
 from dataclasses import dataclass, field
+import sys
+from pathlib import Path
+from typing import Iterator
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.cycles import History, find_cycle
+from advent.loader import read_input
 
 
 @dataclass
@@ -28,9 +37,9 @@ def parse_node(line: str) -> Node:
     return Node(match.group(1), match.group(2), match.group(3))
 
 
+@cached()
 def given() -> tuple[str, dict[str, Node]]:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        lines = [l.rstrip("\n") for l in given_file.readlines()]
+    lines = list(read_input(FILE_TO_READ).lines())
     instructions = lines[0]
     node_dict = {n.name: n for n in [parse_node(l) for l in lines[2:]]}
     return instructions, node_dict
@@ -62,7 +71,10 @@ def part_one():
 #  - That means we start again at the first instructions repeatedly.
 #  - We can precompute for each node for which steps in the instructions, starting from the first, it would reach a Z node.
 #  - In addition, we can precompute the node we would arrive at after completing one round of instructions.
-#  - Then we can only compare those sets for all current nodes => if they do not match, we can skip over all instructions
+#  - Each ghost on its own soon starts a round of instructions at a node it started one at before. From then on
+#    it repeats the same rounds, so its Z steps repeat, too: find that cycle of rounds.
+#  - Steps before all ghosts repeat are checked one by one. After that, the Chinese remainder theorem combines
+#    the repeating Z steps of all ghosts into the steps at which all of them are at a Z node.
 
 
 @dataclass
@@ -131,20 +143,46 @@ def jump_table(
     return nj_table
 
 
-def check_jump_intersection(current_nji: list[JumpableNode]) -> set[int]:
-    """Return the intersection of the number of steps in the instruction set to arrive
-    at a Z node for all current nodes."""
-    completion_steps: set[int] = current_nji[0].z_node_steps
-    for other in current_nji[1:]:
-        completion_steps = completion_steps.intersection(other.z_node_steps)
-        if not completion_steps:  # cancel early if no more steps remain-
-            return set()
-    return completion_steps
-
-
-def skip_to_end(current: list[JumpableNode]) -> list[JumpableNode]:
-    """Return a list of all end nodes of the given node list."""
-    return [jumpable.end_node for jumpable in current]
+@dataclass
+class Ghost:
+    # The nodes the ghost starts each round of instructions at, until they repeat
+    rounds: History[JumpableNode]
+    instructions_count: int
+
+    @property
+    def repeating_from(self) -> int:
+        return self.rounds.cycle.offset * self.instructions_count
+
+    @property
+    def period(self) -> int:
+        return self.rounds.cycle.period * self.instructions_count
+
+    def at_z_node(self, step: int) -> bool:
+        round_, round_step = divmod(step, self.instructions_count)
+        return round_step in self.rounds.state(round_).z_node_steps
+
+    def z_node_steps(self, rounds: range) -> Iterator[int]:
+        for round_ in rounds:
+            for z_step in sorted(self.rounds.state(round_).z_node_steps):
+                yield round_ * self.instructions_count + z_step
+
+
+def combine_residues(
+    residues: set[int], modulus: int, other_residues: set[int], other_modulus: int
+) -> tuple[set[int], int]:
+    """Return the steps that are in both sets of residues, modulo both moduli."""
+    gcd = math.gcd(modulus, other_modulus)
+    combined_modulus = modulus // gcd * other_modulus
+    # a + k * modulus == b (mod other_modulus), solved for k
+    inverse = pow(modulus // gcd, -1, other_modulus // gcd)
+    combined = set()
+    for a in residues:
+        for b in other_residues:
+            if (b - a) % gcd:
+                continue  # never at the same step
+            k = (b - a) // gcd * inverse % (other_modulus // gcd)
+            combined.add((a + k * modulus) % combined_modulus)
+    return combined, combined_modulus
 
 
 def part_two():
@@ -152,41 +190,34 @@ def part_two():
     nj_table = jump_table(instructions, node_dict)
     instructions_count = len(instructions)
 
-    all_current: list[JumpableNode] = list(
-        filter(lambda n: n.name.endswith("A"), nj_table.values())
+    ghosts = [
+        Ghost(find_cycle(node, lambda n: n.end_node, key=lambda n: n.name), instructions_count)
+        for node in nj_table.values()
+        if node.name.endswith("A")
+    ]
+    repeating_from = max(ghost.repeating_from for ghost in ghosts)
+
+    # 1) Before all ghosts repeat: check the first ghost's Z steps on all others
+    first_rounds = range(math.ceil(repeating_from / instructions_count))
+    for steps in ghosts[0].z_node_steps(first_rounds):
+        if steps < repeating_from and all(ghost.at_z_node(steps) for ghost in ghosts):
+            return steps
+
+    # 2) Afterwards, each ghost is at a Z node at fixed residues modulo its period
+    residues, modulus = {0}, 1
+    for ghost in ghosts:
+        cycle = ghost.rounds.cycle
+        cycle_rounds = range(cycle.offset, cycle.offset + cycle.period)
+        ghost_residues = {steps % ghost.period for steps in ghost.z_node_steps(cycle_rounds)}
+        residues, modulus = combine_residues(residues, modulus, ghost_residues, ghost.period)
+    if not residues:
+        raise ValueError("The ghosts are never at Z nodes at the same time")
+
+    # 3) The first such step after all ghosts repeat
+    return min(
+        residue + max(0, math.ceil((repeating_from - residue) / modulus)) * modulus
+        for residue in residues
     )
-    steps = 0
-    while True:
-        # 1) First, check if we found a terminating path and return the shortest one
-        if completion_steps := check_jump_intersection(all_current):
-            return steps + min(completion_steps)
-
-        # 2) If not, skip ahead by the number of rounds that we compared.
-        all_current = skip_to_end(all_current)
-
-        # 3) Finally, replace each node's end node with it's end node's end node
-        # (transitive relationship). We replace the end node to minimize memory
-        # requirements while still maximizing the steps we skip.
-        new_end_nodes = dict()  # make a copy to not overwrite while reading
-        rounds: int = all_current[0].rounds  # same for all
-        for key, nji in nj_table.items():
-            # Calculate relative z node steps via current end node
-            relative_z_node_steps = set(
-                rounds * instructions_count + zns for zns in nji.end_node.z_node_steps
-            )
-            new_end_nodes[key] = (nji.end_node, relative_z_node_steps)
-
-        for key, (new_end, relative_zns) in new_end_nodes.items():
-            # Update jump data in our node
-            nj_table[key].z_node_steps |= relative_zns
-            nj_table[
-                key
-            ].rounds *= 2  # rounds always double, as we step all by the same
-            nj_table[key].end_node = new_end
-
-        # 4) Update steps – we have skipped over `rounds` of instructions
-        steps += rounds * instructions_count
-    return steps
 
 
 # --- Main Program --- #
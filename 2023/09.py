@@ -5,6 +5,12 @@ FILE_TO_READ = "09_input"
 from dataclasses import dataclass
 import itertools
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 @dataclass
 class ValueHistory:
@@ -28,10 +34,10 @@ class ValueHistory:
 def parse_line(line: str) -> ValueHistory:
 	return ValueHistory([int(v) for v in line.split(" ")])
 
+@cached()
 def given():
-	with open(FILE_TO_READ, encoding="utf-8") as given_file:
-		for line in given_file:
-			yield parse_line(line.rstrip("\n"))
+	for line in read_input(FILE_TO_READ).lines():
+		yield parse_line(line)
 
 # --- Part One --- #
 
@@ -12,94 +12,51 @@ FILE_TO_READ = "10_input"
 # - . is ground; there is no pipe in this tile.
 # - S is the starting position of the animal; there is a pipe on this tile, but your sketch doesn't show what shape the pipe has.
 
-from dataclasses import dataclass, field
-import itertools
-
-
-@dataclass
-class Cell:
-    n: str  # name
-    row: int
-    col: int
-    distance: int = -1
-
-    def connections(self) -> list[str]:
-        match self.n:
-            case ".":  # no connection
-                return []
-            case "|":
-                return ["N", "S"]
-            case "-":
-                return ["W", "E"]
-            case "L":
-                return ["N", "E"]
-            case "J":
-                return ["N", "W"]
-            case "7":
-                return ["S", "W"]
-            case "F":
-                return ["S", "E"]
-            case "S":  # fully connected
-                return ["N", "S", "E", "W"]
-
-    def __hash__(self):
-        return hash(f"{self.n}{self.row}{self.col}")
-
-
-@dataclass
-class Grid:
-    cells: list[list[Cell]] = field(default_factory=list)
-    start: Cell = Cell("-1", -1, -1)
-
-    def append_line(self, line: str):
-        row: int = len(self.cells)
-        self.cells.append([Cell(n, row=row, col=col) for col, n in enumerate(line)])
-        if "S" in line:
-            self.start = self.get(len(self.cells) - 1, line.index("S"))
-            self.start.distance = 0
-
-    def get(self, row: int, col: int) -> Cell:
-        return self.cells[row][col]
-
-    def get_connected(self, cell: Cell) -> list[Cell]:
-        compass: list[str] = cell.connections()
-        compass_to_pointer: dict[str, tuple[int, int]] = {
-            "N": (cell.row - 1, cell.col),
-            "S": (cell.row + 1, cell.col),
-            "E": (cell.row, cell.col + 1),
-            "W": (cell.row, cell.col - 1),
-        }
-        compass_to_mirror: dict[str, str] = {
-            "N": "S",
-            "S": "N",
-            "E": "W",
-            "W": "E",
-        }
-
-        result = []
-        for cd in compass:
-            pointer = compass_to_pointer[cd]
-            # Outside of bounds
-            if -1 in pointer:
-                continue
-            other = self.get(*pointer)
-            # Other is not a pipe
-            if other.n == ".":
-                continue
-            # Other does not connect back to us
-            if compass_to_mirror[cd] not in other.connections():
-                continue
-            result.append(other)
-
-        return result
-
+import sys
+from pathlib import Path
+from typing import Iterator
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.grid import Grid, Position
+from advent.search import zero_one_bfs
+
+# Which directions each kind of cell connects to ("S" is fully connected)
+CONNECTIONS: dict[int, str] = {
+    ord("|"): "NS",
+    ord("-"): "WE",
+    ord("L"): "NE",
+    ord("J"): "NW",
+    ord("7"): "SW",
+    ord("F"): "SE",
+    ord("S"): "NSEW",
+}
+COMPASS: dict[str, tuple[int, int]] = {"N": (-1, 0), "S": (1, 0), "E": (0, 1), "W": (0, -1)}
+COMPASS_TO_MIRROR: dict[str, str] = {"N": "S", "S": "N", "E": "W", "W": "E"}
+
+
+def connections(grid: Grid, position: Position) -> str:
+    # Ground (".") has no connections
+    return CONNECTIONS.get(grid.get(position), "")
+
+
+def get_connected(grid: Grid, position: Position) -> list[Position]:
+    result = []
+    for cd in connections(grid, position):
+        other = grid.step(position, COMPASS[cd])
+        # Outside of bounds
+        if other is None:
+            continue
+        # Other does not connect back to us (or is not a pipe at all)
+        if COMPASS_TO_MIRROR[cd] not in connections(grid, other):
+            continue
+        result.append(other)
+    return result
+
+
+@cached()
 def given() -> Grid:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        lines = [l.rstrip("\n") for l in given_file]
-    grid = Grid()
-    for line in lines:
-        grid.append_line(line)
-    return grid
+    return Grid.from_input(FILE_TO_READ)
 
 
 # --- Part One --- #
@@ -107,29 +64,17 @@ def given() -> Grid:
 
 def part_one():
     grid = given()
-    traversed: set[Cell] = {grid.start}
-    changed: bool = True
-    while changed:
-        changed = False
-        to_add = set()
-        # Traverse one step
-        for cell in traversed:
-            connected = grid.get_connected(cell)
-            dist_from_cell = cell.distance + 1
-            # (Re)calculate distance and add to traversed set
-            for conn in connected:
-                if conn.distance == -1 or conn.distance > dist_from_cell:
-                    conn.distance = dist_from_cell
-                    changed = True
-                to_add.add(conn)
-        traversed |= to_add  # union
-
-    # Get cell of maximum distance
-    last_cell = grid.start
-    for t in traversed:
-        if t.distance > last_cell.distance:
-            last_cell = t
-    return last_cell.distance
+    start = grid.find("S")
+
+    # Breadth-first along the loop, with each cell encoded as row * width + col
+    def moves(cell: int) -> Iterator[tuple[int, int]]:
+        for row, col in get_connected(grid, divmod(cell, grid.width)):
+            yield row * grid.width + col, 1
+
+    result = zero_one_bfs([start[0] * grid.width + start[1]], moves, grid.height * grid.width)
+
+    # Maximum distance of any traversed cell
+    return max(result.distances)
 
 
 # --- Part Two --- #
@@ -6,67 +6,65 @@ FILE_TO_READ = "11_input"
 # - all rows and columns of only empty space need to be doubled
 # - then calculate the shortest path between galaxies
 
-import itertools
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.grid import Grid
+from advent.util import lazy_import
 
-def given():
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        lines_matrix = [list(l.rstrip("\n")) for l in given_file]
-    return lines_matrix
+np = lazy_import("numpy")
 
 
-def galaxies(space: list[list[str]]) -> list[tuple[int, int]]:
-    """Return a list of coordinates (row, col) of "galaxies" (i.e., "#" characters)."""
-    galaxy_coordinates = []
-    for ri, row in enumerate(space):
-        for ci, cell in enumerate(row):
-            if cell == "#":
-                galaxy_coordinates.append((ri, ci))
-    return galaxy_coordinates
+@cached()
+def given() -> Grid:
+    return Grid.from_input(FILE_TO_READ)
 
 
-# --- Part One --- #
+def expanded(
+    coordinates: "np.ndarray", is_empty: "np.ndarray", factor: int
+) -> "np.ndarray":
+    """Move each coordinate by the expansion of all empty rows (or columns) before it."""
+    empty_before = np.cumsum(is_empty) - is_empty
+    return coordinates + (factor - 1) * empty_before[coordinates]
 
 
-def print_space(image):
-    result = []
-    for row in image:
-        result.append("".join(row))
-    print("\n".join(result))
+def sum_of_distances(coordinates: "np.ndarray") -> int:
+    """Sum of |a - b| over all pairs of coordinates.
 
+    Once sorted, the i-th of n coordinates is the larger one in i pairs and the
+    smaller one in n - 1 - i pairs.
+    """
+    ordered = np.sort(coordinates)
+    n = len(ordered)
+    return int(np.sum(ordered * (2 * np.arange(n) - n + 1)))
 
-def part_one():
-    space: list[list[str]] = given()
 
-    # 1) Expand space (double empty rows and columns)
+def sum_of_shortest_paths(space: Grid, factor: int) -> int:
+    # 1) Find all galaxies ("#")
+
+    galaxies = space.mask("#")
+    rows, cols = np.nonzero(galaxies)
+
+    # 2) Expand every empty row and column `factor` times
 
-    # create copy to not change iterated sequence
-    new_image = []
-    for i, row in enumerate(space):
-        new_image.append(row)
-        if all(cell == "." for cell in row):
-            # copy row as otherwise the reference would point to the same list
-            new_image.append(row.copy())
-    space = new_image
-    # count cols in reverse so that insertion does not change the upcoming indices
-    for i in range(len(space[0]) - 1, -1, -1):
-        if all(row[i] == "." for row in space):
-            for row in space:
-                row.insert(i, ".")
+    rows = expanded(rows, ~galaxies.any(axis=1), factor)
+    cols = expanded(cols, ~galaxies.any(axis=0), factor)
 
-    # 2) Find all galaxies ("#")
+    # 3) Calculate shortest path between all pairs (rows and columns separately, as
+    #    the distance is the Manhattan distance)
 
-    galaxy_coordinates = galaxies(space)
+    return sum_of_distances(rows) + sum_of_distances(cols)
 
-    # 3) Calculate shortest path between all pairs
 
-    sum_of_shortest_paths = 0
-    for left, right in itertools.combinations(galaxy_coordinates, 2):
-        lr, lc = left
-        rr, rc = right
-        sum_of_shortest_paths += abs(lr - rr) + abs(lc - rc)
+# --- Part One --- #
+
+# Empty rows and columns are doubled.
 
-    return sum_of_shortest_paths
+
+def part_one():
+    return sum_of_shortest_paths(given(), factor=2)
 
 
 # --- Part Two --- #
@@ -77,39 +75,7 @@ def part_one():
 
 
 def part_two():
-    space: list[list[str]] = given()
-
-    # 1) Determine where we *would* expand
-
-    rows_to_expand = [
-        i for i, row in enumerate(space) if all(cell == "." for cell in row)
-    ]
-    cols_to_expand = [
-        i for i in range(len(space[0])) if all(row[i] == "." for row in space)
-    ]
-
-    # 2) Find all galaxies ("#")
-
-    galaxy_coordinates = galaxies(space)
-
-    # 3) Calculate shortest path between all pairs (with theoretical "expansion")
-
-    sum_of_shortest_paths = 0
-    for left, right in itertools.combinations(galaxy_coordinates, 2):
-        lr, lc = left
-        rr, rc = right
-        row_min, row_max = sorted([lr, rr])
-        col_min, col_max = sorted([lc, rc])
-        sum_of_shortest_paths += row_max - row_min + col_max - col_min
-        # skip our own row index, as it obviously contains a galaxy
-        for row_i in range(row_min + 1, row_max):
-            if row_i in rows_to_expand:
-                sum_of_shortest_paths += 999_999
-        for col_i in range(col_min + 1, col_max):
-            if col_i in cols_to_expand:
-                sum_of_shortest_paths += 999_999
-
-    return sum_of_shortest_paths
+    return sum_of_shortest_paths(given(), factor=1_000_000)
 
 
 # --- Main Program --- #
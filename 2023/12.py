@@ -13,6 +13,12 @@ FILE_TO_READ = "12_input"
 from dataclasses import dataclass
 import re
 from typing import Iterable
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 
 @dataclass
@@ -32,10 +38,10 @@ def parse_line(line: str) -> SpringInfo:
     return SpringInfo(patterns=patterns, groups=groups)
 
 
+@cached()
 def given() -> Iterable[SpringInfo]:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        for line in given_file:
-            yield parse_line(line.rstrip("\n"))
+    for line in read_input(FILE_TO_READ).lines():
+        yield parse_line(line)
 
 
 # --- Part One --- #
@@ -7,54 +7,51 @@ FILE_TO_READ = "13_input"
 # Sum up: (# of columns left of each reflection line) + 100 * (# of rows above each)
 
 
-import itertools
-from typing import Iterable, Optional
-
-
-class Pattern(list):
-    """A pattern matrix that we represent by a list of `str`s."""
-
-    def column_line_reflects(self, leftright: tuple[int, int]) -> bool:
-        # Check row by row
-        for row in self:
-            left, right = leftright
-            while left >= 0 and right < len(row):
-                if row[left] != row[right]:
-                    return False
-                left -= 1
-                right += 1
-        # If no check failed, we found a reflection line
-        return True
-
-    def row_line_reflects(self, topbottom: tuple[int, int]) -> bool:
-        # Check column by column (assuming all rows have equal length)
-        for col_idx in range(len(self[0])):
-            top, bottom = topbottom
-            while top >= 0 and bottom < len(self):
-                if self[top][col_idx] != self[bottom][col_idx]:
-                    return False
-                top -= 1
-                bottom += 1
-        # If no check failed, we found a reflection line
-        return True
-
-    def reflecting_column_lines(self) -> list[tuple[int, int]]:
-        reflecting_column_lines: list[tuple[int, int]] = []
-        for left, right in itertools.pairwise(range(len(self[0]))):
-            if self.column_line_reflects((left, right)):
-                reflecting_column_lines.append((left, right))
-        return reflecting_column_lines
-
-    def reflecting_row_lines(self) -> list[tuple[int, int]]:
-        reflecting_row_lines: list[tuple[int, int]] = []
-        for top, bottom in itertools.pairwise(range(len(self))):
-            if self.row_line_reflects((top, bottom)):
-                reflecting_row_lines.append((top, bottom))
-        return reflecting_row_lines
-
-    def calculate_reflection_score(self) -> int:
+import sys
+from pathlib import Path
+from typing import Iterable
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.grid import Grid
+from advent.loader import read_records
+from advent.util import lazy_import
+
+np = lazy_import("numpy")
+
+
+class Pattern(Grid):
+    """A pattern matrix of "#" and "." cells."""
+
+    def column_line_mismatches(self, leftright: tuple[int, int]) -> int:
+        """Count the cells that differ from their mirror image across the line."""
+        left, right = leftright
+        # Columns beyond the shorter side can be ignored
+        size = min(left + 1, self.width - right)
+        left_side = self.cells[:, right - size : right][:, ::-1]
+        right_side = self.cells[:, right : right + size]
+        return int(np.count_nonzero(left_side != right_side))
+
+    def row_line_mismatches(self, topbottom: tuple[int, int]) -> int:
+        return self.transposed().column_line_mismatches(topbottom)
+
+    def reflecting_column_lines(self, smudges: int = 0) -> list[tuple[int, int]]:
+        """Lines that reflect if exactly `smudges` cells are fixed."""
+        return [
+            (left, left + 1)
+            for left in range(self.width - 1)
+            if self.column_line_mismatches((left, left + 1)) == smudges
+        ]
+
+    def reflecting_row_lines(self, smudges: int = 0) -> list[tuple[int, int]]:
+        return [
+            (top, top + 1)
+            for top in range(self.height - 1)
+            if self.row_line_mismatches((top, top + 1)) == smudges
+        ]
+
+    def calculate_reflection_score(self, smudges: int = 0) -> int:
         return calculate_reflection_score(
-            self.reflecting_column_lines(), self.reflecting_row_lines()
+            self.reflecting_column_lines(smudges), self.reflecting_row_lines(smudges)
         )
 
 
@@ -71,80 +68,29 @@ def calculate_reflection_score(
     return result
 
 
+# Not @cached: the cache would keep every pattern, while streaming them keeps one
+# in memory at a time however large the input ("-" reads it from stdin)
 def given() -> Iterable[Pattern]:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        text = given_file.read()
-    for pattern_line in text.split("\n\n"):
-        yield Pattern(
-            [list(l.rstrip("\n")) for l in pattern_line.rstrip("\n").split("\n")]
-        )
+    for block in read_records(FILE_TO_READ):
+        yield Pattern.from_lines(block)
 
 
 # --- Part One --- #
 
 
 def part_one():
-    return sum([pattern.calculate_reflection_score() for pattern in given()])
+    return sum(pattern.calculate_reflection_score() for pattern in given())
 
 
 # --- Part Two --- #
 
-
-def new_reflection_line(
-    base: list[tuple[int, int]], changed: list[tuple[int, int]]
-) -> Optional[tuple[int, int]]:
-    """If a new reflection line is in `changed` that is not in `base`, return it.
-    Otherwise, return `None`."""
-    if not changed:
-        return None
-
-    if not base:
-        assert len(changed) == 1
-        return changed[0]
-
-    assert len(base) == 1
-    if len(changed) > 1:
-        base_removed = list(set(changed) - set(base))
-        assert len(base_removed) == 1
-        return base_removed[0]
-
-    assert len(changed) == 1
-    if base[0] != changed[0]:
-        return changed[0]
-    return None
+# Each pattern has exactly one smudge; fixing it makes a new line reflect.
+# Idea: Instead of flipping every cell, look for the line whose mirror images differ in
+#       exactly one cell. The old line (zero differences) cannot be the new one.
 
 
 def part_two():
-    result: int = 0
-    for pattern in given():
-        base_reflecting_column_lines = pattern.reflecting_column_lines()
-        base_reflecting_row_lines = pattern.reflecting_row_lines()
-        assert len(base_reflecting_column_lines) <= 1
-        assert len(base_reflecting_row_lines) <= 1
-
-        # Try to flip each cell once and check if a new reflection line appears
-        for row_i, col_i in itertools.product(
-            range(len(pattern)), range(len(pattern[0]))
-        ):
-            stored_val = pattern[row_i][col_i]
-            pattern[row_i][col_i] = "#" if stored_val == "." else "."
-            # Check if a new column reflection line has appeared
-            new_rcl = new_reflection_line(
-                base_reflecting_column_lines, pattern.reflecting_column_lines()
-            )
-            if new_rcl is not None:
-                result += calculate_reflection_score([new_rcl], [])
-                break
-            # Check for rows
-            new_rrl = new_reflection_line(
-                base_reflecting_row_lines, pattern.reflecting_row_lines()
-            )
-            if new_rrl is not None:
-                result += calculate_reflection_score([], [new_rrl])
-                break
-            # Reset changed cell
-            pattern[row_i][col_i] = stored_val
-    return result
+    return sum(pattern.calculate_reflection_score(smudges=1) for pattern in given())
 
 
 # --- Main Program --- #
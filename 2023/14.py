@@ -7,63 +7,66 @@ FILE_TO_READ = "14_input"
 # Load is the 1-based index of the rows counting from the bottom.
 
 
-import itertools
+import sys
+from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.cycles import fast_forward
+from advent.grid import Grid
+from advent.util import lazy_import
 
-class Dish(list):
-    def rocks_in(self, col: int) -> tuple[list[int], list[int]]:
-        """Return a sorted list of indices of hashes in the given column."""
-        hashes = []
-        boulders = []
-        for row_i, row in enumerate(self):
-            if row[col] == "#":
-                hashes.append(row_i)
-            elif row[col] == "O":
-                boulders.append(row_i)
-        return (hashes, boulders)
+np = lazy_import("numpy")
 
+# Cells are stored as byte values
+HASH = ord("#")
+BOULDER = ord("O")
+EMPTY = ord(".")
+
+
+class Dish(Grid):
     def tilt_north(self) -> None:
         """Move all boulders as if the platform was tilted north."""
-        # Idea: Determine the # before and after and move all O's between them to the top.
-        for col in range(len(self[0])):
-            hashes, boulders = self.rocks_in(col)
-            # As we always place before, we need an imaginary last index
-            boundaries = hashes + [len(self)]
-            pointer: int = 0
-            for boundary_i in boundaries:
-                while boulders and boulders[0] < boundary_i:
-                    # Consume the boulder
-                    boulder_i = boulders.pop(0)
-                    self[pointer][col], self[boulder_i][col] = (
-                        self[boulder_i][col],
-                        self[pointer][col],
-                    )
-                    pointer += 1
-                # We can continue placing after the current boundary
-                pointer = boundary_i + 1
+        # Idea: The #s split each column into segments. Count the O's per segment and
+        #       stack that many at its top.
+        hashes = self.cells == HASH
+        rows = np.arange(self.height)[:, np.newaxis]
+        # Row of the closest # above each cell (a # is its own), -1 if there is none
+        top = np.maximum.accumulate(np.where(hashes, rows, -1), axis=0)
+        # Identify each segment by its top and column and count its boulders
+        segment = (top + 1) * self.width + np.arange(self.width)
+        boulders = np.bincount(
+            segment.ravel(),
+            weights=(self.cells == BOULDER).ravel(),
+            minlength=(self.height + 1) * self.width,
+        )
+        # The first cells below the top of each segment are filled with its boulders
+        filled = rows - top <= boulders[segment]
+        self.cells[:] = np.where(hashes, HASH, np.where(filled, BOULDER, EMPTY))
 
     def turned_right(self):  # type: () -> Dish
         """Turn by 90 degrees (to the right). Makes the previous west the new north."""
-        # Can't simply multiply the empty list as this would lead to the same list reference.
-        transposed_dish = Dish([list() for _ in range(len(self[0]))])
-        # We need to iterate by column, moving from bottom to top through the rows
-        for col_i, row_i in itertools.product(range(len(self[0])), range(len(self) - 1, -1, -1)):
-            transposed_dish[col_i].append(self[row_i][col_i])
-        return transposed_dish
+        # Copy, as the rotation is only a view and we keep tilting the result
+        return self.rotated().copy()
+
+    def spin_cycle(self):  # type: () -> Dish
+        """Tilt north, west, south and east, in a new dish (this one stays as it is)."""
+        dish = self.copy()
+        for _ in range(4):
+            dish.tilt_north()
+            dish = dish.turned_right()
+        return dish
 
     def load(self) -> int:
         """Sum up the load on the north beam."""
-        # Idea: Count downwards by row and enumerate in reverse.
-        summed_load: int = 0
-        for load_index, row in zip(itertools.count(len(self), -1), self):
-            summed_load += load_index * row.count("O")
-        return summed_load
-
+        # Idea: Count the O's per row and weigh them by their distance to the bottom.
+        per_row = np.count_nonzero(self.cells == BOULDER, axis=1)
+        return int(np.sum(per_row * np.arange(self.height, 0, -1)))
 
 
+@cached()
 def given() -> Dish:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        return Dish([list(l.rstrip("\n")) for l in given_file])
+    return Dish.from_input(FILE_TO_READ)
 
 
 # --- Part One --- #
@@ -80,16 +83,13 @@ def part_one():
 # --- Part Two --- #
 
 # What is the load sum after 1e9 cycles of tilting north, west, south, east?
+# Idea: The boulders soon end up in a position they were in before, and from then on
+#       keep repeating the same few positions. Jump ahead instead of spinning.
 
 
 def part_two():
     dish = given()
-
-    # Cycle
-    for i in range(1_000_000_000):
-        for _ in range(4):
-            dish.tilt_north()
-            dish = dish.turned_right()
+    dish = fast_forward(dish, Dish.spin_cycle, 1_000_000_000, key=Dish.key)
 
     # Calculate the load
     return dish.load()
@@ -12,6 +12,12 @@ FILE_TO_READ = "15_input"
 from dataclasses import dataclass
 import re
 from typing import Iterable
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.loader import read_input
 
 
 def HASH(value: str) -> int:
@@ -23,11 +29,11 @@ def HASH(value: str) -> int:
     return result
 
 
+@cached()
 def given() -> Iterable[str]:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        lines = given_file.readlines()
+    lines = list(read_input(FILE_TO_READ).lines())
     assert len(lines) == 1
-    line = lines[0].rstrip("\n")
+    line = lines[0]
     yield from line.split(",")
 
 
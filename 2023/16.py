@@ -8,9 +8,17 @@ FILE_TO_READ = "16_input"
 # Splitters: If entering pointy end (e.g., >-), goes through, otherwise splits (<->)
 # Mirrors: Redirected by 90 degrees
 
-from dataclasses import dataclass, field
-import itertools
-import numpy as np
+from dataclasses import dataclass
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent import counters
+from advent.cache import cached
+from advent.grid import Grid
+from advent.util import lazy_import
+
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -25,67 +33,67 @@ class LightPoint:
         return hash(f"{self.row},{self.col};{self.d_row},{self.d_col}")
 
 
-@dataclass
-class Cell:
-    kind: str
-
-    def translate(self, d_row: int, d_col: int) -> list[tuple[int, int]]:
-        assert d_row == 0 or d_col == 0
-        assert abs(d_row) + abs(d_col) == 1
-
-        # Unchanged
-        if (
-            self.kind == "."
-            or (self.kind == "-" and abs(d_col) == 1)
-            or (self.kind == "|" and abs(d_row) == 1)
-        ):
-            return [(d_row, d_col)]
-        # Split (we already check the non-split direction above)
-        elif self.kind == "-":
-            return [(0, -1), (0, 1)]
-        elif self.kind == "|":
-            return [(-1, 0), (1, 0)]
-        # Mirrored upwards
-        elif (self.kind == "/" and d_col == 1) or (self.kind == "\\" and d_col == -1):
-            return [(-1, 0)]
-        # Mirrored downwards
-        elif (self.kind == "/" and d_col == -1) or (self.kind == "\\" and d_col == 1):
-            return [(1, 0)]
-        # Mirrored left
-        elif (self.kind == "/" and d_row == 1) or (self.kind == "\\" and d_row == -1):
-            return [(0, -1)]
-        # Mirrored right
-        elif (self.kind == "/" and d_row == -1) or (self.kind == "\\" and d_row == 1):
-            return [(0, 1)]
+def translate(kind: str, d_row: int, d_col: int) -> list[tuple[int, int]]:
+    assert d_row == 0 or d_col == 0
+    assert abs(d_row) + abs(d_col) == 1
+
+    # Unchanged
+    if (
+        kind == "."
+        or (kind == "-" and abs(d_col) == 1)
+        or (kind == "|" and abs(d_row) == 1)
+    ):
+        return [(d_row, d_col)]
+    # Split (we already check the non-split direction above)
+    elif kind == "-":
+        return [(0, -1), (0, 1)]
+    elif kind == "|":
+        return [(-1, 0), (1, 0)]
+    # Mirrored upwards
+    elif (kind == "/" and d_col == 1) or (kind == "\\" and d_col == -1):
+        return [(-1, 0)]
+    # Mirrored downwards
+    elif (kind == "/" and d_col == -1) or (kind == "\\" and d_col == 1):
+        return [(1, 0)]
+    # Mirrored left
+    elif (kind == "/" and d_row == 1) or (kind == "\\" and d_row == -1):
+        return [(0, -1)]
+    # Mirrored right
+    elif (kind == "/" and d_row == -1) or (kind == "\\" and d_row == 1):
+        return [(0, 1)]
+
+
+class Contraption(Grid):
+    def __init__(self, cells: "np.ndarray"):
+        super().__init__(cells)
+        # The previous light positions (considered static)
+        self.light_tails: set[LightPoint] = set()
+        # The "tip" of the light stream (actively moving)
+        self.light_heads: set[LightPoint] = {LightPoint(row=0, col=0, d_row=0, d_col=1)}
 
     def move(self, light: LightPoint) -> list[LightPoint]:
-        new_directions = self.translate(light.d_row, light.d_col)
+        """Lights leaving the light's cell, except for those leaving the grid."""
+        new_directions = translate(self.char(light.row, light.col), light.d_row, light.d_col)
         new_lights = []
         for new_dir in new_directions:
-            new_row, new_col = np.array((light.row, light.col)) + np.array(new_dir)
-            new_lights.append(LightPoint(new_row, new_col, *new_dir))
+            new_position = self.step((light.row, light.col), new_dir)
+            if new_position is not None:
+                new_lights.append(LightPoint(*new_position, *new_dir))
         return new_lights
 
-
-class Grid(list):  # list[list[Cell]]
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # The previous light positions (considered static)
-        self.light_tails: set[LightPoint] = set()
-        # The "tip" of the light stream (actively moving)
-        self.light_heads: set[LightPoint] = {LightPoint(row=0, col=0, d_row=0, d_col=1)}
-
     def iterate(self) -> None:
         """Move all light heads one step."""
         new_light_heads = set()
+        if counters.enabled:
+            counters.add("expanded", len(self.light_heads))
+            counters.peak("queue peak", len(self.light_heads))
         while self.light_heads:
             lh = self.light_heads.pop()
-            for new_head in self[lh.row][lh.col].move(lh):
+            for new_head in self.move(lh):
                 # Deduplicate
                 if new_head in self.light_tails:
-                    continue
-                # Check for out of bounds lights
-                if new_head.row < 0 or new_head.row >= len(self) or new_head.col < 0 or new_head.col >= len(self[0]):
+                    if counters.enabled:
+                        counters.add("deduplicated")
                     continue
                 new_light_heads.add(new_head)
             self.light_tails.add(lh)
@@ -95,34 +103,27 @@ class Grid(list):  # list[list[Cell]]
         """Iterate the light heads until no new cells are covered."""
         while self.light_heads:
             self.iterate()
-        energized = set()
+        energized = np.zeros(self.shape, dtype=bool)
         for lt in self.light_tails:
-            energized.add((lt.row, lt.col))
-        return len(energized)
+            energized[lt.row, lt.col] = True
+        return int(np.count_nonzero(energized))
 
     def reset(self) -> None:
         """Remove all light heads and tails."""
         self.light_heads = set()
         self.light_tails = set()
 
-    def print(self) -> str:
-        result = []
-        for row in self:
-            result.append([c.kind for c in row])
-        for lp in itertools.chain(self.light_heads, self.light_tails):
-            row, col = lp.row, lp.col
-            if result[row][col] == ".":
-                result[row][col] = "#"
-        for row in result:
-            print("".join(row))
+    def print(self) -> None:
+        result = self.copy()
+        for lp in self.light_heads | self.light_tails:
+            if result.char(lp.row, lp.col) == ".":
+                result[lp.row, lp.col] = "#"
+        print(result)
 
 
-def given() -> Grid:
-    grid_lines = []
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        for line in [l.rstrip("\n") for l in given_file]:
-            grid_lines.append([Cell(c) for c in list(line)])
-    return Grid(grid_lines)
+@cached()
+def given() -> Contraption:
+    return Contraption.from_input(FILE_TO_READ)
 
 
 # --- Part One --- #
@@ -143,13 +144,13 @@ def part_one():
 def part_two():
     grid = given()
     max_energy: int = 0
-    for row, d_row in [(0, 1), (len(grid) - 1, -1)]:
-        for col in range(len(grid[0])):
+    for row, d_row in [(0, 1), (grid.height - 1, -1)]:
+        for col in range(grid.width):
             grid.light_heads = {LightPoint(row, col, d_row, 0)}
             max_energy = max(max_energy, grid.energize())
             grid.reset()
-    for col, d_col in [(0, 1), (len(grid[0]) - 1, -1)]:
-        for row in range(len(grid)):
+    for col, d_col in [(0, 1), (grid.width - 1, -1)]:
+        for row in range(grid.height):
             grid.light_heads = {LightPoint(row, col, 0, d_col)}
             max_energy = max(max_energy, grid.energize())
             grid.reset()
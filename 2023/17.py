@@ -11,154 +11,93 @@ FILE_TO_READ = "17_input"
 # 90 degrees left or right.
 # Also can't reverse direction.
 
-from collections import deque
-from dataclasses import dataclass, field
-import itertools
-from typing import Optional
-import math
-
-
-@dataclass
-class Path:
-    # coordinates of the steps taken
-    steps: list[tuple[int, int]] = field(default_factory=lambda: [(0, 0)])
-    heat_loss: int = 0
-    # last three direction commands
-    last_three_directions: deque[tuple[int, int]] = field(
-        default_factory=lambda: deque(maxlen=3)
-    )
-
-    @property
-    def head(self) -> tuple[int, int]:
-        return self.steps[-1]
-
-    def copy(self):  # type: () -> Path
-        return Path(
-            self.steps.copy(), self.heat_loss, self.last_three_directions.copy()
-        )
-
-    def step(self, city, d_row, d_col):  # type: (Map, int, int) -> bool
-        """Continue this path one step in the given direction."""
-        assert d_row == 0 or d_col == 0
-        assert abs(d_row) + abs(d_col) == 1
-
-        next_row, next_col = self.head[0] + d_row, self.head[1] + d_col
-        # Out of city bounds?
-        if next_row not in (range(len(city))) or next_col not in range(len(city[0])):
-            return False
-
-        next_direction = (d_row, d_col)
-        # Legal step?
-        if self.last_three_directions:
-            # Reverse?
-            last_dr, last_dc = self.last_three_directions[-1]
-            if (d_row + last_dr) == 0 and (d_col + last_dc) == 0:
-                return False
-            # More than three steps in one direction?
-            if (
-                # We have taken at least three steps...
-                len(self.last_three_directions) == 3
-                # ...and our three last steps and the next one are all the same.
-                and len(set(self.last_three_directions) | set([next_direction])) == 1
-            ):
-                return False
-
-        next_cell = city[next_row][next_col]
-        next_loss = self.heat_loss + next_cell.heat_loss
-        # Would we incur more loss than the global maximum?
-        if next_loss > city.GLOBAL_MAX:
-            return False
-
-        # Next cell was already stepped to more cheaply?
-        # TODO The naive solution to this does not work! Even if we can theoretically step here more cheaply, that is just a local optimum! As our stepping is restricted, the path that is cheaper here may become more expensive over the next steps.
-        next_cheapest = next_cell.cheapest_way_here
-        # if next_cheapest is not None and next_cheapest.heat_loss <= next_loss:
-        #     return False
-
-        # Take the step
-        self.steps.append((next_row, next_col))
-        self.heat_loss = next_loss
-        self.last_three_directions.append(next_direction)
-
-        # Add ourselves as the cheapest way to the cell
-        # TODO While we disable the trimming above, we cannot assume that we are the cheapest path always.
-        if next_cheapest is None or next_cheapest.heat_loss > next_loss:
-            next_cell.cheapest_way_here = self.copy()
-
-        # TODO if another path came here before but was more expensive,
-        # we could try to kill it
-
-        # If we reached the end, update the global maximum
-        if (next_row, next_col) == (len(city), len(city[0])):
-            city.GLOBAL_MAX = min(city.GLOBAL_MAX, next_loss)
-
-        return True
-
-    def possible_futures(self, city):  # type: (Map) -> list[Path]
-        """Return paths of all possible steps taken from this path."""
-        futures = [(self.copy(), r, c) for (r, c) in [(0, 1), (1, 0), (0, -1), (-1, 0)]]
-        return [
-            future
-            for future, d_row, d_col in futures
-            if future.step(city, d_row, d_col)
-        ]
-
-
-@dataclass
-class Cell:
-    heat_loss: int
-    cheapest_way_here: Optional[Path] = None
-
-
-class Map(list):  # list[list[Cell]]
-    GLOBAL_MAX: int = math.inf
-    def reset_cells(self) -> None:
-        for row in self:
-            for cell in row:
-                cell.cheapest_way_here = None
-
-
+import sys
+from pathlib import Path
+from typing import Iterator
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+from advent.grid import ORTHOGONAL, Grid, Position
+from advent.search import dijkstra
+
+# The most blocks a crucible moves in a single direction before it must turn
+MAX_RUN = 3
+
+
+class Map(Grid):  # cells are the heat loss digits
+    # A search state is the crucible's position, the direction of its last move (an
+    # index into ORTHOGONAL) and how many moves in a row went that way (0 at the start):
+    #     ((row * width + col) * 4 + direction) * (MAX_RUN + 1) + run
+
+    def __init__(self, cells):
+        super().__init__(cells)
+        # The heat loss of each cell, row by row, for the search's inner loop
+        self.losses: list[int] = (self.cells - ord("0")).ravel().tolist()
+
+    def heat_loss(self, position: Position) -> int:
+        return self.get(position) - ord("0")
+
+    def encode(self, row: int, col: int, direction: int, run: int) -> int:
+        return ((row * self.width + col) * 4 + direction) * (MAX_RUN + 1) + run
+
+    def decode(self, state: int) -> tuple[int, int, int, int]:
+        state, run = divmod(state, MAX_RUN + 1)
+        position, direction = divmod(state, 4)
+        row, col = divmod(position, self.width)
+        return row, col, direction, run
+
+    def moves(self, state: int) -> Iterator[tuple[int, int]]:
+        """The states one block further, with the heat lost on the block moved to."""
+        row, col, direction, run = self.decode(state)
+        height, width = self.shape
+        for new_direction, (d_row, d_col) in enumerate(ORTHOGONAL):
+            if run:
+                # Can't reverse...
+                if new_direction == (direction + 2) % 4:
+                    continue
+                # ...and must turn after MAX_RUN blocks
+                if new_direction == direction and run == MAX_RUN:
+                    continue
+            next_row, next_col = row + d_row, col + d_col
+            if not (0 <= next_row < height and 0 <= next_col < width):
+                continue
+            new_run = run + 1 if run and new_direction == direction else 1
+            yield (
+                self.encode(next_row, next_col, new_direction, new_run),
+                self.losses[next_row * width + next_col],
+            )
+
+
+@cached(version=2)
 def given() -> Map:
-    with open(FILE_TO_READ, encoding="utf-8") as given_file:
-        lines = [l.rstrip("\n") for l in given_file]
-    return Map([[Cell(int(c)) for c in line] for line in lines])
+    return Map.from_input(FILE_TO_READ)
 
 
 # --- Part One --- #
 
 # Find the path through the grid that incurs the least heat loss.
+# Idea: Dijkstra over (position, direction, run) states; a cheaper way to a cell can
+#       still be the worse one if it arrives at the end of a run, so the state needs
+#       both. Every block costs at least 1, so the distance to the target is an A*
+#       heuristic.
 
 
 def part_one():
     city_map: Map = given()
-
-    # 1. Determine global maximum
-    maximum_path = Path()
-    diagonal_stepper = iter(itertools.cycle([(0, 1), (1, 0)]))
-    # We know that the map is square, so this works
-    while maximum_path.head != (len(city_map) - 1, (len(city_map[0])) - 1):
-        maximum_path.step(city_map, *next(diagonal_stepper))
-
-    city_map.reset_cells()
-    city_map.GLOBAL_MAX = maximum_path.heat_loss
-
-    # 2. Exhaustively check map
-    paths: deque[Path] = deque([Path()])
-
-    while paths:
-        # a. Take next path from front
-        path = paths.popleft()
-
-        # b. Take all possible steps
-        #    - Deduplicates within itself
-        #    - Checks map for cheaper paths
-        #    - Kills all inferior paths and returns only the optimum
-        #    - May return the empty list
-        new_paths = path.possible_futures(city_map)
-        paths.extend(new_paths)
-
-    least_heat_loss: int = city_map[-1][-1].cheapest_way_here.heat_loss
-    return least_heat_loss
+    target = (city_map.height - 1, city_map.width - 1)
+
+    def remaining(state: int) -> int:
+        row, col, _, _ = city_map.decode(state)
+        return (target[0] - row) + (target[1] - col)
+
+    result = dijkstra(
+        [city_map.encode(0, 0, 0, 0)],
+        city_map.moves,
+        size=city_map.encode(city_map.height, 0, 0, 0),
+        is_goal=lambda state: remaining(state) == 0,
+        heuristic=remaining,
+    )
+    return result.cost
 
 
 # --- Part Two --- #
@@ -1,5 +1,13 @@
 """Advent of Code 2024: Day 1"""
 
+FILE_TO_READ = "01_input"
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
 # --- Part One --- #
 
 
@@ -37,10 +45,15 @@ def part_two(given: list[list[int]]) -> int:
 # --- Main Program --- #
 
 
-with open("01_input", encoding="utf-8") as fh:
-    given = []
-    for line in fh.readlines():
-        given.append([int(el) for el in line.rstrip().split()])
+@cached()
+def given() -> list[list[int]]:
+    with open(FILE_TO_READ, encoding="utf-8") as fh:
+        lines = []
+        for line in fh.readlines():
+            lines.append([int(el) for el in line.rstrip().split()])
+    return lines
+
 
-print(f"Part One: {part_one(given)}")
-print(f"Part Two: {part_two(given)}")
+if __name__ == "__main__":
+    print(f"Part One: {part_one(given())}")
+    print(f"Part Two: {part_two(given())}")
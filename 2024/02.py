@@ -1,6 +1,13 @@
 """Advent of Code 2024: Day 2"""
 
+FILE_TO_READ = "02_input"
+
 import itertools
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
 
 # --- Part One --- #
 
@@ -66,8 +73,12 @@ def part_two(given):
 # --- Main Program --- #
 
 
-with open("02_input", encoding="utf-8") as fh:
-    given = [[int(el) for el in line.rstrip().split()] for line in fh.readlines()]
+@cached()
+def given() -> list[list[int]]:
+    with open(FILE_TO_READ, encoding="utf-8") as fh:
+        return [[int(el) for el in line.rstrip().split()] for line in fh.readlines()]
+
 
-print(f"Part One: {part_one(given)}")
-print(f"Part Two: {part_two(given)}")
+if __name__ == "__main__":
+    print(f"Part One: {part_one(given())}")
+    print(f"Part Two: {part_two(given())}")
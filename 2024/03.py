@@ -1,6 +1,13 @@
 """Advent of Code 2024: Day 3"""
 
+FILE_TO_READ = "03_input"
+
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
 
 # --- Part One --- #
 
@@ -41,8 +48,12 @@ def part_two(given):
 # --- Main Program --- #
 
 
-with open("03_input", encoding="utf-8") as fh:
-    given = "".join(fh.readlines())
+@cached()
+def given() -> str:
+    with open(FILE_TO_READ, encoding="utf-8") as fh:
+        return "".join(fh.readlines())
+
 
-print(f"Part One: {part_one(given)}")
-print(f"Part Two: {part_two(given)}")
+if __name__ == "__main__":
+    print(f"Part One: {part_one(given())}")
+    print(f"Part Two: {part_two(given())}")
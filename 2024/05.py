@@ -1,8 +1,15 @@
 """Advent of Code 2024: Day 05"""
 
+FILE_TO_READ = "05_input"
+
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import total_ordering
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
 
 # --- Part One --- #
 
@@ -28,7 +35,6 @@ def is_valid(befores_and_afters: dict[int, BeforeAndAfter], update: list[int]):
 def part_one(
     befores_and_afters: dict[int, BeforeAndAfter], updates: list[list[int]]
 ) -> int:
-    befores_and_afters = get_befores_and_afters(rules)
     summed_middle_page_numbers = 0
     for update in updates:
         if not is_valid(befores_and_afters, update):
@@ -43,18 +49,18 @@ def part_one(
 
 @total_ordering
 class Order:
-    befores_and_afters: dict[int, BeforeAndAfter] = None
-
-    def __init__(self, value):
+    def __init__(self, value: int, befores_and_afters: dict[int, BeforeAndAfter]):
         self.value = value
+        # The rules to order by, per instance instead of on the class
+        self.befores_and_afters = befores_and_afters
 
     def __eq__(self, other):
         return self.value == other.value
 
     def __lt__(self, other):
         return (
-            other.value in befores_and_afters[self.value].afters
-            or self.value in befores_and_afters[other.value].befores
+            other.value in self.befores_and_afters[self.value].afters
+            or self.value in self.befores_and_afters[other.value].befores
         )
 
 
@@ -62,9 +68,8 @@ def part_two(
     befores_and_afters: dict[int, BeforeAndAfter], updates: list[list[int]]
 ) -> int:
     summed_middle_page_numbers = 0
-    Order.befores_and_afters = befores_and_afters
     for update in updates:
-        ordered = sorted(update, key=Order)
+        ordered = sorted(update, key=lambda page: Order(page, befores_and_afters))
         if ordered == update:
             continue
         middle = ordered[len(update) // 2]
@@ -83,21 +88,25 @@ def get_befores_and_afters(rules: list[tuple[int, int]]) -> dict[int, BeforeAndA
     return befores_and_afters
 
 
-with open("05_input", encoding="utf-8") as fh:
-    all_lines = fh.readlines()
+@cached()
+def given() -> tuple[dict[int, BeforeAndAfter], list[list[int]]]:
+    with open(FILE_TO_READ, encoding="utf-8") as fh:
+        all_lines = fh.readlines()
+
+    rules = []
+    for i, line in enumerate(all_lines):
+        if line == "\n":
+            break
+        first, second = line.rstrip().split("|")
+        rules.append((int(first), int(second)))
 
-rules = []
-for i, line in enumerate(all_lines):
-    if line == "\n":
-        break
-    first, second = line.rstrip().split("|")
-    rules.append((int(first), int(second)))
+    updates = []
+    for line in all_lines[i + 1 :]:
+        updates.append([int(num) for num in line.rstrip().split(",")])
 
-updates = []
-for line in all_lines[i + 1 :]:
-    updates.append([int(num) for num in line.rstrip().split(",")])
+    return get_befores_and_afters(rules), updates
 
-befores_and_afters = get_befores_and_afters(rules)
 
-print(f"Part One: {part_one(befores_and_afters, updates)}")
-print(f"Part Two: {part_two(befores_and_afters, updates)}")
+if __name__ == "__main__":
+    print(f"Part One: {part_one(*given())}")
+    print(f"Part Two: {part_two(*given())}")
@@ -1,5 +1,13 @@
 """Advent of Code 2024: Day xx"""
 
+FILE_TO_READ = "xx_input"
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from advent.cache import cached
+
 # --- Part One --- #
 
 
@@ -17,8 +25,12 @@ def part_two(given):
 # --- Main Program --- #
 
 
-with open("xx_input", encoding="utf-8") as fh:
-    given = [line.rstrip() for line in fh.readlines()]
+@cached()
+def given():
+    with open(FILE_TO_READ, encoding="utf-8") as fh:
+        return [line.rstrip() for line in fh.readlines()]
+
 
-print(f"Part One: {part_one(given)}")
-print(f"Part Two: {part_two(given)}")
+if __name__ == "__main__":
+    print(f"Part One: {part_one(given())}")
+    print(f"Part Two: {part_two(given())}")
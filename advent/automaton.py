@@ -0,0 +1,93 @@
+"""Aho–Corasick automaton: find many byte patterns in one pass over the input.
+
+The patterns are compiled once into a trie whose failure links are folded into a
+dense transition table, so scanning costs one table lookup per byte, whatever the
+number of patterns, and matches may overlap ("oneight" holds "one" and "eight"):
+
+    words = Automaton({b"one": 1, b"two": 2, ..., b"1": 1, ...})
+    for first, last in words.first_and_last(read_input(path).chunks()):
+        ...
+
+The scanning state carries over from one chunk to the next, so a file can be fed
+in chunks of any size (e.g. `Input.chunks()`) without matches across chunk
+boundaries being lost.
+"""
+
+from collections import deque
+from typing import Generic, Iterable, Iterator, Mapping, Optional, TypeVar
+
+V = TypeVar("V")
+
+NEWLINE = ord("\n")
+
+
+class Automaton(Generic[V]):
+    def __init__(self, patterns: Mapping[bytes, V]):
+        if not all(patterns):
+            raise ValueError("Patterns must not be empty")
+        # The trie: transitions per state, and the patterns ending there
+        goto: list[dict[int, int]] = [{}]
+        ending: list[Optional[bytes]] = [None]
+        for pattern in patterns:
+            state = 0
+            for byte in pattern:
+                if byte not in goto[state]:
+                    goto.append({})
+                    ending.append(None)
+                    goto[state][byte] = len(goto) - 1
+                state = goto[state][byte]
+            ending[state] = pattern
+
+        # In breadth-first order, every state's failure state (the longest proper
+        # suffix that is also in the trie) is done before the state itself
+        self.delta: list[list[int]] = [[0] * 256 for _ in goto]
+        # Value of the longest pattern ending at each state, directly or via failures
+        self.output: list[Optional[V]] = [None] * len(goto)
+        failure = [0] * len(goto)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            fallback = self.delta[failure[state]]
+            if ending[state] is not None:
+                self.output[state] = patterns[ending[state]]
+            elif state:
+                self.output[state] = self.output[failure[state]]
+            row = self.delta[state]
+            for byte in range(256):
+                child = goto[state].get(byte)
+                if child is None:
+                    row[byte] = fallback[byte] if state else 0
+                    continue
+                row[byte] = child
+                failure[child] = fallback[byte] if state else 0
+                queue.append(child)
+
+    def first_and_last(
+        self, chunks: Iterable[bytes], separator: int = NEWLINE
+    ) -> Iterator[tuple[Optional[V], Optional[V]]]:
+        """The values of the first and last match on each line (None if it has none).
+
+        Matches are ordered by where they end, the longest one first where several
+        end at the same byte. If no pattern contains another, that is also the order
+        of where they start. Matches do not span lines; no line is yielded after a
+        final separator.
+        """
+        delta, output = self.delta, self.output
+        state = 0
+        first = last = None
+        byte = separator
+        for chunk in chunks:
+            for byte in chunk:
+                if byte == separator:
+                    yield first, last
+                    state = 0
+                    first = last = None
+                    continue
+                state = delta[state][byte]
+                value = output[state]
+                if value is not None:
+                    if first is None:
+                        first = value
+                    last = value
+        if byte != separator:
+            yield first, last
@@ -0,0 +1,161 @@
+"""Store per-day benchmark baselines and gate on performance regressions.
+
+`save` benchmarks the selected days and writes one baseline file per day to
+`baselines/<year>/<NN>.json`. `compare` benchmarks them again and exits with a
+nonzero status if any phase's median time or peak memory grew by more than the
+allowed fraction compared to its baseline (or if a phase that used to finish
+now fails or times out). Tiny absolute changes are ignored, as they are noise.
+
+Usage: python -m advent.baseline save [YEAR | YEAR/DAY ...] [bench options]
+       python -m advent.baseline compare [YEAR | YEAR/DAY ...] [bench options]
+           [--time-threshold 0.25] [--memory-threshold 0.25]
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from advent import cache
+from advent.bench import DayBench, bench_day, environment, print_summary
+from advent.days import ROOT, Day, discover
+from advent.util import mf, tf
+
+BASELINE_DIR = ROOT / "baselines"
+
+
+@dataclass
+class Regression:
+    day: Day
+    phase: str
+    what: str
+    baseline: Optional[float]
+    current: Optional[float]
+
+    def describe(self) -> str:
+        if self.current is None:
+            return f"{self.day.name} {self.phase}: {self.what}"
+        fmt = tf if self.what == "median time" else mf
+        change = self.current / self.baseline - 1
+        return (
+            f"{self.day.name} {self.phase}: {self.what} "
+            f"{fmt(self.baseline)} -> {fmt(self.current)} (+{change:.1%})"
+        )
+
+
+def baseline_path(day: Day, directory: Path = BASELINE_DIR) -> Path:
+    return directory / str(day.year) / f"{day.day:02d}.json"
+
+
+def save(result: DayBench, settings: dict[str, Any], directory: Path = BASELINE_DIR) -> Path:
+    path = baseline_path(result.day, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        "environment": environment(),
+        "settings": settings,
+        "phases": result.summary(),
+    }
+    path.write_text(json.dumps(content, indent=2) + "\n")
+    return path
+
+
+def grew(baseline: float, current: float, threshold: float, min_delta: float) -> bool:
+    return current - baseline > min_delta and current > baseline * (1 + threshold)
+
+
+def compare(
+    result: DayBench,
+    baseline: dict[str, Any],
+    time_threshold: float,
+    memory_threshold: float,
+    min_time_delta: float = 0.001,
+    min_memory_delta: int = 64 * 1024,
+) -> list[Regression]:
+    regressions = []
+    for phase, stats in result.phases.items():
+        before = baseline["phases"].get(phase)
+        # New phases or phases that never worked cannot regress
+        if before is None or not before["runs"]:
+            continue
+        if not stats.runs:
+            regressions.append(Regression(result.day, phase, stats.error, None, None))
+            continue
+        if grew(before["median"], stats.median, time_threshold, min_time_delta):
+            regressions.append(
+                Regression(result.day, phase, "median time", before["median"], stats.median)
+            )
+        if (
+            before.get("peak_memory") is not None
+            and stats.peak_memory is not None
+            and grew(before["peak_memory"], stats.peak_memory, memory_threshold, min_memory_delta)
+        ):
+            regressions.append(
+                Regression(
+                    result.day, phase, "peak memory", before["peak_memory"], stats.peak_memory
+                )
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.baseline", description=__doc__)
+    parser.add_argument("mode", choices=["save", "compare"])
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2024/05")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per phase")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per phase")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per run")
+    parser.add_argument("--no-cache", action="store_true", help="always parse the input")
+    parser.add_argument("--directory", type=Path, default=BASELINE_DIR)
+    parser.add_argument(
+        "--time-threshold", type=float, default=0.25, help="allowed growth of the median"
+    )
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.25, help="allowed growth of the peak"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=args.days)
+    if not days:
+        sys.exit("No days found.")
+    cache.set_enabled(not args.no_cache)
+    settings = {
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "timeout": args.timeout,
+        "cache": not args.no_cache,
+    }
+
+    results = []
+    regressions: list[Regression] = []
+    for day in days:
+        result = bench_day(day, args.warmup, args.repeat, args.timeout, memory=True)
+        results.append(result)
+        if args.mode == "save":
+            save(result, settings, args.directory)
+            continue
+        path = baseline_path(day, args.directory)
+        if not path.exists():
+            print(f"No baseline for {day.name}, skipping comparison.", file=sys.stderr)
+            continue
+        baseline = json.loads(path.read_text())
+        regressions += compare(result, baseline, args.time_threshold, args.memory_threshold)
+    print_summary(results)
+
+    if args.mode == "save":
+        print(f"\nBaselines written to {args.directory}")
+        return
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression.describe()}")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
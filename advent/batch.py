@@ -0,0 +1,204 @@
+"""Solve one day for many inputs, streaming the answers as JSON lines.
+
+The inputs are either all files in a directory or the paths listed in a manifest
+file (one per line, relative to the manifest; empty lines and lines starting with
+"#" are skipped). Every worker process imports the day once and then solves input
+after input, so interpreter startup, imports and module-level setup are paid once
+per worker instead of once per input. Each input produces one record:
+
+    {"input": "...", "part_one": "...", "part_two": "...",
+     "timings": {"part_one": 0.0012, "part_two": 0.0034}}
+
+with an "errors" entry for parts that failed or timed out (their answer is null).
+Records are written in input order as soon as they are available.
+
+With `--threads`, the inputs are solved by a pool of `--jobs` threads in this
+process instead. The input to read is a module global (`FILE_TO_READ`), so where
+the parts take the parsed input (2020, 2024), the threads share the module and
+parse one at a time, then solve the contexts `given()` built side by side. Parts
+that read the input themselves (2023) need a copy of the module per thread; the
+copies are all loaded before the threads start, as loading changes the working
+directory of the whole process. Timeouts rely on signals, which only the main
+thread receives, so `--timeout` cannot be combined with `--threads`. Threads only pay off where the GIL is released or absent (a
+free-threaded build); `python -m advent.fanout` compares the two.
+
+Usage: python -m advent.batch YEAR/DAY (DIRECTORY | MANIFEST) [--jobs N]
+                              [--threads] [--timeout SECONDS] [--chunksize N]
+                              [-o OUTPUT]
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator, Optional
+
+from advent import cache
+from advent.days import PARTS, Day, discover, load, takes_input
+from advent.runner import run_part
+from advent.util import finish_lazy_imports, quiet_broken_pipe
+
+# The day module of this worker process, loaded once by `start_worker`
+_module: Optional[ModuleType] = None
+# The copy of the day module a worker thread took (see `solve_threaded`)
+_threads = threading.local()
+# Threads sharing a module set its `FILE_TO_READ`, so they parse one at a time
+_parsing = threading.Lock()
+
+
+def input_paths(source: Path) -> list[Path]:
+    if source.is_dir():
+        return sorted(path.resolve() for path in source.iterdir() if path.is_file())
+    paths = []
+    for line in source.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            paths.append((source.parent / line).resolve())
+    return paths
+
+
+def start_worker(day: Day) -> None:
+    global _module
+    # Every input is parsed once, so caching them would only fill the disk
+    cache.set_enabled(False)
+    _module = load(day)
+    os.chdir(day.path.parent)
+
+
+def parser_for(module: ModuleType, path: Path) -> Callable[[], Any]:
+    """Parse `path` with the module's `given()`, safely for threads sharing `module`."""
+
+    def given() -> Any:
+        with _parsing:
+            module.FILE_TO_READ = str(path)
+            parsed = module.given()
+            # Generators read as they go, so drain them while the path is still ours
+            return list(parsed) if isinstance(parsed, Iterator) else parsed
+
+    return given
+
+
+def solve_input(
+    path: Path,
+    timeout: Optional[float],
+    module: Optional[ModuleType] = None,
+    shared: bool = False,
+) -> dict[str, Any]:
+    """Solve both parts for one input; `shared` if other threads use `module`, too."""
+    module = module or _module
+    given = parser_for(module, path) if shared else None
+    if not shared:
+        module.FILE_TO_READ = str(path)
+    record: dict[str, Any] = {"input": str(path)}
+    timings, errors = {}, {}
+    for part in PARTS:
+        result = run_part(module, part, timeout, given=given)
+        record[part] = result.answer
+        timings[part] = result.seconds
+        if result.error is not None:
+            errors[part] = result.error
+    record["timings"] = timings
+    if errors:
+        record["errors"] = errors
+    return record
+
+
+def solve_all(
+    day: Day,
+    paths: list[Path],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    chunksize: int = 4,
+) -> Iterator[dict[str, Any]]:
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=start_worker, initargs=(day,)
+    ) as pool:
+        yield from pool.map(solve_input, paths, [timeout] * len(paths), chunksize=chunksize)
+
+
+def solve_threaded(
+    day: Day, paths: list[Path], jobs: Optional[int] = None
+) -> Iterator[dict[str, Any]]:
+    """Like `solve_all`, but in a pool of threads of this process (without timeouts)."""
+    cache.set_enabled(False)
+    jobs = jobs or os.cpu_count()
+    module = load(day)
+    if takes_input(module):
+
+        def solve(path: Path) -> dict[str, Any]:
+            return solve_input(path, None, module, shared=True)
+
+    else:
+        copies: queue.SimpleQueue[ModuleType] = queue.SimpleQueue()
+        for i in range(jobs):
+            copies.put(load(day, f"{day.module_name}_thread{i}"))
+
+        def solve(path: Path) -> dict[str, Any]:
+            if not hasattr(_threads, "module"):
+                _threads.module = copies.get()
+            return solve_input(path, None, _threads.module)
+
+    finish_lazy_imports()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(solve, paths)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.batch", description=__doc__)
+    parser.add_argument("day", help="the day to solve, e.g. 2023/05")
+    parser.add_argument("inputs", type=Path, help="directory of inputs or manifest file")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (or threads)"
+    )
+    parser.add_argument("--threads", action="store_true", help="use threads, not processes")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per part")
+    parser.add_argument("--chunksize", type=int, default=4, help="inputs sent to a worker at once")
+    parser.add_argument("-o", "--output", type=Path, help="write the records here, not to stdout")
+    args = parser.parse_args(argv)
+    if args.threads and args.timeout:
+        parser.error("--timeout needs signals, which worker threads do not receive")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=[args.day])
+    if len(days) != 1:
+        sys.exit(f"No single day matches {args.day}.")
+    day = days[0]
+    if not hasattr(load(day), "FILE_TO_READ"):
+        sys.exit(f"{day.name} has no FILE_TO_READ, so it cannot be pointed to other inputs.")
+    paths = input_paths(args.inputs)
+    if args.threads:
+        records = solve_threaded(day, paths, args.jobs)
+    else:
+        records = solve_all(day, paths, args.jobs, args.timeout, args.chunksize)
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    t0 = time.perf_counter()
+    failed = 0
+    try:
+        with quiet_broken_pipe():
+            for record in records:
+                failed += "errors" in record
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+    finally:
+        if args.output:
+            output.close()
+    wall = time.perf_counter() - t0
+    print(
+        f"{len(paths)} inputs ({failed} with errors) in {wall:.3f} s, "
+        f"{len(paths) / wall:.1f} inputs/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""Repeated, statistically summarised timings of each day's phases.
+
+Each day is split into the phases "parse" (the module's `given()`, if it has one),
+"part_one" and "part_two". The parts get a freshly parsed input before every run,
+outside the timed region, so their times do not include parsing again; days
+without a `given()` (2023/06) still parse inside their parts. Every phase is run
+a few times untimed (warmup) and then timed `--repeat` times; we report min, median, p95, mean and the run-to-run
+variance. With `--memory`, one extra run per phase is traced with `tracemalloc`
+to get its peak memory (kept separate, as tracing distorts the timings).
+The days run one after another so they do not compete for cores.
+
+Usage: python -m advent.bench [YEAR | YEAR/DAY ...] [--warmup N] [--repeat N]
+                              [--timeout SECONDS] [--memory] [--output bench.json]
+"""
+
+import argparse
+import contextlib
+import datetime
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterator, Optional
+
+from advent import cache
+from advent.days import PARTS, Day, discover, load, solve, working_directory
+from advent.util import PartTimeout, mf, tf, time_limit
+
+PARSE = "parse"
+
+
+@dataclass
+class PhaseStats:
+    runs: list[float] = field(default_factory=list)
+    error: Optional[str] = None
+    # Peak traced Python memory in bytes, if measured
+    peak_memory: Optional[int] = None
+
+    @property
+    def min(self) -> float:
+        return min(self.runs)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    @property
+    def p95(self) -> float:
+        if len(self.runs) < 2:
+            return self.runs[0]
+        return statistics.quantiles(self.runs, n=20, method="inclusive")[-1]
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.runs)
+
+    @property
+    def variance(self) -> float:
+        return statistics.variance(self.runs) if len(self.runs) > 1 else 0.0
+
+    @property
+    def cv(self) -> float:
+        """Coefficient of variation (stdev / mean), comparable across phases."""
+        return self.variance**0.5 / self.mean if self.mean else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        if not self.runs:
+            return {"error": self.error, "runs": []}
+        return {
+            "error": self.error,
+            "peak_memory": self.peak_memory,
+            "runs": self.runs,
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "mean": self.mean,
+            "variance": self.variance,
+            "cv": self.cv,
+        }
+
+
+@dataclass
+class DayBench:
+    day: Day
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        return {name: stats.summary() for name, stats in self.phases.items()}
+
+
+@dataclass
+class Phase:
+    """Time `run`, called with what the untimed `prepare` returned."""
+
+    run: Callable[[Any], Any]
+    prepare: Callable[[], Any] = lambda: None
+
+
+def materialize(given: Any) -> Any:
+    """Several `given()`s are generators; parsing only happens once they are consumed."""
+    if inspect.isgenerator(given):
+        return list(given)
+    return given
+
+
+def parsed(module: ModuleType) -> Any:
+    """The module's input, fully parsed but handed out the way `given()` does."""
+    result = module.given()
+    # Generators (and cached ones, handed out as iterators) are consumed up front
+    if isinstance(result, Iterator):
+        return iter(list(result))
+    return result
+
+
+@contextlib.contextmanager
+def given_as(module: ModuleType, value: Any) -> Iterator[None]:
+    """Make the module's `given()` return `value` (the 2023 parts call it themselves)."""
+    original = module.given
+    module.given = lambda: value
+    try:
+        yield
+    finally:
+        module.given = original
+
+
+def solve_parsed(module: ModuleType, part: str, value: Any) -> Any:
+    with given_as(module, value):
+        return solve(module, part)
+
+
+def phases(module: ModuleType) -> dict[str, Phase]:
+    result: dict[str, Phase] = {}
+    if not callable(getattr(module, "given", None)):
+        for part in PARTS:
+            result[part] = Phase(lambda _, part=part: solve(module, part))
+        return result
+    result[PARSE] = Phase(lambda _: materialize(module.given()))
+    for part in PARTS:
+        result[part] = Phase(
+            lambda value, part=part: solve_parsed(module, part, value),
+            prepare=lambda: parsed(module),
+        )
+    return result
+
+
+def traced_peak(function: Callable[[], Any]) -> int:
+    """Run once under `tracemalloc` and return the peak traced memory in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(
+    phase: Phase,
+    warmup: int,
+    repeat: int,
+    timeout: Optional[float],
+    memory: bool = False,
+) -> PhaseStats:
+    stats = PhaseStats()
+    try:
+        for i in range(warmup + repeat):
+            with time_limit(timeout):
+                prepared = phase.prepare()
+            gc.collect()
+            with time_limit(timeout):
+                t0 = time.perf_counter()
+                phase.run(prepared)
+                t1 = time.perf_counter()
+            if i >= warmup:
+                stats.runs.append(t1 - t0)
+        if memory:
+            with time_limit(timeout):
+                prepared = phase.prepare()
+            # Tracing is slow, so allow it a multiple of the regular time limit
+            with time_limit(timeout and 10 * timeout):
+                stats.peak_memory = traced_peak(lambda: phase.run(prepared))
+    except PartTimeout:
+        stats.error = f"timeout: no answer after {timeout} s"
+    except Exception as exc:
+        stats.error = f"{type(exc).__name__}: {exc}"
+    return stats
+
+
+def bench_day(
+    day: Day,
+    warmup: int = 1,
+    repeat: int = 5,
+    timeout: Optional[float] = None,
+    memory: bool = False,
+) -> DayBench:
+    result = DayBench(day)
+    module = load(day)
+    with working_directory(day.path.parent):
+        for name, phase in phases(module).items():
+            result.phases[name] = measure(phase, warmup, repeat, timeout, memory)
+    return result
+
+
+def environment() -> dict[str, Any]:
+    """Describe the box, so that only comparable result files get compared."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def to_json(results: list[DayBench], settings: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "environment": environment(),
+        "settings": settings,
+        "days": {res.day.name: res.summary() for res in results},
+    }
+
+
+def print_summary(results: list[DayBench]) -> None:
+    header = ["Day", "Phase", "Min", "Median", "p95", "CV", "Peak memory"]
+    rows = []
+    for res in results:
+        for name, stats in res.phases.items():
+            if not stats.runs:
+                error = f"[{stats.error.split(':')[0]}]"
+                rows.append([res.day.name, name, error, "", "", "", ""])
+                continue
+            rows.append(
+                [
+                    res.day.name,
+                    name,
+                    tf(stats.min),
+                    tf(stats.median),
+                    tf(stats.p95),
+                    f"{stats.cv:.1%}",
+                    mf(stats.peak_memory) if stats.peak_memory is not None else "",
+                ]
+            )
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for row in [header, ["=" * w for w in widths]] + rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.bench", description=__doc__)
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2024/05")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per phase")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per phase")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per run")
+    parser.add_argument("--memory", action="store_true", help="also trace peak memory")
+    parser.add_argument("--no-cache", action="store_true", help="always parse the input")
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=args.days)
+    if not days:
+        sys.exit("No days found.")
+    cache.set_enabled(not args.no_cache)
+
+    results = [
+        bench_day(day, args.warmup, args.repeat, args.timeout, args.memory)
+        for day in days
+    ]
+    print_summary(results)
+
+    if args.output:
+        settings = {
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "timeout": args.timeout,
+            "memory": args.memory,
+            "cache": not args.no_cache,
+        }
+        args.output.write_text(json.dumps(to_json(results, settings), indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""On-disk cache of parsed puzzle inputs.
+
+Decorate a day's `given()` with `@cached()` to store its result, pickled, under a
+key made from the input file's bytes, the source of the whole module defining the
+parser (so edits to the helpers and classes it uses count, too) and an explicit
+parser `version` (bump it when something outside that module changes what the
+parser builds, e.g. a class from `advent.grid`). Generators are cached as lists
+and handed out as iterators again. Every hit unpickles a fresh copy, so parts may mutate what they get.
+
+The cache lives in `.cache/parsed` and is kept below `ADVENT_CACHE_SIZE` bytes
+(default 256 MiB) by evicting the least recently used entries. Set
+`ADVENT_CACHE=0` to bypass it. Long-running processes can additionally keep the
+most recent entries in memory (pickled, so hits still hand out fresh copies) with
+`keep_in_memory()`.
+
+Usage: python -m advent.cache [info | clear]
+"""
+
+import collections
+import functools
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from advent.loader import read_input
+from advent.util import lazy_import, mf
+
+# Only needed once a parser runs (or its result is written), not to import a day
+inspect = lazy_import("inspect")
+tempfile = lazy_import("tempfile")
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "parsed"
+MAX_SIZE = int(os.environ.get("ADVENT_CACHE_SIZE", 256 * 2**20))
+
+_enabled = os.environ.get("ADVENT_CACHE", "1") != "0"
+# Key -> pickled entry, least recently used first; None if not kept in memory
+_memory: Optional[collections.OrderedDict[str, bytes]] = None
+_memory_size = 0
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def keep_in_memory(size: int) -> None:
+    """Also keep the `size` most recently used entries in memory (0 to stop)."""
+    global _memory, _memory_size
+    _memory = collections.OrderedDict() if size else None
+    _memory_size = size
+
+
+def _remember(key: str, entry: tuple[bool, Any]) -> None:
+    _memory[key] = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    while len(_memory) > _memory_size:
+        _memory.popitem(last=False)
+
+
+def _load_cached(key: str) -> Optional[tuple[bool, Any]]:
+    if _memory is not None and key in _memory:
+        _memory.move_to_end(key)
+        return pickle.loads(_memory[key])
+    entry = load(key)
+    if entry is not None and _memory is not None:
+        _remember(key, entry)
+    return entry
+
+
+def parser_source(parser: Callable) -> bytes:
+    """The source of the module defining `parser`, or of `parser` alone without a file."""
+    path = getattr(parser, "__globals__", {}).get("__file__")
+    if path is not None:
+        try:
+            return Path(path).read_bytes()
+        except OSError:
+            pass
+    try:
+        return inspect.getsource(parser).encode()
+    except (OSError, TypeError):  # no source available, rely on the version alone
+        return b""
+
+
+def cache_key(content: "bytes | mmap.mmap", parser: Callable, version: int) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{parser.__module__}.{parser.__qualname__}:{version}\n".encode())
+    digest.update(parser_source(parser))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def _entry_path(key: str, directory: Path) -> Path:
+    return directory / f"{key}.pickle"
+
+
+def load(key: str, directory: Path = CACHE_DIR) -> Optional[tuple[bool, Any]]:
+    """Return the cached `(lazy, value)` pair, or `None` on a miss."""
+    path = _entry_path(key, directory)
+    try:
+        with open(path, "rb") as fh:
+            entry = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception:  # stale or unreadable entries (e.g. a renamed class) are misses
+        path.unlink(missing_ok=True)
+        return None
+    os.utime(path)  # mark as recently used
+    return entry
+
+
+def store(key: str, entry: tuple[bool, Any], directory: Path = CACHE_DIR) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first, as several workers may store at once
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False, suffix=".tmp") as fh:
+        pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(fh.name, _entry_path(key, directory))
+    evict(directory)
+
+
+def entries(directory: Path = CACHE_DIR) -> list[tuple[Path, os.stat_result]]:
+    if not directory.exists():
+        return []
+    return [(path, path.stat()) for path in directory.glob("*.pickle")]
+
+
+def evict(directory: Path = CACHE_DIR, max_size: int = MAX_SIZE) -> None:
+    """Delete the least recently used entries until the cache fits into `max_size`."""
+    found = sorted(entries(directory), key=lambda entry: entry[1].st_mtime)
+    total = sum(stat.st_size for _, stat in found)
+    for path, stat in found:
+        if total <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total -= stat.st_size
+
+
+def clear(directory: Path = CACHE_DIR) -> None:
+    for path, _ in entries(directory):
+        path.unlink(missing_ok=True)
+
+
+def cached(version: int = 1) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """Cache a `given()` that reads the module's `FILE_TO_READ`.
+
+    Input from stdin ("-", which some 2020 days accept) can only be read once, so
+    it is always parsed directly.
+    """
+
+    def decorate(given: Callable[[], Any]) -> Callable[[], Any]:
+        @functools.wraps(given)
+        def wrapper():
+            # Looked up on every call, as it may be pointed to another input
+            source = given.__globals__["FILE_TO_READ"]
+            if not _enabled or str(source) == "-":
+                return given()
+            content = read_input(source).data
+            key = cache_key(content, given, version)
+            entry = _load_cached(key)
+            if entry is None:
+                result = given()
+                lazy = inspect.isgenerator(result)
+                entry = (lazy, list(result) if lazy else result)
+                store(key, entry)
+                if _memory is not None:
+                    _remember(key, entry)
+            lazy, value = entry
+            return iter(value) if lazy else value
+
+        return wrapper
+
+    return decorate
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "info"
+    if command == "clear":
+        clear()
+        print(f"Cleared {CACHE_DIR}")
+    elif command == "info":
+        found = entries()
+        total = sum(stat.st_size for _, stat in found)
+        print(f"{CACHE_DIR}: {len(found)} entries, {mf(total)} of {mf(MAX_SIZE)}")
+    else:
+        sys.exit(__doc__)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Counters for the hot loops of the search-based days.
+
+A search reports how much work it did, so that a slow part can be told apart as
+an algorithmic blowup (far more states than the puzzle has, or a queue that keeps
+growing) or as a constant-factor slowdown (a sensible number of states that are
+each expensive). The usual counters are
+
+    expanded      states taken off the queue (or frontier) and expanded
+    deduplicated  successors dropped because they were seen before
+    stale pops    queue entries skipped because their state was already expanded
+    queue peak    high-water mark of the queue (or frontier)
+    cache hits    lookups answered by a memo table
+
+Counting is off unless switched on with `enable()` (the runner's `--counters`) or
+`ADVENT_COUNTERS=1`. Days guard their calls, per batch of states where they can:
+
+    from advent import counters
+
+    if counters.enabled:
+        counters.add("expanded", len(frontier))
+        counters.peak("queue peak", len(frontier))
+
+so a disabled run only pays for the check of `counters.enabled`.
+
+The values are kept per thread, so parts solved side by side in threads (see
+`advent.batch --threads`) each reset and read only their own counts.
+"""
+
+import os
+import threading
+
+enabled = os.environ.get("ADVENT_COUNTERS", "0") != "0"
+_local = threading.local()
+
+
+def _values() -> dict[str, int]:
+    """The calling thread's counters."""
+    try:
+        return _local.values
+    except AttributeError:
+        _local.values = {}
+        return _local.values
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def add(name: str, amount: int = 1) -> None:
+    values = _values()
+    values[name] = values.get(name, 0) + amount
+
+
+def peak(name: str, value: int) -> None:
+    """Raise the high-water mark `name` to `value`, if it is higher."""
+    values = _values()
+    if value > values.get(name, 0):
+        values[name] = value
+
+
+def reset() -> None:
+    _values().clear()
+
+
+def snapshot() -> dict[str, int]:
+    return dict(_values())
+
+
+def describe(values: dict[str, int]) -> str:
+    return ", ".join(f"{name} {value:,}" for name, value in values.items())
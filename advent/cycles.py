@@ -0,0 +1,146 @@
+"""Cycle detection for simulations that eventually repeat a state.
+
+A simulation is a `start` state and a `step` function returning the next state
+(without changing the one it got). Once some state comes up again, everything
+after it repeats, so the state after any number of steps can be looked up instead
+of simulated:
+
+    cycle = brent(dish, spin)           # Cycle(offset=3, period=7)
+    cycle.equivalent(1_000_000_000)     # an early step with the same state
+    fast_forward(dish, spin, 1_000_000_000, key=Dish.key)
+
+States are compared by `key(state)`, which should be compact and hashable (e.g.
+`Grid.key()`, the bytes of the cells); by default the states themselves are used.
+
+- `find_cycle` remembers the key of every state in a dict and returns the states
+  seen, so jumping ahead needs no further steps. Memory grows with offset + period.
+- `floyd` and `brent` keep only a few states and step the simulation again
+  instead: Floyd about three times offset + period steps, Brent fewer. Use them
+  when states are large or the cycle is long.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from advent import counters
+
+State = TypeVar("State")
+
+
+@dataclass(frozen=True)
+class Cycle:
+    """From step `offset` on, the states repeat every `period` steps."""
+
+    offset: int
+    period: int
+
+    def equivalent(self, n: int) -> int:
+        """The step before the first repetition that has the same state as step `n`."""
+        if n < self.offset:
+            return n
+        return self.offset + (n - self.offset) % self.period
+
+
+@dataclass
+class History(Generic[State]):
+    """The states up to the first repetition, as found by `find_cycle`."""
+
+    cycle: Cycle
+    states: list[State]
+
+    def state(self, n: int) -> State:
+        return self.states[self.cycle.equivalent(n)]
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def find_cycle(
+    start: State,
+    step: Callable[[State], State],
+    key: Callable[[State], Any] = _identity,
+    limit: Optional[int] = None,
+) -> History[State]:
+    """Step until a state repeats, remembering every state on the way.
+
+    With `limit`, stop after that many steps even without a repetition; the
+    returned cycle then has period 0 and only the states seen can be looked up.
+    """
+    seen: dict[Any, int] = {}
+    states: list[State] = []
+    state = start
+    while limit is None or len(states) <= limit:
+        state_key = key(state)
+        if state_key in seen:
+            offset = seen[state_key]
+            return History(Cycle(offset, len(states) - offset), states)
+        seen[state_key] = len(states)
+        states.append(state)
+        state = step(state)
+        if counters.enabled:
+            counters.add("expanded")
+    return History(Cycle(len(states), 0), states)
+
+
+def floyd(
+    start: State, step: Callable[[State], State], key: Callable[[State], Any] = _identity
+) -> Cycle:
+    """Floyd's tortoise and hare: constant memory."""
+    # Find a step i at which state i equals state 2i; i is then a multiple of the period
+    tortoise, hare = step(start), step(step(start))
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(step(hare))
+    # The cycle starts where a walker from the start meets one from step i
+    offset, tortoise = 0, start
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        offset += 1
+    # Walk once around the cycle to measure it
+    period, hare = 1, step(tortoise)
+    while key(tortoise) != key(hare):
+        hare = step(hare)
+        period += 1
+    return Cycle(offset, period)
+
+
+def brent(
+    start: State, step: Callable[[State], State], key: Callable[[State], Any] = _identity
+) -> Cycle:
+    """Brent's algorithm: constant memory and fewer steps than Floyd's."""
+    # Compare against states at powers of two until the period is found
+    power = period = 1
+    tortoise, hare = start, step(start)
+    while key(tortoise) != key(hare):
+        if power == period:
+            tortoise = hare
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+    # Two walkers `period` steps apart meet at the start of the cycle
+    tortoise = hare = start
+    for _ in range(period):
+        hare = step(hare)
+    offset = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        offset += 1
+    return Cycle(offset, period)
+
+
+def fast_forward(
+    start: State,
+    step: Callable[[State], State],
+    n: int,
+    key: Callable[[State], Any] = _identity,
+    method: str = "hash",
+) -> State:
+    """The state after `n` steps. `method` is "hash", "floyd" or "brent"."""
+    if method == "hash":
+        return find_cycle(start, step, key, limit=n).state(n)
+    cycle = {"floyd": floyd, "brent": brent}[method](start, step, key)
+    state = start
+    for _ in range(cycle.equivalent(n)):
+        state = step(state)
+    return state
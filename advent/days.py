@@ -0,0 +1,127 @@
+"""Discovery and loading of the per-day solution modules.
+
+A day module is any `<year>/<NN>.py` that defines both `part_one` and `part_two`.
+Discovery only parses the source, so scripts that still do their work at import
+time are never executed; `skipped()` lists them, so that they are not left out
+silently.
+"""
+
+import ast
+import contextlib
+import importlib.util
+import inspect
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = ("part_one", "part_two")
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day:02d}"
+
+    @property
+    def module_name(self) -> str:
+        return f"day_{self.year}_{self.day:02d}"
+
+
+def defines_parts(path: Path) -> bool:
+    """Check (without importing) whether the file defines all solution parts."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    defined = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return all(part in defined for part in PARTS)
+
+
+def matches(day: Day, selectors: Optional[Iterable[str]]) -> bool:
+    """Selectors are either a year ("2023") or a single day ("2023/05")."""
+    if not selectors:
+        return True
+    return any(sel in (str(day.year), day.name) for sel in selectors)
+
+
+def candidates(root: Path = ROOT, selectors: Optional[Iterable[str]] = None) -> list[Day]:
+    """Every `<year>/<NN>.py` matching the selectors, whether it defines the parts or not."""
+    days = []
+    for year_dir in root.iterdir():
+        if not year_dir.is_dir() or not re.fullmatch(r"\d{4}", year_dir.name):
+            continue
+        for path in year_dir.glob("*.py"):
+            if not re.fullmatch(r"\d{2}\.py", path.name):
+                continue
+            day = Day(int(year_dir.name), int(path.stem), path)
+            if matches(day, selectors):
+                days.append(day)
+    return sorted(days)
+
+
+def discover(root: Path = ROOT, selectors: Optional[Iterable[str]] = None) -> list[Day]:
+    return [day for day in candidates(root, selectors) if defines_parts(day.path)]
+
+
+def skipped(root: Path = ROOT, selectors: Optional[Iterable[str]] = None) -> list[Day]:
+    """The day files that `discover` leaves out, as they lack `part_one` or `part_two`."""
+    return [day for day in candidates(root, selectors) if not defines_parts(day.path)]
+
+
+@contextlib.contextmanager
+def working_directory(path: Path) -> Iterator[None]:
+    """The days open their input relative to their own directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def load(day: Day, module_name: Optional[str] = None) -> ModuleType:
+    """Import a day. Pass another `module_name` to load a second version of it."""
+    module_name = module_name or day.module_name
+    spec = importlib.util.spec_from_file_location(module_name, day.path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that objects of the day's classes can be pickled
+    sys.modules[module_name] = module
+    with working_directory(day.path.parent):
+        spec.loader.exec_module(module)
+    return module
+
+
+def takes_input(module: ModuleType) -> bool:
+    """Whether all parts take the parsed input instead of reading it themselves."""
+    return all(inspect.signature(getattr(module, part)).parameters for part in PARTS)
+
+
+def solve(
+    module: ModuleType, part: str, given: Optional[Callable[[], Any]] = None
+) -> Any:
+    return call(module, getattr(module, part), given)
+
+
+def call(
+    module: ModuleType, function: Callable, given: Optional[Callable[[], Any]] = None
+) -> Any:
+    """Call a part, feeding it the parsed input if it expects one.
+
+    The 2023 parts read their input themselves, while the 2020 and 2024 parts take
+    the result of the module's `given()` (unpacked if they take several arguments).
+    Pass `given` to parse the input some other way.
+    """
+    parameters = inspect.signature(function).parameters
+    if not parameters:
+        return function()
+    given = (given or module.given)()
+    if len(parameters) > 1:
+        return function(*given)
+    return function(given)
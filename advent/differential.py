@@ -0,0 +1,267 @@
+"""Differential testing: compare implementations of a part on generated inputs.
+
+A day's reference implementations are its `part_one` and `part_two`. The candidates
+compared against them are
+
+- other implementations in the day module itself, marked with
+  `@alternative("part_one")` (e.g. a vectorised version next to the readable one),
+- with `--against REV`, the day as it is in the working tree, while the day as it
+  was in git revision REV becomes the reference. This checks that an optimisation
+  did not change any answer.
+
+Each selected day with an input generator (see `advent.generators`) is run on
+`--seeds` generated inputs of the day's default size (or `--size`), and with
+`--real` on its real input too. Differing answers are reported with the seed and
+size that reproduce them; `--keep DIR` also saves those inputs. Parts where the
+reference is not implemented are skipped, as there is nothing to compare with,
+while a candidate failing where the reference answers is a mismatch. Runs where
+the reference fails or times out are counted, and a day whose reference failed on
+every input, or whose revision cannot even be imported (like the script-style days
+of the first commits), is reported as having an unusable reference rather than
+passing with 0 comparisons. Both mismatches and unusable references make the exit
+status 1.
+
+Usage: python -m advent.differential [YEAR | YEAR/DAY ...] [--against REV] [--seeds N]
+                                     [--size N] [--real] [--timeout SECONDS] [--keep DIR]
+"""
+
+import argparse
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Optional
+
+from advent import cache
+from advent.days import PARTS, ROOT, Day, call, discover, load, working_directory
+from advent.generators import GENERATORS, generate
+from advent.golden import NOT_IMPLEMENTED
+from advent.runner import PartResult
+# `alternative` lives in the light `advent.util`, so that days can import it cheaply
+from advent.util import PartTimeout, alternative, time_limit
+
+
+@dataclass
+class Implementation:
+    name: str
+    module: ModuleType
+    function: Callable
+
+
+class UnusableReference(Exception):
+    """The day as it was in the `--against` revision cannot serve as the reference."""
+
+
+@dataclass
+class Failure:
+    part: str
+    source: str
+    result: PartResult
+
+
+@dataclass
+class Mismatch:
+    day: Day
+    part: str
+    source: str
+    reference: Implementation
+    expected: PartResult
+    candidate: Implementation
+    actual: PartResult
+
+    def describe(self) -> str:
+        return (
+            f"{self.day.name} {self.part} on {self.source}: "
+            f"{self.reference.name} = {self.expected.describe()}, "
+            f"{self.candidate.name} = {self.actual.describe()}"
+        )
+
+
+def alternatives(module: ModuleType, part: str) -> list[Implementation]:
+    return [
+        Implementation(name, module, value)
+        for name, value in vars(module).items()
+        if callable(value) and getattr(value, "alternative_of", None) == part
+    ]
+
+
+def load_revision(day: Day, revision: str, directory: Path) -> Optional[ModuleType]:
+    """Import the day as it was in a git revision, or None if it did not exist.
+
+    Raises `UnusableReference` if that version cannot be imported or has no parts.
+    """
+    relative = day.path.relative_to(ROOT).as_posix()
+    shown = subprocess.run(
+        ["git", "show", f"{revision}:{relative}"], cwd=ROOT, capture_output=True
+    )
+    if shown.returncode != 0:
+        return None
+    path = directory / day.path.name
+    path.write_bytes(shown.stdout)
+    suffix = re.sub(r"\W", "_", revision)
+    try:
+        # Early revisions read sys.argv and solve at import time
+        module = load(Day(day.year, day.day, path), f"{day.module_name}_at_{suffix}")
+    except (Exception, SystemExit) as exc:
+        raise UnusableReference(
+            f"{revision} fails to import ({type(exc).__name__}: {exc})"
+        ) from exc
+    missing = [part for part in PARTS if not callable(getattr(module, part, None))]
+    if missing:
+        raise UnusableReference(f"{revision} has no {', '.join(missing)}")
+    return module
+
+
+def implementations(
+    day: Day, revision: Optional[str], directory: Path
+) -> dict[str, list[Implementation]]:
+    """Per part the implementations to compare, the reference first."""
+    current = load(day)
+    old = load_revision(day, revision, directory) if revision else None
+    result = {}
+    for part in PARTS:
+        found = [Implementation(part, current, getattr(current, part))]
+        found += alternatives(current, part)
+        if old is not None:
+            found.insert(0, Implementation(f"{part}@{revision}", old, getattr(old, part)))
+        result[part] = found
+    return result
+
+
+def attempt(implementation: Implementation, timeout: Optional[float]) -> PartResult:
+    result = PartResult()
+    t0 = time.perf_counter()
+    try:
+        with time_limit(timeout):
+            result.answer = str(call(implementation.module, implementation.function))
+    except PartTimeout:
+        result.error = f"timeout: no answer after {timeout} s"
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.seconds = time.perf_counter() - t0
+    return result
+
+
+def compare_day(
+    day: Day,
+    inputs: dict[str, Path],
+    revision: Optional[str],
+    timeout: Optional[float],
+) -> tuple[int, list[Mismatch], list[Failure]]:
+    """Run all implementations on all inputs; return the comparisons made, the
+    mismatches and the runs where the reference itself failed."""
+    comparisons = 0
+    mismatches = []
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp, working_directory(day.path.parent):
+        found = implementations(day, revision, Path(tmp))
+        modules = {impl.module for impls in found.values() for impl in impls}
+        for source, path in inputs.items():
+            for module in modules:
+                module.FILE_TO_READ = str(path)
+            for part, (reference, *candidates) in found.items():
+                if not candidates:
+                    continue
+                expected = attempt(reference, timeout)
+                if expected.error is not None:
+                    failures.append(Failure(part, source, expected))
+                    continue
+                if expected.answer == NOT_IMPLEMENTED:
+                    continue
+                for candidate in candidates:
+                    actual = attempt(candidate, timeout)
+                    comparisons += 1
+                    if actual.error is not None or actual.answer != expected.answer:
+                        mismatches.append(
+                            Mismatch(day, part, source, reference, expected, candidate, actual)
+                        )
+    return comparisons, mismatches, failures
+
+
+def generated_inputs(
+    day: Day, seeds: int, size: Optional[int], directory: Path
+) -> dict[str, Path]:
+    size = size or GENERATORS[(day.year, day.day)][1]
+    inputs = {}
+    for seed in range(seeds):
+        path = directory / f"{day.year}_{day.day:02d}_size{size}_seed{seed}"
+        path.write_text(generate(day.year, day.day, size, seed))
+        inputs[f"size {size}, seed {seed}"] = path
+    return inputs
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.differential", description=__doc__)
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2023/14")
+    parser.add_argument("--against", metavar="REV", help="git revision of the reference")
+    parser.add_argument("--seeds", type=int, default=5, help="generated inputs per day")
+    parser.add_argument("--size", type=int, help="size of the generated inputs")
+    parser.add_argument("--real", action="store_true", help="also compare on the real input")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--keep", type=Path, metavar="DIR", help="save mismatching inputs")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = [d for d in discover(selectors=args.days) if (d.year, d.day) in GENERATORS]
+    if not days:
+        sys.exit("No days with an input generator found.")
+
+    # Every input is new, so caching the parsed ones would only fill the disk
+    cache.set_enabled(False)
+    mismatches: list[Mismatch] = []
+    unusable: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for day in days:
+            inputs = generated_inputs(day, args.seeds, args.size, Path(tmp))
+            real = day.path.parent / f"{day.day:02d}_input"
+            if args.real and real.exists():
+                inputs["real input"] = real
+            try:
+                comparisons, found, failures = compare_day(
+                    day, inputs, args.against, args.timeout
+                )
+            except UnusableReference as exc:
+                print(f"{day.name}: reference unusable, {exc}")
+                unusable.append(f"{day.name}: {exc}")
+                continue
+            if failures and not comparisons:
+                first = failures[0]
+                reason = (
+                    f"it failed on all {len(failures)} runs, "
+                    f"e.g. {first.part} on {first.source} ({first.result.error})"
+                )
+                print(f"{day.name}: reference unusable, {reason}")
+                unusable.append(f"{day.name}: {reason}")
+                continue
+            failed = f", reference failed on {len(failures)} runs" if failures else ""
+            print(
+                f"{day.name}: {comparisons} comparisons on {len(inputs)} inputs, "
+                f"{len(found)} mismatches{failed}"
+            )
+            mismatches += found
+            if args.keep:
+                args.keep.mkdir(parents=True, exist_ok=True)
+                for source in {m.source for m in found}:
+                    shutil.copy(inputs[source], args.keep)
+
+    if mismatches:
+        print("\nMismatches:")
+        for mismatch in mismatches:
+            print(f"  {mismatch.describe()}")
+    if unusable:
+        print("\nUnusable references:")
+        for reason in unusable:
+            print(f"  {reason}")
+    if mismatches or unusable:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Throughput of one day over many inputs, fanned out to threads or processes.
+
+The inputs are solved with `advent.batch` by 1, 2, 4 and 8 (`--workers`) threads
+and by as many processes, and the table shows inputs per second and the speedup
+over a single worker of the same kind. Without a directory or manifest of inputs,
+`--count` inputs of `--size` are generated (see `advent.generators`).
+
+Threads scale only where the GIL is released or absent. The build column says
+which interpreter ran: "GIL" for standard CPython, "free-threaded" for a build
+without the GIL (python3.13t and later; "free-threaded, GIL on" if the GIL was
+switched back on, e.g. by an extension module that does not support running
+without it). Free-threaded interpreters found on the PATH, and those passed with
+`--python`, measure the threads once more in a subprocess; their rows are added
+to the table. For a CPU-bound day like 2023/16, whose second part energizes the
+contraption once per edge tile, a thread speedup on the free-threaded build
+that matches the process speedup means threads are the cheaper fan-out; no
+speedup under the GIL means processes are the only one.
+
+Usage: python -m advent.fanout YEAR/DAY [DIRECTORY | MANIFEST] [--workers N ...]
+                               [--pools {thread,process} ...] [--count N]
+                               [--size N] [--python EXECUTABLE ...] [--json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from advent.batch import input_paths, solve_all, solve_threaded
+from advent.days import Day, discover, load
+from advent.generators import GENERATORS, generate
+from advent.util import finish_lazy_imports, tf
+
+ROOT = Path(__file__).resolve().parent.parent
+POOLS = ("thread", "process")
+# Looked up on the PATH when no `--python` is given
+FREE_THREADED = ("python3.13t", "python3.14t", "python3t")
+
+
+@dataclass
+class Measurement:
+    build: str
+    pool: str
+    workers: int
+    inputs: int
+    seconds: float
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.inputs / self.seconds
+
+
+def build() -> str:
+    """Whether this interpreter runs with the GIL."""
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "GIL"
+    if sys._is_gil_enabled():
+        return "free-threaded, GIL on"
+    return "free-threaded"
+
+
+def free_threaded_pythons() -> list[str]:
+    found = {}
+    for name in FREE_THREADED:
+        path = shutil.which(name)
+        if path and os.path.realpath(path) != os.path.realpath(sys.executable):
+            found.setdefault(os.path.realpath(path), path)
+    return list(found.values())
+
+
+def generate_inputs(day: Day, count: int, size: Optional[int], directory: Path) -> list[Path]:
+    _, default_size = GENERATORS[(day.year, day.day)]
+    paths = []
+    for seed in range(count):
+        path = directory / f"{seed:03}"
+        path.write_text(generate(day.year, day.day, size or default_size, seed))
+        paths.append(path)
+    return paths
+
+
+def measure(day: Day, paths: list[Path], pool: str, workers: int) -> Measurement:
+    t0 = time.perf_counter()
+    if pool == "thread":
+        records = list(solve_threaded(day, paths, workers))
+    else:
+        records = list(solve_all(day, paths, workers, chunksize=1))
+    seconds = time.perf_counter() - t0
+    errors = sum("errors" in record for record in records)
+    return Measurement(build(), pool, workers, len(paths), seconds, errors)
+
+
+def measure_elsewhere(
+    python: str, day: Day, inputs: Path, workers: list[int]
+) -> tuple[list[Measurement], Optional[str]]:
+    """Measure the threads under another interpreter, returning its rows or an error."""
+    command = [python, "-m", "advent.fanout", day.name, str(inputs), "--pools", "thread", "--json"]
+    command += ["--workers", *map(str, workers)]
+    process = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+    if process.returncode != 0:
+        lines = process.stderr.strip().splitlines() or [f"exit status {process.returncode}"]
+        return [], lines[-1]
+    return [Measurement(**json.loads(line)) for line in process.stdout.splitlines()], None
+
+
+def print_table(measurements: list[Measurement]) -> None:
+    single = {
+        (m.build, m.pool): m.throughput for m in measurements if m.workers == 1 and not m.errors
+    }
+    header = ["Build", "Pool", "Workers", "Wall", "Inputs/s", "Speedup", "Errors"]
+    rows = []
+    for m in measurements:
+        base = single.get((m.build, m.pool))
+        speedup = f"{m.throughput / base:.2f}x" if base else "-"
+        rows.append(
+            [m.build, m.pool, str(m.workers), tf(m.seconds), f"{m.throughput:.2f}", speedup]
+            + [str(m.errors) if m.errors else ""]
+        )
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for row in [header, ["=" * w for w in widths]] + rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.fanout", description=__doc__)
+    parser.add_argument("day", help="the day to solve, e.g. 2023/16")
+    parser.add_argument(
+        "inputs", type=Path, nargs="?", help="directory of inputs or manifest file"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="pool sizes to measure"
+    )
+    parser.add_argument("--pools", nargs="+", choices=POOLS, default=list(POOLS))
+    parser.add_argument("--count", type=int, default=16, help="inputs to generate")
+    parser.add_argument("--size", type=int, help="size of the generated inputs")
+    parser.add_argument(
+        "--python", nargs="+", default=None, help="other interpreters to measure threads with"
+    )
+    parser.add_argument("--json", action="store_true", help="print one measurement per line")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=[args.day])
+    if len(days) != 1:
+        sys.exit(f"No single day matches {args.day}.")
+    day = days[0]
+    if not hasattr(load(day), "FILE_TO_READ"):
+        sys.exit(f"{day.name} has no FILE_TO_READ, so it cannot be pointed to other inputs.")
+    if args.inputs is None and (day.year, day.day) not in GENERATORS:
+        sys.exit(f"No generator for {day.name}; pass a directory of inputs.")
+    # Paid once per process, so not by the first thread pool alone
+    finish_lazy_imports()
+
+    with tempfile.TemporaryDirectory(prefix="advent-fanout-") as directory:
+        inputs = args.inputs.resolve() if args.inputs else Path(directory)
+        if args.inputs:
+            paths = input_paths(inputs)
+        else:
+            paths = generate_inputs(day, args.count, args.size, inputs)
+
+        measurements = [
+            measure(day, paths, pool, workers) for pool in args.pools for workers in args.workers
+        ]
+        if args.json:
+            for m in measurements:
+                print(json.dumps(asdict(m)))
+            return
+
+        failures = []
+        pythons = free_threaded_pythons() if args.python is None else args.python
+        for python in pythons:
+            rows, error = measure_elsewhere(python, day, inputs, args.workers)
+            measurements += rows
+            if error:
+                failures.append(f"{python}: {error}")
+
+    print(f"{day.name}: {len(paths)} inputs, {os.cpu_count()} CPUs\n")
+    print_table(measurements)
+    if not pythons:
+        print(f"\nNo free-threaded interpreter found ({', '.join(FREE_THREADED)}); see --python.")
+    for failure in failures:
+        print(f"\nFailed: {failure}")
+
+
+if __name__ == "__main__":
+    main()
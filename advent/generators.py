@@ -0,0 +1,427 @@
+"""Seeded generators for synthetic puzzle inputs of arbitrary size.
+
+Each generator takes a `random.Random` and a size and returns the full input text
+in the format of the real puzzle input. What "size" means depends on the day (it
+is documented per generator): lines, records, or the side length of a grid.
+
+Usage: python -m advent.generators YEAR/DAY SIZE [--seed N] [--output FILE]
+"""
+
+import argparse
+import itertools
+import math
+import random
+import string
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+Generator = Callable[[random.Random, int], str]
+
+# (year, day) -> (generator, default size for scaling runs)
+GENERATORS: dict[tuple[int, int], tuple[Generator, int]] = {}
+
+
+def generator(year: int, day: int, default_size: int) -> Callable[[Generator], Generator]:
+    def register(function: Generator) -> Generator:
+        GENERATORS[(year, day)] = (function, default_size)
+        return function
+
+    return register
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    function, _ = GENERATORS[(year, day)]
+    return function(random.Random(seed), size)
+
+
+def lines(rows: list[str]) -> str:
+    return "\n".join(rows) + "\n"
+
+
+def random_word(rng: random.Random, low: int, high: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(low, high)))
+
+
+# --- 2023 --- #
+
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1, 20_000)
+def calibration_document(rng: random.Random, size: int) -> str:
+    """`size` lines of letters, digit words and (at least one) digit."""
+    rows = []
+    for _ in range(size):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            choice = rng.random()
+            if choice < 0.3:
+                tokens.append(str(rng.randint(1, 9)))
+            elif choice < 0.6:
+                tokens.append(rng.choice(DIGIT_WORDS))
+            else:
+                tokens.append(random_word(rng, 1, 5))
+        rng.shuffle(tokens)
+        rows.append("".join(tokens))
+    return lines(rows)
+
+
+@generator(2023, 2, 10_000)
+def cube_games(rng: random.Random, size: int) -> str:
+    """`size` games of one to six draws each."""
+    rows = []
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        rows.append(f"Game {game_id}: " + "; ".join(draws))
+    return lines(rows)
+
+
+@generator(2023, 3, 200)
+def engine_schematic(rng: random.Random, size: int) -> str:
+    """A `size` x `size` schematic of numbers, symbols and dots."""
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            choice = rng.random()
+            if choice < 0.1:
+                row += str(rng.randint(1, 999)) + "."
+            elif choice < 0.14:
+                row += rng.choice("*#+$/=%@&-")
+            else:
+                row += "."
+        rows.append(row[:size])
+    return lines(rows)
+
+
+@generator(2023, 4, 20_000)
+def scratchcards(rng: random.Random, size: int) -> str:
+    """`size` cards with ten winning and 25 own numbers; wins never pass the last card."""
+    rows = []
+    for card_no in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        # Mostly losing cards, so the number of copies stays bounded
+        wins = rng.choices([0, 1, 2, 3, 4, 5], weights=[60, 20, 10, 5, 3, 2])[0]
+        wins = min(wins, size - card_no)
+        mine = winning[:wins] + others[: 25 - wins]
+        rng.shuffle(mine)
+        rows.append(
+            f"Card {card_no:3d}: "
+            + " ".join(f"{n:2d}" for n in winning)
+            + " | "
+            + " ".join(f"{n:2d}" for n in mine)
+        )
+    return lines(rows)
+
+
+ALMANAC_LEVELS = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+
+@generator(2023, 5, 200)
+def almanac(rng: random.Random, size: int) -> str:
+    """`size` seed ranges and `size` non-overlapping mappings per map."""
+    limit = 2**32
+    seeds = []
+    for _ in range(size):
+        start = rng.randrange(limit)
+        seeds += [start, rng.randint(1, limit // (size * 16) + 1)]
+    rows = ["seeds: " + " ".join(map(str, seeds)), ""]
+    for source, target in itertools.pairwise(ALMANAC_LEVELS):
+        rows.append(f"{source}-to-{target} map:")
+        # Disjoint source ranges from sorted cut points
+        cuts = sorted(rng.sample(range(limit), 2 * size))
+        for source_start, source_stop in zip(cuts[::2], cuts[1::2]):
+            length = source_stop - source_start
+            dest_start = rng.randrange(limit - length)
+            rows.append(f"{dest_start} {source_start} {length}")
+        rows.append("")
+    return lines(rows[:-1])
+
+
+@generator(2023, 6, 1_000_000)
+def boat_race(rng: random.Random, size: int) -> str:
+    """A single race lasting `size` ms (part two reads the same race)."""
+    best = (size // 2) * (size - size // 2)
+    record = rng.randrange(best // 2, best)
+    return lines([f"{'Time:':<11}{size:>16}", f"{'Distance:':<11}{record:>16}"])
+
+
+@generator(2023, 7, 2_000)
+def camel_cards(rng: random.Random, size: int) -> str:
+    """`size` hands with bids."""
+    labels = "23456789TJQKA"
+    rows = []
+    for _ in range(size):
+        hand = "".join(rng.choices(labels, k=5))
+        rows.append(f"{hand} {rng.randint(1, 1000)}")
+    return lines(rows)
+
+
+def node_name(number: int, width: int, suffix: str) -> str:
+    """Unique node name ending in `suffix`; other names never end in A or Z."""
+    name = ""
+    for _ in range(width - 1):
+        number, digit = divmod(number, 26)
+        name += string.ascii_uppercase[digit]
+    return name + suffix
+
+
+@generator(2023, 8, 2_000)
+def haunted_network(rng: random.Random, size: int) -> str:
+    """About `size` nodes forming six ghost loops of coprime lengths (AAA to ZZZ is one).
+
+    Like in the real input, each loop length is a multiple of the instruction count
+    and the Z node leads to the same nodes as the A node it started from.
+    """
+    primes = rng.sample([43, 47, 53, 59, 61, 67, 71, 73, 79], 6)
+    instruction_count = max(1, size // sum(primes))
+    instructions = "".join(rng.choices("LR", k=instruction_count))
+
+    width = 1 + max(2, math.ceil(math.log(size + 1, 26)))
+    serial = itertools.count(1)
+    nodes: dict[str, tuple[str, str]] = {}
+    for ghost, prime in enumerate(primes):
+        if ghost == 0:
+            start, end = "AAA", "ZZZ"
+        else:
+            number = next(serial)
+            start, end = node_name(number, width, "A"), node_name(number, width, "Z")
+        loop = [node_name(next(serial), width, "B") for _ in range(prime * instruction_count - 1)]
+        loop.append(end)
+        for here, there in itertools.pairwise(loop):
+            nodes[here] = (there, there)
+        nodes[start] = nodes[end] = (loop[0], loop[0])
+
+    names = list(nodes)
+    rng.shuffle(names)
+    rows = [instructions, ""]
+    rows += [f"{name} = ({nodes[name][0]}, {nodes[name][1]})" for name in names]
+    return lines(rows)
+
+
+@generator(2023, 9, 5_000)
+def oasis_report(rng: random.Random, size: int) -> str:
+    """`size` histories of 21 values of a random polynomial of degree up to five."""
+    rows = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(21)]
+        rows.append(" ".join(map(str, values)))
+    return lines(rows)
+
+
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+
+
+def direction(origin: tuple[int, int], target: tuple[int, int]) -> str:
+    return {(-1, 0): "N", (1, 0): "S", (0, 1): "E", (0, -1): "W"}[
+        (target[0] - origin[0], target[1] - origin[1])
+    ]
+
+
+@generator(2023, 10, 60)
+def pipe_maze(rng: random.Random, size: int) -> str:
+    """A `size` x `size` field of junk pipes with a serpentine loop through S."""
+    size = max(size, 5)
+    height = max(2, rng.randint(size // 2, size) // 2 * 2)
+    width = max(3, rng.randint(size // 2, size))
+    # The loop may touch any edge of the field
+    top, left = rng.randint(0, size - height), rng.randint(0, size - width)
+
+    # Along the top, snake down row by row, then back up the left column
+    loop = [(0, c) for c in range(width)]
+    for r in range(1, height):
+        columns = range(width - 1, 0, -1) if r % 2 else range(1, width)
+        loop += [(r, c) for c in columns]
+    loop += [(r, 0) for r in range(height - 1, 0, -1)]
+
+    field = [[rng.choice("|-LJ7F.") for _ in range(size)] for _ in range(size)]
+    for i, (r, c) in enumerate(loop):
+        connections = {direction((r, c), loop[i - 1]), direction((r, c), loop[(i + 1) % len(loop)])}
+        field[top + r][left + c] = PIPES[frozenset(connections)]
+
+    # S connects to everything around it, so clear the junk next to it
+    s_row, s_col = top, left + rng.randrange(width)
+    field[s_row][s_col] = "S"
+    for d_row, d_col in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        r, c = s_row + d_row, s_col + d_col
+        if 0 <= r < size and 0 <= c < size and (r - top, c - left) not in loop:
+            field[r][c] = "."
+    return lines(["".join(row) for row in field])
+
+
+@generator(2023, 11, 140)
+def galaxy_image(rng: random.Random, size: int) -> str:
+    """A `size` x `size` image with about 2% galaxies and some empty rows and columns."""
+    empty_rows = set(rng.sample(range(size), size // 15))
+    empty_cols = set(rng.sample(range(size), size // 15))
+    rows = []
+    for r in range(size):
+        row = ""
+        for c in range(size):
+            galaxy = r not in empty_rows and c not in empty_cols and rng.random() < 0.02
+            row += "#" if galaxy else "."
+        rows.append(row)
+    return lines(rows)
+
+
+@generator(2023, 12, 1_000)
+def spring_records(rng: random.Random, size: int) -> str:
+    """`size` records derived from a random arrangement with some cells unknown."""
+    rows = []
+    for _ in range(size):
+        springs = "".join(rng.choices("#.", weights=[4, 6], k=rng.randint(5, 20)))
+        if "#" not in springs:
+            springs = "#" + springs[1:]
+        groups = [len(group) for group in springs.split(".") if group]
+        record = "".join("?" if rng.random() < 0.4 else s for s in springs)
+        rows.append(f"{record} {','.join(map(str, groups))}")
+    return lines(rows)
+
+
+def mirror_mismatches(pattern: list[list[str]]) -> list[int]:
+    """For every possible mirror line (vertical, then horizontal), count the cell
+    pairs that differ. A single smudge changes each count by at most one."""
+    counts = []
+    for grid in (pattern, [list(col) for col in zip(*pattern)]):
+        for split in range(1, len(grid[0])):
+            span = min(split, len(grid[0]) - split)
+            counts.append(
+                sum(
+                    row[split - 1 - i] != row[split + i]
+                    for row in grid
+                    for i in range(span)
+                )
+            )
+    return counts
+
+
+@generator(2023, 13, 1_000)
+def mirror_patterns(rng: random.Random, size: int) -> str:
+    """`size` patterns with one mirror line, and another once a single smudge is fixed."""
+    patterns = []
+    while len(patterns) < size:
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        pattern = [rng.choices("#.", k=width) for _ in range(height)]
+        # Mirror the pattern along an off-center vertical line (kept by the smudge)...
+        col_split = rng.choice([s for s in range(1, width) if 2 * s != width])
+        col_span = min(col_split, width - col_split)
+        for row in pattern:
+            row[col_split : col_split + col_span] = row[col_split - col_span : col_split][::-1]
+        # ...and along a horizontal line (broken by the smudge)
+        row_split = rng.randint(1, height - 1)
+        row_span = min(row_split, height - row_split)
+        pattern[row_split : row_split + row_span] = [
+            row.copy() for row in pattern[row_split - row_span : row_split][::-1]
+        ]
+        # Smudge a cell mirrored horizontally, but not vertically
+        row = pattern[rng.randrange(row_split - row_span, row_split + row_span)]
+        col = rng.choice(
+            [c for c in range(width) if not col_split - col_span <= c < col_split + col_span]
+        )
+        row[col] = "#" if row[col] == "." else "."
+        if rng.random() < 0.5:
+            pattern = [list(col) for col in zip(*pattern)]
+        # Besides those two lines (0 and 1 mismatches), none may be a smudge away
+        if sorted(mirror_mismatches(pattern))[2] >= 2:
+            patterns.append("\n".join("".join(row) for row in pattern))
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(2023, 14, 100)
+def rock_dish(rng: random.Random, size: int) -> str:
+    """A `size` x `size` platform of rounded (O) and cube-shaped (#) rocks."""
+    rows = ["".join(rng.choices("O#.", weights=[20, 10, 70], k=size)) for _ in range(size)]
+    return lines(rows)
+
+
+@generator(2023, 15, 20_000)
+def initialization_sequence(rng: random.Random, size: int) -> str:
+    """`size` comma-separated steps on one line."""
+    labels = [random_word(rng, 2, 6) for _ in range(max(1, size // 4))]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-")
+    return lines([",".join(steps)])
+
+
+@generator(2023, 16, 30)
+def mirror_contraption(rng: random.Random, size: int) -> str:
+    """A `size` x `size` contraption, about 10% of which are mirrors and splitters."""
+    rows = []
+    for _ in range(size):
+        rows.append("".join(rng.choices("./\\|-", weights=[90, 3, 3, 2, 2], k=size)))
+    return lines(rows)
+
+
+@generator(2023, 17, 141)
+def city_blocks(rng: random.Random, size: int) -> str:
+    """A square `size` x `size` map of heat losses."""
+    return lines(["".join(rng.choices("123456789", k=size)) for _ in range(size)])
+
+
+@generator(2023, 18, 2_000)
+def dig_plan(rng: random.Random, size: int) -> str:
+    """A clockwise loop of about `size` instructions with a random skyline on top."""
+    segments = max(1, size // 2 - 1)
+    tops = [0] + [rng.randint(-20, 20) for _ in range(segments - 1)]
+    bottom = max(tops) + rng.randint(1, 20)
+
+    moves = []
+    for current, following in itertools.pairwise(tops + [bottom]):
+        moves.append(("R", rng.randint(1, 10)))
+        if following != current:
+            moves.append(("D" if following > current else "U", abs(following - current)))
+    width = sum(steps for heading, steps in moves if heading == "R")
+    moves += [("L", width), ("U", bottom)]
+
+    rows = [f"{heading} {steps} (#{rng.randrange(2**24):06x})" for heading, steps in moves]
+    return lines(rows)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.generators", description=__doc__)
+    parser.add_argument("day", help="e.g. 2023/05")
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="write to a file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    year, day = (int(part) for part in args.day.split("/"))
+    if (year, day) not in GENERATORS:
+        sys.exit(f"No generator for {args.day}.")
+    text = generate(year, day, args.size, args.seed)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Recorded answers for the real inputs, to catch changes that break a day.
+
+`record` runs the selected days and stores each part's answer in
+`answers/<year>.json`. `check` runs them again and exits with a nonzero status if
+any answer differs from the recorded one, or if a part with a recorded answer
+now fails. Parts that fail or are not implemented yet are not recorded.
+
+`record` only adds answers that are missing, unless `--force` is given, so an
+answer that was corrected by hand (e.g. for a day known to be wrong) stays and
+keeps `check` failing until the day is fixed.
+
+Usage: python -m advent.golden record [YEAR | YEAR/DAY ...] [--force] [--timeout SECONDS]
+       python -m advent.golden check [YEAR | YEAR/DAY ...] [--timeout SECONDS]
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from advent.days import PARTS, ROOT, Day, discover
+from advent.runner import DayResult, run_days
+
+ANSWER_DIR = ROOT / "answers"
+NOT_IMPLEMENTED = "NOT IMPLEMENTED"
+
+# Year -> day ("05") -> part -> answer
+Answers = dict[str, dict[str, str]]
+
+
+@dataclass
+class Mismatch:
+    day: Day
+    part: str
+    expected: str
+    actual: str
+
+    def describe(self) -> str:
+        return f"{self.day.name} {self.part}: expected {self.expected}, got {self.actual}"
+
+
+def answers_path(year: int, directory: Path = ANSWER_DIR) -> Path:
+    return directory / f"{year}.json"
+
+
+def load_answers(year: int, directory: Path = ANSWER_DIR) -> Answers:
+    path = answers_path(year, directory)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_answers(year: int, answers: Answers, directory: Path = ANSWER_DIR) -> None:
+    path = answers_path(year, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ordered = {day: answers[day] for day in sorted(answers)}
+    path.write_text(json.dumps(ordered, indent=2) + "\n")
+
+
+def solved(result: DayResult) -> dict[str, str]:
+    """The answers of the parts that finished with an actual answer."""
+    return {
+        part: res.answer
+        for part, res in result.parts.items()
+        if res.error is None and res.answer != NOT_IMPLEMENTED
+    }
+
+
+def record(results: list[DayResult], force: bool = False, directory: Path = ANSWER_DIR) -> int:
+    """Store the answers of the results, returning how many were added or changed."""
+    changed = 0
+    for year in sorted({res.day.year for res in results}):
+        answers = load_answers(year, directory)
+        for res in results:
+            if res.day.year != year:
+                continue
+            recorded = answers.setdefault(f"{res.day.day:02d}", {})
+            for part, answer in solved(res).items():
+                if recorded.get(part) == answer or (part in recorded and not force):
+                    continue
+                recorded[part] = answer
+                changed += 1
+        answers = {day: parts for day, parts in answers.items() if parts}
+        save_answers(year, answers, directory)
+    return changed
+
+
+def check(results: list[DayResult], directory: Path = ANSWER_DIR) -> list[Mismatch]:
+    mismatches = []
+    answers = {year: load_answers(year, directory) for year in {r.day.year for r in results}}
+    for res in results:
+        recorded = answers[res.day.year].get(f"{res.day.day:02d}", {})
+        for part in PARTS:
+            if part not in recorded:
+                continue
+            actual = res.parts[part]
+            if actual.error is not None:
+                mismatches.append(Mismatch(res.day, part, recorded[part], actual.describe()))
+            elif actual.answer != recorded[part]:
+                mismatches.append(Mismatch(res.day, part, recorded[part], actual.answer))
+    return mismatches
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.golden", description=__doc__)
+    parser.add_argument("mode", choices=["record", "check"])
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2024/05")
+    parser.add_argument("--force", action="store_true", help="overwrite recorded answers")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per part")
+    parser.add_argument("--directory", type=Path, default=ANSWER_DIR)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=args.days)
+    if not days:
+        sys.exit("No days found.")
+    results = run_days(days, args.jobs, args.timeout)
+
+    if args.mode == "record":
+        changed = record(results, args.force, args.directory)
+        print(f"Recorded {changed} answers in {args.directory}")
+        return
+    mismatches = check(results, args.directory)
+    if mismatches:
+        print("Mismatches:")
+        for mismatch in mismatches:
+            print(f"  {mismatch.describe()}")
+        sys.exit(1)
+    print("All recorded answers match.")
+
+
+if __name__ == "__main__":
+    main()
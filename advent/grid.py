@@ -0,0 +1,228 @@
+"""A character grid stored as one contiguous `uint8` NumPy array.
+
+Each cell holds the byte value of its character, so a 140x140 grid is 19.6 kB of
+memory instead of 19600 Python objects, and whole-grid questions ("where are the
+#s?", "which cells have an occupied neighbour?") are single vector operations:
+
+    grid = Grid.from_input("14_input")
+    boulders = grid.mask("O")
+    grid.rotated().positions("#")
+
+Positions are `(row, col)` tuples and directions `(d_row, d_col)` tuples.
+`rotated()`, `transposed()`, `row()` and `column()` return views that share the
+cells with the original grid; `copy()` them before mutating either.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Union
+
+from advent.loader import read_input
+from advent.util import lazy_import
+
+# Imported on first use, so that days (and tools listing them) load without NumPy
+np = lazy_import("numpy")
+
+Position = tuple[int, int]
+Direction = tuple[int, int]
+
+# North, east, south, west
+ORTHOGONAL: tuple[Direction, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL: tuple[Direction, ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ALL_DIRECTIONS: tuple[Direction, ...] = ORTHOGONAL + DIAGONAL
+
+
+def codes(chars: Union[str, bytes]) -> np.ndarray:
+    """The byte values of `chars`, for comparing against cells."""
+    if isinstance(chars, str):
+        chars = chars.encode()
+    return np.frombuffer(chars, dtype=np.uint8)
+
+
+class Grid:
+    def __init__(self, cells: np.ndarray):
+        if cells.ndim != 2:
+            raise ValueError(f"A grid needs two dimensions, got {cells.ndim}")
+        self.cells: np.ndarray = cells.astype(np.uint8, copy=False)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Union[str, bytes]]):
+        rows = [line.encode() if isinstance(line, str) else bytes(line) for line in lines]
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Not a rectangular grid")
+        flat = np.frombuffer(b"".join(rows), dtype=np.uint8)
+        return cls(flat.reshape(len(rows), len(rows[0]) if rows else 0).copy())
+
+    @classmethod
+    def from_input(cls, path):
+        return cls(read_input(path).grid().to_array().copy())
+
+    # --- Shape and access --- #
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def __contains__(self, position: Position) -> bool:
+        row, col = position
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(value, str):
+            value = ord(value)
+        self.cells[key] = value
+
+    def get(self, position: Position) -> int:
+        """The byte value at `position` as a plain `int` (faster than indexing)."""
+        return self.cells.item(position)
+
+    def char(self, row: int, col: int) -> str:
+        return chr(self.cells.item(row, col))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    def key(self) -> bytes:
+        """A hashable snapshot of the cells (grids themselves are mutable)."""
+        return self.cells.tobytes()
+
+    def copy(self):
+        return type(self)(self.cells.copy())
+
+    # --- Slicing and reorientation --- #
+
+    def row(self, row: int) -> np.ndarray:
+        return self.cells[row]
+
+    def column(self, col: int) -> np.ndarray:
+        return self.cells[:, col]
+
+    def line(self, row: int) -> str:
+        return self.cells[row].tobytes().decode()
+
+    def lines(self) -> list[str]:
+        return [self.line(row) for row in range(self.height)]
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def rotated(self, turns: int = 1):
+        """Rotated clockwise by `turns` quarter turns: the west becomes the north."""
+        return type(self)(np.rot90(self.cells, -turns))
+
+    def transposed(self):
+        return type(self)(self.cells.T)
+
+    # --- Masks --- #
+
+    def mask(self, chars: Union[str, bytes]) -> np.ndarray:
+        """Boolean array, true where the cell is one of `chars`."""
+        if len(chars) == 1:
+            return self.cells == codes(chars)[0]
+        return np.isin(self.cells, codes(chars))
+
+    def positions(self, chars: Union[str, bytes]) -> list[Position]:
+        """Positions of all cells that are one of `chars`, in reading order."""
+        return [tuple(position) for position in np.argwhere(self.mask(chars)).tolist()]
+
+    def find(self, char: str) -> Optional[Position]:
+        """The first position of `char` in reading order."""
+        found = np.flatnonzero(self.cells == ord(char))
+        if not len(found):
+            return None
+        return divmod(int(found[0]), self.width)
+
+    def word_mask(self, word: str, direction: Direction) -> np.ndarray:
+        """Boolean array, true where `word` starts and reads on in `direction`."""
+        d_row, d_col = direction
+        reach_row, reach_col = (len(word) - 1) * d_row, (len(word) - 1) * d_col
+        # Start positions from which the whole word stays inside the grid
+        rows = slice(max(0, -reach_row), self.height - max(0, reach_row))
+        cols = slice(max(0, -reach_col), self.width - max(0, reach_col))
+        found = np.zeros(self.shape, dtype=bool)
+        if rows.start >= rows.stop or cols.start >= cols.stop:
+            return found
+        window = np.ones((rows.stop - rows.start, cols.stop - cols.start), dtype=bool)
+        for i, char in enumerate(word):
+            shifted = self.cells[
+                rows.start + i * d_row : rows.stop + i * d_row,
+                cols.start + i * d_col : cols.stop + i * d_col,
+            ]
+            window &= shifted == ord(char)
+        found[rows, cols] = window
+        return found
+
+    @staticmethod
+    def neighbour_counts(
+        mask: np.ndarray, directions: Iterable[Direction] = ALL_DIRECTIONS
+    ) -> np.ndarray:
+        """For every cell, the number of its neighbours (in `directions`) set in `mask`."""
+        padded = np.pad(mask, 1).astype(np.uint8)
+        height, width = mask.shape
+        counts = np.zeros(mask.shape, dtype=np.uint8)
+        for d_row, d_col in directions:
+            counts += padded[1 + d_row : 1 + d_row + height, 1 + d_col : 1 + d_col + width]
+        return counts
+
+    @staticmethod
+    def dilated(mask: np.ndarray, directions: Iterable[Direction] = ALL_DIRECTIONS) -> np.ndarray:
+        """`mask` grown by one step in `directions`: set cells and their neighbours."""
+        return mask | (Grid.neighbour_counts(mask, directions) > 0)
+
+    @staticmethod
+    def label_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Number the horizontal runs of set cells in `mask` 1, 2, ... in reading order.
+
+        Returns an array holding each cell's run number (0 outside of runs) and, per
+        run, its row, its first column and the column after its last.
+        """
+        height, width = mask.shape
+        # A cleared column after each row keeps runs from wrapping to the next row
+        flat = np.pad(mask, ((0, 0), (0, 1))).ravel()
+        edges = np.diff(flat.astype(np.int8), prepend=0)
+        starts = np.flatnonzero(edges == 1)
+        stops = np.flatnonzero(edges == -1)
+        labels = (np.cumsum(edges == 1) * flat).reshape(height, width + 1)[:, :width]
+        rows, start_cols = np.divmod(starts, width + 1)
+        return labels, rows, start_cols, stops - rows * (width + 1)
+
+    # --- Stepping --- #
+
+    def step(
+        self, position: Position, direction: Direction, distance: int = 1
+    ) -> Optional[Position]:
+        """The position `distance` steps in `direction`, or None outside the grid."""
+        row = position[0] + direction[0] * distance
+        col = position[1] + direction[1] * distance
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return row, col
+        return None
+
+    def neighbours(
+        self, position: Position, directions: Iterable[Direction] = ORTHOGONAL
+    ) -> list[Position]:
+        """The positions next to `position` (in `directions`) that are inside the grid."""
+        result = []
+        for direction in directions:
+            neighbour = self.step(position, direction)
+            if neighbour is not None:
+                result.append(neighbour)
+        return result
+
+    def walk(self, position: Position, direction: Direction) -> Iterator[Position]:
+        """The positions from `position` (exclusive) in `direction` up to the edge."""
+        while (position := self.step(position, direction)) is not None:
+            yield position
@@ -0,0 +1,138 @@
+"""Startup cost of each day: interpreter start plus importing the day module.
+
+Every day is started in fresh interpreters, as a single `python 2023/05.py` would
+be. "Startup" is the wall time of the whole process and "Load" the time spent
+executing the day module itself (its imports and module-level code), both the
+minimum of `--repeat` runs. One more run under `python -X importtime` splits
+the load into the modules the day imports directly, heaviest first, each with
+everything it imports in turn.
+
+Days whose load exceeds `--budget` milliseconds are listed at the end and make
+the command exit with status 1, so that a heavy top-level import (NumPy in a day
+that only needs it to parse) shows up as a failure rather than as noise.
+
+Usage: python -m advent.imports [YEAR | YEAR/DAY ...] [--budget MS] [--repeat N]
+                                [--top N]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from advent.days import Day, discover
+from advent.util import tf
+
+MARKER = "-- advent.imports: loading the day --"
+
+# Run in a fresh interpreter with the day's path and module name as arguments.
+# It imports as little as possible itself, so that the day is charged for all
+# of its own imports.
+BOOTSTRAP = f"""
+import importlib.util, os, sys, time
+path, name = sys.argv[1], sys.argv[2]
+os.chdir(os.path.dirname(path))
+sys.stderr.write({MARKER!r} + "\\n")
+t0 = time.perf_counter()
+spec = importlib.util.spec_from_file_location(name, path)
+module = importlib.util.module_from_spec(spec)
+sys.modules[name] = module
+spec.loader.exec_module(module)
+print(time.perf_counter() - t0)
+"""
+
+
+@dataclass
+class ImportReport:
+    day: Day
+    startup_seconds: float = float("inf")
+    load_seconds: float = float("inf")
+    # Modules imported directly by the day and their cumulative import time
+    imports: list[tuple[str, float]] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def start(day: Day, *options: str) -> subprocess.CompletedProcess:
+    command = [sys.executable, *options, "-c", BOOTSTRAP, str(day.path), day.module_name]
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def top_level_imports(stderr: str) -> list[tuple[str, float]]:
+    """The unnested imports after the marker in `-X importtime` output.
+
+    Lines look like `import time:       412 |       1337 |   name`, with two
+    spaces of indentation before the name per level of nesting.
+    """
+    imports = []
+    _, _, after = stderr.partition(MARKER)
+    for line in after.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith(" ") and not name.startswith("  "):
+            imports.append((name.strip(), int(cumulative) / 1e6))
+    return sorted(imports, key=lambda item: item[1], reverse=True)
+
+
+def measure(day: Day, repeat: int = 5) -> ImportReport:
+    report = ImportReport(day)
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        process = start(day)
+        startup = time.perf_counter() - t0
+        if process.returncode != 0:
+            report.error = process.stderr.strip().splitlines()[-1]
+            return report
+        report.startup_seconds = min(report.startup_seconds, startup)
+        report.load_seconds = min(report.load_seconds, float(process.stdout))
+    report.imports = top_level_imports(start(day, "-X", "importtime").stderr)
+    return report
+
+
+def print_table(reports: list[ImportReport], top: int) -> None:
+    header = ["Day", "Startup", "Load", "Heaviest imports"]
+    rows = []
+    for report in reports:
+        if report.error:
+            rows.append([report.day.name, "-", "-", f"ERROR: {report.error}"])
+            continue
+        heaviest = ", ".join(f"{name} {tf(seconds)}" for name, seconds in report.imports[:top])
+        rows.append(
+            [report.day.name, tf(report.startup_seconds), tf(report.load_seconds), heaviest]
+        )
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for row in [header, ["=" * w for w in widths]] + rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.imports", description=__doc__)
+    parser.add_argument("days", nargs="*", help="years or days to measure, e.g. 2023 or 2024/05")
+    parser.add_argument(
+        "--budget", type=float, default=75.0, help="milliseconds a day may take to load"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed starts per day")
+    parser.add_argument("--top", type=int, default=3, help="imports listed per day")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = discover(selectors=args.days)
+    if not days:
+        sys.exit("No days found.")
+    reports = [measure(day, args.repeat) for day in days]
+    print_table(reports, args.top)
+
+    over = [r for r in reports if not r.error and r.load_seconds * 1000 > args.budget]
+    if over:
+        print(f"\nOver the budget of {args.budget} ms:")
+        for report in over:
+            print(f"  {report.day.name}: {tf(report.load_seconds)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
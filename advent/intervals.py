@@ -0,0 +1,178 @@
+"""Sets of integers stored as sorted, merged intervals.
+
+An `IntervalSet` holds half-open `[start, stop)` intervals (like `range`) that are
+sorted, disjoint and not adjacent, so every set has exactly one representation:
+
+    valid = IntervalSet([range(1, 4), range(5, 8), range(3, 5)])
+    valid                     # IntervalSet([range(1, 8)])
+    6 in valid                # True, by binary search
+    valid - IntervalSet([range(2, 3)])
+    (valid & other).shift(10)
+    valid.clip(range(0, 5))   # IntervalSet([range(1, 5)])
+
+Membership and overlap queries are O(log n) in the number of intervals, and
+`clip` is O(log n + k) for the k intervals it keeps; union, intersection and
+difference merge the two sorted lists in O(n + m). Sets are immutable; the
+operations return new sets.
+"""
+
+import bisect
+from typing import Iterable, Iterator, Union
+
+Interval = Union[range, tuple[int, int]]
+
+
+class IntervalSet:
+    __slots__ = ("starts", "stops")
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self.starts: list[int]
+        self.stops: list[int]
+        self.starts, self.stops = _merge(sorted(map(_bounds, intervals)))
+
+    @classmethod
+    def _from_merged(cls, starts: list[int], stops: list[int]):  # type: (...) -> IntervalSet
+        """Wrap bounds that are already sorted and merged, without checking them."""
+        result = cls.__new__(cls)
+        result.starts, result.stops = starts, stops
+        return result
+
+    # --- Queries --- #
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect.bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.stops[i]
+
+    def overlaps(self, interval: Interval) -> bool:
+        """Whether any member lies in `interval`."""
+        start, stop = _bounds(interval)
+        # The first interval ending after `start` is the only candidate
+        i = bisect.bisect_right(self.stops, start)
+        return start < stop and i < len(self.starts) and self.starts[i] < stop
+
+    def __iter__(self) -> Iterator[range]:
+        """The intervals, in order."""
+        return map(range, self.starts, self.stops)
+
+    def __len__(self) -> int:
+        """The number of members (not of intervals)."""
+        return sum(self.stops) - sum(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    @property
+    def start(self) -> int:
+        """The smallest member."""
+        return self.starts[0]
+
+    @property
+    def stop(self) -> int:
+        """One past the largest member."""
+        return self.stops[-1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    # --- Operations --- #
+
+    def union(self, other):  # type: (IntervalSet) -> IntervalSet
+        return IntervalSet._from_merged(*_merge(_interleave(self, other)))
+
+    def intersection(self, other):  # type: (IntervalSet) -> IntervalSet
+        starts, stops = [], []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            stop = min(self.stops[i], other.stops[j])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            # Drop whichever interval ends first; the other may overlap more
+            if self.stops[i] < other.stops[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_merged(starts, stops)
+
+    def difference(self, other):  # type: (IntervalSet) -> IntervalSet
+        starts, stops = [], []
+        j = 0
+        for start, stop in zip(self.starts, self.stops):
+            # Skip the removed intervals that end before this one
+            while j < len(other.starts) and other.stops[j] <= start:
+                j += 1
+            k = j
+            while k < len(other.starts) and other.starts[k] < stop:
+                if other.starts[k] > start:
+                    starts.append(start)
+                    stops.append(other.starts[k])
+                start = max(start, other.stops[k])
+                k += 1
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+        return IntervalSet._from_merged(starts, stops)
+
+    def clip(self, interval: Interval):  # type: (Interval) -> IntervalSet
+        """The members within `interval`; like `& IntervalSet([interval])`, but only
+        visits the intervals that overlap it."""
+        start, stop = _bounds(interval)
+        if start >= stop:
+            return IntervalSet()
+        i = bisect.bisect_right(self.stops, start)
+        j = bisect.bisect_left(self.starts, stop)
+        starts, stops = self.starts[i:j], self.stops[i:j]
+        if starts:
+            starts[0] = max(starts[0], start)
+            stops[-1] = min(stops[-1], stop)
+        return IntervalSet._from_merged(starts, stops)
+
+    def shift(self, offset: int):  # type: (int) -> IntervalSet
+        """Every member moved by `offset`."""
+        return IntervalSet._from_merged(
+            [start + offset for start in self.starts], [stop + offset for stop in self.stops]
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def _bounds(interval: Interval) -> tuple[int, int]:
+    if isinstance(interval, range):
+        return interval.start, interval.stop
+    return interval
+
+
+def _merge(pairs: Iterable[tuple[int, int]]) -> tuple[list[int], list[int]]:
+    """Merge `(start, stop)` pairs sorted by start into disjoint, non-adjacent bounds."""
+    starts: list[int] = []
+    stops: list[int] = []
+    for start, stop in pairs:
+        if start >= stop:
+            continue
+        # Overlapping or adjacent: extend the previous interval
+        if stops and start <= stops[-1]:
+            stops[-1] = max(stops[-1], stop)
+        else:
+            starts.append(start)
+            stops.append(stop)
+    return starts, stops
+
+
+def _interleave(a: IntervalSet, b: IntervalSet) -> Iterator[tuple[int, int]]:
+    """The intervals of both sets, in order of their start."""
+    i = j = 0
+    while i < len(a.starts) or j < len(b.starts):
+        if j == len(b.starts) or (i < len(a.starts) and a.starts[i] <= b.starts[j]):
+            yield a.starts[i], a.stops[i]
+            i += 1
+        else:
+            yield b.starts[j], b.stops[j]
+            j += 1
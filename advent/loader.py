@@ -0,0 +1,152 @@
+"""Memory-mapped access to puzzle inputs.
+
+`read_input(path)` maps the file into memory instead of reading (and copying) it.
+On top of the mapping it offers chunks, lines, blank-line-separated blocks, and a 2D view
+of a character grid that indexes straight into the mapped bytes, so a grid costs
+one byte per cell instead of one Python object per character.
+
+    grid = read_input("14_input").grid()
+    grid[0, 3] == ord("#")
+
+Inputs that are too large to map, or that arrive on stdin, can be streamed record
+by record with `read_records(path)`; it holds one record in memory at a time.
+"""
+
+import mmap
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO, Union
+
+NEWLINE = ord("\n")
+
+
+class Input:
+    """A memory-mapped input file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            try:
+                self.data: Union[mmap.mmap, bytes] = mmap.mmap(
+                    fh.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:  # empty files cannot be mapped
+                self.data = b""
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def raw_lines(self) -> Iterator[memoryview]:
+        """Lines without their newline, as zero-copy views into the mapping."""
+        view = memoryview(self.data)
+        start = 0
+        while start < len(view):
+            end = self.data.find(b"\n", start)
+            if end == -1:
+                end = len(view)
+            yield view[start:end]
+            start = end + 1
+
+    def chunks(self, size: int = 1 << 20) -> Iterator[bytes]:
+        """The contents in pieces of `size` bytes, copying one piece at a time."""
+        for start in range(0, len(self.data), size):
+            yield self.data[start : start + size]
+
+    def lines(self) -> Iterator[str]:
+        """Decoded lines without their newline."""
+        for line in self.raw_lines():
+            yield str(line, "utf-8").rstrip("\r")
+
+    def blocks(self) -> Iterator[list[str]]:
+        """Groups of lines separated by blank lines."""
+        return records(self.lines())
+
+    def grid(self):  # type: () -> ByteGrid
+        return ByteGrid(self.data)
+
+
+class ByteGrid:
+    """Read-only 2D view of a rectangular character grid, one byte per cell.
+
+    Indexing returns the byte value (`grid[r, c] == ord("#")`); rows are returned as
+    `memoryview`s into the same buffer.
+    """
+
+    def __init__(self, data: Union[mmap.mmap, bytes, bytearray]):
+        width = data.find(b"\n")
+        if width == -1:
+            width = len(data)
+        stride = width + 1
+        if len(data) % stride:
+            if (len(data) + 1) % stride:
+                raise ValueError("Not a rectangular grid")
+            # Without a final newline the rows cannot be strided; copy once
+            data = bytes(data) + b"\n"
+        self.height = len(data) // stride
+        self.width = width
+        self.stride = stride
+        self.buffer = memoryview(data)
+
+    def __contains__(self, position: tuple[int, int]) -> bool:
+        row, col = position
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        row, col = position
+        if position not in self:
+            raise IndexError(f"{position} outside of {self.height}x{self.width} grid")
+        return self.buffer[row * self.stride + col]
+
+    def char(self, row: int, col: int) -> str:
+        return chr(self[row, col])
+
+    def row(self, row: int) -> memoryview:
+        if not 0 <= row < self.height:
+            raise IndexError(f"Row {row} outside of {self.height}x{self.width} grid")
+        start = row * self.stride
+        return self.buffer[start : start + self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        for row in range(self.height):
+            yield self.row(row)
+
+    def to_array(self):
+        """The grid as a (height, width) `uint8` NumPy view, without copying."""
+        import numpy as np
+
+        flat = np.frombuffer(self.buffer, dtype=np.uint8)
+        return flat.reshape(self.height, self.stride)[:, : self.width]
+
+
+def read_input(path: Union[str, Path]) -> Input:
+    return Input(path)
+
+
+def records(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Group lines (without their newline) into records separated by blank lines.
+
+    Runs of blank lines count as one separator; no empty records are yielded.
+    """
+    record: list[str] = []
+    for line in lines:
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def read_records(source: Union[str, Path, TextIO] = "-") -> Iterator[list[str]]:
+    """Stream the blank-line-separated records of a file, lazily.
+
+    `source` is a path, "-" for stdin, or an open text file. Lines are read one at
+    a time, so memory is bounded by the largest record, not by the input.
+    """
+    if isinstance(source, (str, Path)) and str(source) != "-":
+        with open(source, encoding="utf-8") as fh:
+            yield from read_records(fh)
+        return
+    stream = sys.stdin if isinstance(source, (str, Path)) else source
+    yield from records(line.rstrip("\r\n") for line in stream)
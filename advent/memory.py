@@ -0,0 +1,82 @@
+"""Memory accounting for a single run of a phase.
+
+`track_memory()` records the peak resident set size of the process and the number
+of objects the garbage collector saw created ("gc objects"), both cheap enough to
+use during timed runs. Peak traced Python memory needs `tracemalloc`, which
+slows everything down, so `advent.bench.traced_peak` measures it in a separate run.
+
+The peak RSS is reset before the block where the OS allows it (Linux, through
+`/proc/self/clear_refs`); elsewhere it is the peak of the whole process so far.
+The gc object count is not an allocation count. It covers objects tracked by the
+garbage collector (containers, instances, tuples, ...), not ints, floats, strings
+or array buffers, and only those still alive at the next young collection. For
+every allocated block, use `--traced` or the tracemalloc report of `--profile`.
+"""
+
+import contextlib
+import gc
+import resource
+import sys
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+STATUS = "/proc/self/status"
+CLEAR_REFS = "/proc/self/clear_refs"
+
+
+@dataclass
+class MemoryUsage:
+    # Bytes; None where the platform cannot tell
+    peak_rss: Optional[int] = None
+    peak_traced: Optional[int] = None
+    # GC-tracked objects only, not all allocations; see the module docstring
+    gc_objects: Optional[int] = None
+
+
+def reset_peak_rss() -> bool:
+    """Reset the process's RSS high-water mark, if supported."""
+    try:
+        with open(CLEAR_REFS, "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss() -> int:
+    """The RSS high-water mark of this process in bytes."""
+    try:
+        with open(STATUS) as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes everywhere except on macOS
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def gc_object_count() -> int:
+    """GC-tracked objects counted by the collector's young generation so far.
+
+    Every collection resets the young generation's counter, which by then has
+    reached the threshold, so collections * threshold + current count is the
+    running total.
+    """
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    return collections * gc.get_threshold()[0] + gc.get_count()[0]
+
+
+@contextlib.contextmanager
+def track_memory() -> Iterator[MemoryUsage]:
+    """Fill the yielded `MemoryUsage` with the peak RSS and GC objects of the block."""
+    usage = MemoryUsage()
+    gc.collect()
+    reset_peak_rss()
+    objects = gc_object_count()
+    try:
+        yield usage
+    finally:
+        usage.gc_objects = gc_object_count() - objects
+        usage.peak_rss = peak_rss()
@@ -0,0 +1,123 @@
+"""cProfile and tracemalloc reports for the phases of a day.
+
+With `python -m advent --profile [N]`, every phase of the selected days ("parse",
+"part_one", "part_two", as in `advent.bench`) is run once more after the timed
+run, under both `cProfile` and `tracemalloc`. For each phase we report the top N
+functions by their own time (`tottime`, without the functions they call) and the
+top N source lines by memory still held when the phase ended. The harness that
+calls the parts (`advent.bench`, `advent.days`, ...) is left out of the function
+list, while the helpers the days use (`advent.grid`, `advent.search`, ...) stay. A phase stopped by `--timeout` is profiled up to that
+point, which for a runaway search shows where its time and memory went. As in
+the benchmarks, the parts are handed an input parsed before profiling starts.
+Tracing slows everything down, so the timings in these reports are only
+comparable with each other.
+"""
+
+import cProfile
+import gc
+import io
+import linecache
+import pstats
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from advent.bench import Phase
+from advent.days import ROOT
+from advent.util import PartTimeout, mf, time_limit
+
+# The modules that wrap the calls to the parts; their frames only add noise
+HARNESS = {
+    str(Path(__file__).with_name(name))
+    for name in ("bench.py", "days.py", "profiling.py", "runner.py", "util.py")
+}
+
+# Frames of the tooling itself are not interesting as allocation sites
+IGNORED_FRAMES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+@dataclass
+class PhaseProfile:
+    phase: str
+    functions: str
+    allocations: str
+    error: Optional[str] = None
+
+    def report(self, title: str) -> str:
+        status = f" ({self.error})" if self.error else ""
+        return (
+            f"--- {title} {self.phase}{status} ---\n\n"
+            f"Top functions by own time:\n{self.functions}\n"
+            f"Top allocation sites by memory held:\n{self.allocations}"
+        )
+
+
+def short_path(filename: str) -> str:
+    try:
+        return str(Path(filename).relative_to(ROOT))
+    except ValueError:
+        return filename
+
+
+def top_functions(profiler: cProfile.Profile, top: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    for key in [key for key in stats.stats if key[0] in HARNESS]:
+        del stats.stats[key]
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    # Drop the preamble ("N function calls in S seconds", ordering, ...)
+    text = stream.getvalue()
+    return text[text.find("   ncalls") :].rstrip("\n") + "\n"
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, top: int) -> str:
+    lines = []
+    statistics = snapshot.filter_traces(IGNORED_FRAMES).statistics("lineno")
+    for stat in statistics[:top]:
+        frame = stat.traceback[0]
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        lines.append(
+            f"{mf(stat.size):>12}  {stat.count:>9} blocks  "
+            f"{short_path(frame.filename)}:{frame.lineno}  {source}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def profile_phase(
+    name: str, phase: Phase, top: int = 15, timeout: Optional[float] = None
+) -> PhaseProfile:
+    """Run the phase once under cProfile and tracemalloc (its preparation is not)."""
+    error = None
+    profiler = cProfile.Profile()
+    prepared = result = None
+    try:
+        with time_limit(timeout):
+            prepared = phase.prepare()
+    except Exception as exc:
+        return PhaseProfile(name, "", "", f"{type(exc).__name__}: {exc}")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # The result is kept alive until the snapshot, so its memory is included
+        with time_limit(timeout):
+            profiler.enable()
+            try:
+                result = phase.run(prepared)
+            finally:
+                profiler.disable()
+    except PartTimeout:
+        error = f"timeout: stopped after {timeout} s"
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    try:
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result, prepared
+    return PhaseProfile(name, top_functions(profiler, top), top_allocations(snapshot, top), error)
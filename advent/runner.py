@@ -0,0 +1,282 @@
+"""Run all discovered days in a process pool and print a timing table.
+
+With `--memory`, the table also shows each part's peak RSS and its "gc objects",
+the objects the garbage collector tracks that it created; ints, floats and
+strings are not among them, so this is not an allocation count (see
+`advent.memory`). `--traced` adds its peak traced Python memory, from an extra run
+under tracemalloc. That run is slow and needs several times the memory of the
+regular one, so it is capped at ten times `--timeout` (or `TRACED_TIME_LIMIT`).
+
+Each day runs as its own task. When a worker dies, for example because it was
+killed for running out of memory, that day's parts report the error and the
+other days still get their results.
+
+With `--profile`, each phase is afterwards run once more under cProfile and
+tracemalloc, and the hot spots are printed below the table (see `advent.profiling`).
+
+With `--counters`, the search counters of each part (states expanded, queue peak,
+...; see `advent.counters`) are printed below the table next to its time. They
+are kept for parts that time out, too.
+
+Usage: python -m advent [YEAR | YEAR/DAY ...] [--jobs N] [--timeout SECONDS]
+                        [--memory [--traced]] [--profile [N]] [--counters]
+                        [--no-cache]
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from advent import cache, counters
+from advent.bench import phases, traced_peak
+from advent.days import PARTS, Day, discover, load, skipped, solve, working_directory
+from advent.memory import MemoryUsage, track_memory
+from advent.profiling import PhaseProfile, profile_phase
+from advent.util import PartTimeout, mf, tf, time_limit
+
+# Seconds allowed for the tracemalloc run of a part when no --timeout is given
+TRACED_TIME_LIMIT = 60.0
+
+
+@dataclass
+class PartResult:
+    answer: Optional[str] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+    memory: Optional[MemoryUsage] = None
+    counters: dict[str, int] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        """Answer for the table; errors are shortened to their kind."""
+        if self.error is None:
+            return self.answer
+        return f"[{self.error.split(':')[0]}]"
+
+
+@dataclass
+class DayResult:
+    day: Day
+    import_seconds: float = 0.0
+    parts: dict[str, PartResult] = field(default_factory=dict)
+    profiles: list[PhaseProfile] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.import_seconds + sum(p.seconds for p in self.parts.values())
+
+    @classmethod
+    def failed(cls, day: Day, error: str) -> "DayResult":
+        """A day whose worker could not report back; every part gets `error`."""
+        return cls(day, parts={part: PartResult(error=error) for part in PARTS})
+
+
+def run_part(
+    module,
+    part: str,
+    timeout: Optional[float],
+    memory: bool = False,
+    traced: bool = False,
+    given: Optional[Callable[[], Any]] = None,
+) -> PartResult:
+    """Solve one part; `given` replaces the module's parser (see `advent.days.call`)."""
+    result = PartResult()
+    tracking = track_memory() if memory else contextlib.nullcontext()
+    counters.reset()
+    t0 = time.perf_counter()
+    try:
+        with tracking as result.memory, time_limit(timeout):
+            result.answer = str(solve(module, part, given))
+    except PartTimeout:
+        result.error = f"timeout: no answer after {timeout} s"
+    except Exception as exc:  # a broken day must not take down the whole run
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.seconds = time.perf_counter() - t0
+    result.counters = counters.snapshot()
+    if memory and traced and result.error is None:
+        try:
+            # Tracing is slow, so allow it a multiple of the regular time limit
+            with time_limit(10 * timeout if timeout else TRACED_TIME_LIMIT):
+                result.memory.peak_traced = traced_peak(lambda: solve(module, part, given))
+        except PartTimeout:
+            pass
+    return result
+
+
+def run_day(
+    day: Day,
+    timeout: Optional[float] = None,
+    profile_top: Optional[int] = None,
+    memory: bool = False,
+    traced: bool = False,
+) -> DayResult:
+    """Import one day and run both of its parts. Executed inside the workers."""
+    result = DayResult(day)
+    t0 = time.perf_counter()
+    module = load(day)
+    result.import_seconds = time.perf_counter() - t0
+    with working_directory(day.path.parent):
+        for part in PARTS:
+            result.parts[part] = run_part(module, part, timeout, memory, traced)
+        if profile_top:
+            for name, phase in phases(module).items():
+                result.profiles.append(profile_phase(name, phase, profile_top, timeout))
+    return result
+
+
+def start_worker(use_cache: bool, count: bool) -> None:
+    cache.set_enabled(use_cache)
+    counters.enable(count)
+
+
+def collect(day: Day, future) -> Optional[DayResult]:
+    """The day's result, None if its pool broke, or the error it raised."""
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        return None
+    except Exception as exc:  # e.g. the day fails to import
+        return DayResult.failed(day, f"{type(exc).__name__}: {exc}")
+
+
+def run_days(
+    days: list[Day],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    profile_top: Optional[int] = None,
+    memory: bool = False,
+    use_cache: bool = True,
+    count: bool = False,
+    traced: bool = False,
+) -> list[DayResult]:
+    """Run the days in a process pool, returning their results in order.
+
+    A dead worker breaks the whole pool and fails every day still pending in it,
+    so those days are run again, each in a pool of its own; only a day that
+    kills its worker again is reported as failed.
+    """
+    options = (timeout, profile_top, memory, traced)
+    results: dict[Day, Optional[DayResult]] = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=start_worker, initargs=(use_cache, count)
+    ) as pool:
+        futures = {day: pool.submit(run_day, day, *options) for day in days}
+        for day, future in futures.items():
+            results[day] = collect(day, future)
+    for day in days:
+        if results[day] is None:
+            with ProcessPoolExecutor(
+                max_workers=1, initializer=start_worker, initargs=(use_cache, count)
+            ) as pool:
+                result = collect(day, pool.submit(run_day, day, *options))
+            results[day] = result or DayResult.failed(
+                day, "BrokenProcessPool: the worker died (out of memory?)"
+            )
+    return [results[day] for day in days]
+
+
+
+def memory_columns(part: PartResult) -> list[str]:
+    usage = part.memory or MemoryUsage()
+    return [
+        "" if usage.peak_rss is None else mf(usage.peak_rss),
+        "" if usage.peak_traced is None else mf(usage.peak_traced),
+        "" if usage.gc_objects is None else str(usage.gc_objects),
+    ]
+
+
+def print_table(results: list[DayResult], wall_seconds: float, memory: bool = False) -> None:
+    header = ["Day", "Import"]
+    for name in ("Part One", "Part Two"):
+        header += [name, "Time"]
+        if memory:
+            header += ["Peak RSS", "Traced", "gc objects"]
+    header.append("Total")
+    rows = []
+    for res in results:
+        row = [res.day.name, tf(res.import_seconds)]
+        for part in PARTS:
+            row += [res.parts[part].describe(), tf(res.parts[part].seconds)]
+            if memory:
+                row += memory_columns(res.parts[part])
+        row.append(tf(res.total_seconds))
+        rows.append(row)
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for row in [header, ["=" * w for w in widths]] + rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+    cpu_seconds = sum(r.total_seconds for r in results)
+    print(f"\nSum of day times: {tf(cpu_seconds)}\nWall time: {tf(wall_seconds)}")
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent", description=__doc__)
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2024/05")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per part")
+    parser.add_argument(
+        "--memory", action="store_true", help="also report peak RSS and gc objects"
+    )
+    parser.add_argument(
+        "--traced",
+        action="store_true",
+        help="with --memory, rerun each part under tracemalloc (slow, memory hungry)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=int,
+        nargs="?",
+        const=15,
+        metavar="N",
+        help="profile each phase and show the top N entries (default: 15)",
+    )
+    parser.add_argument(
+        "--counters", action="store_true", help="also report the search counters"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="always parse the input")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.traced and not args.memory:
+        sys.exit("--traced needs --memory.")
+    days = discover(selectors=args.days)
+    left_out = skipped(selectors=args.days)
+    if not days:
+        sys.exit("No days found.")
+
+    t0 = time.perf_counter()
+    results = run_days(
+        days,
+        args.jobs,
+        args.timeout,
+        args.profile,
+        args.memory,
+        use_cache=not args.no_cache,
+        count=args.counters,
+        traced=args.traced,
+    )
+    print_table(results, time.perf_counter() - t0, args.memory)
+    if left_out:
+        names = ", ".join(day.name for day in left_out)
+        print(f"\nSkipped (no part_one/part_two): {names}")
+
+    counted = [
+        (res.day.name, part, res.parts[part])
+        for res in results
+        for part in PARTS
+        if res.parts[part].counters
+    ]
+    if counted:
+        print("\nCounters:")
+        for name, part, result in counted:
+            print(f"  {name} {part} ({tf(result.seconds)}): {counters.describe(result.counters)}")
+
+    for res in results:
+        for profile in res.profiles:
+            print(f"\n{profile.report(res.day.name)}")
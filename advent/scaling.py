@@ -0,0 +1,124 @@
+"""Measure how each day's phases scale with the size of a generated input.
+
+Every selected day with a generator in `advent.generators` is run on inputs of
+size n, 2n, 4n, ... (the day's default size unless `--size` is given). For each
+phase we fit time ~ bytes^k on a log-log scale and report the exponent k, so
+k = 1 means linear in the input size and k = 2 quadratic. A phase that fails or
+times out at one size is not retried on the larger ones.
+
+Usage: python -m advent.scaling [YEAR | YEAR/DAY ...] [--size N] [--factors 1 2 4]
+                                [--repeat N] [--seed N] [--timeout SECONDS]
+"""
+
+import argparse
+import math
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from advent import cache
+from advent.bench import measure, phases
+from advent.days import Day, discover, load, working_directory
+from advent.generators import GENERATORS, generate
+from advent.util import tf
+
+
+@dataclass
+class Scaling:
+    day: Day
+    phase: str
+    # input size in bytes -> median seconds
+    points: dict[int, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def exponent(self) -> Optional[float]:
+        """Least squares slope of log(time) over log(bytes)."""
+        if len(self.points) < 2:
+            return None
+        xs = [math.log(size) for size in self.points]
+        ys = [math.log(max(seconds, 1e-9)) for seconds in self.points.values()]
+        x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+        spread = sum((x - x_mean) ** 2 for x in xs)
+        if spread == 0:
+            return None
+        return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / spread
+
+
+def scale_day(
+    day: Day,
+    size: int,
+    factors: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+    timeout: Optional[float] = None,
+) -> list[Scaling]:
+    module = load(day)
+    results: dict[str, Scaling] = {}
+    with tempfile.TemporaryDirectory() as tmp, working_directory(day.path.parent):
+        for factor in factors:
+            text = generate(day.year, day.day, size * factor, seed)
+            path = Path(tmp) / f"{day.day:02d}_input"
+            path.write_text(text)
+            module.FILE_TO_READ = str(path)
+            for name, phase in phases(module).items():
+                result = results.setdefault(name, Scaling(day, name))
+                if result.error is not None:
+                    continue
+                stats = measure(phase, warmup=0, repeat=repeat, timeout=timeout)
+                if stats.error is not None:
+                    result.error = stats.error
+                    continue
+                result.points[len(text.encode())] = stats.median
+    return list(results.values())
+
+
+def print_report(results: list[Scaling], factors: list[int]) -> None:
+    header = ["Day", "Phase"] + [f"{f}n" for f in factors] + ["Exponent"]
+    rows = []
+    for res in results:
+        times = [tf(seconds) for seconds in res.points.values()]
+        if res.error is not None:
+            times.append(f"[{res.error.split(':')[0]}]")
+        times += [""] * (len(factors) - len(times))
+        exponent = res.exponent
+        rows.append(
+            [res.day.name, res.phase]
+            + times[: len(factors)]
+            + ["" if exponent is None else f"{exponent:.2f}"]
+        )
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for row in [header, ["=" * w for w in widths]] + rows:
+        print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.scaling", description=__doc__)
+    parser.add_argument("days", nargs="*", help="years or days to run, e.g. 2023 or 2023/14")
+    parser.add_argument("--size", type=int, help="base size n (default: per day)")
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per run")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    days = [d for d in discover(selectors=args.days) if (d.year, d.day) in GENERATORS]
+    if not days:
+        sys.exit("No days with an input generator found.")
+
+    # Every size is a new input, so caching the parsed ones would only fill the disk
+    cache.set_enabled(False)
+    results = []
+    for day in days:
+        size = args.size or GENERATORS[(day.year, day.day)][1]
+        results += scale_day(day, size, args.factors, args.repeat, args.seed, args.timeout)
+    print_report(results, args.factors)
+
+
+if __name__ == "__main__":
+    main()
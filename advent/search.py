@@ -0,0 +1,158 @@
+"""Shortest paths over implicit graphs whose states are encoded as integers.
+
+A day encodes each state (a position, plus e.g. the direction it came from) as
+an integer in `range(size)` and describes the graph by a function yielding the
+`(state, cost)` pairs reachable in one move. The distance table is then a flat
+list indexed by state instead of a dict of tuples or objects:
+
+    def moves(state):
+        row, col = divmod(state, width)
+        ...
+        yield next_state, cost
+
+    result = dijkstra([start], moves, size, is_goal=lambda s: s == target)
+    result.cost, result.path()
+
+- `dijkstra` takes any non-negative costs (binary heap). With a `heuristic` that
+  never overestimates the remaining cost to a goal, it is A*.
+- `zero_one_bfs` takes costs of 0 and 1 only (double-ended queue), which includes
+  plain breadth-first search.
+
+Both stop at the first goal state taken off the queue, or search everything
+reachable without `is_goal`. With `paths=True` they also remember each state's
+predecessor, for `SearchResult.path()`. Expanded states, stale pops (queue
+entries of states already expanded, skipped instead of removed when a cheaper
+entry is pushed) and the queue peak go to `advent.counters`.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+from advent import counters
+
+UNREACHED = -1
+
+Moves = Callable[[int], Iterable[tuple[int, int]]]
+
+
+@dataclass
+class SearchResult:
+    # Cost of the cheapest way to each state, UNREACHED if there is none (yet)
+    distances: list[int]
+    # Predecessor on that way, if asked for (UNREACHED for the starts)
+    parents: Optional[list[int]] = None
+    # The goal state the search stopped at
+    goal: Optional[int] = None
+
+    @property
+    def cost(self) -> int:
+        """Cost of the cheapest way to the goal."""
+        if self.goal is None:
+            raise ValueError("No goal was reached")
+        return self.distances[self.goal]
+
+    def reached(self) -> list[int]:
+        return [state for state, distance in enumerate(self.distances) if distance != UNREACHED]
+
+    def path(self, state: Optional[int] = None) -> list[int]:
+        """The states from a start to `state` (default: the goal)."""
+        if self.parents is None:
+            raise ValueError("Paths were not recorded; search with paths=True")
+        state = self.goal if state is None else state
+        if state is None or self.distances[state] == UNREACHED:
+            raise ValueError(f"State {state} was not reached")
+        path = [state]
+        while self.parents[path[-1]] != UNREACHED:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+
+def dijkstra(
+    starts: Iterable[int],
+    moves: Moves,
+    size: int,
+    is_goal: Optional[Callable[[int], bool]] = None,
+    heuristic: Optional[Callable[[int], int]] = None,
+    paths: bool = False,
+) -> SearchResult:
+    """Cheapest ways from the starts, in order of cost (plus heuristic, for A*)."""
+    result = SearchResult([UNREACHED] * size, [UNREACHED] * size if paths else None)
+    distances, parents = result.distances, result.parents
+    queue: list[tuple[int, int, int]] = []
+    for start in starts:
+        distances[start] = 0
+        queue.append((heuristic(start) if heuristic else 0, 0, start))
+    heapq.heapify(queue)
+    done = bytearray(size)
+    while queue:
+        if counters.enabled:
+            counters.peak("queue peak", len(queue))
+        _, distance, state = heapq.heappop(queue)
+        if done[state]:
+            # Already taken off the queue with a lower cost
+            if counters.enabled:
+                counters.add("stale pops")
+            continue
+        done[state] = True
+        if counters.enabled:
+            counters.add("expanded")
+        if is_goal is not None and is_goal(state):
+            result.goal = state
+            break
+        for next_state, cost in moves(state):
+            next_distance = distance + cost
+            known = distances[next_state]
+            if known == UNREACHED or next_distance < known:
+                distances[next_state] = next_distance
+                if parents is not None:
+                    parents[next_state] = state
+                priority = next_distance + heuristic(next_state) if heuristic else next_distance
+                heapq.heappush(queue, (priority, next_distance, next_state))
+    return result
+
+
+def zero_one_bfs(
+    starts: Iterable[int],
+    moves: Moves,
+    size: int,
+    is_goal: Optional[Callable[[int], bool]] = None,
+    paths: bool = False,
+) -> SearchResult:
+    """Cheapest ways from the starts when every move costs 0 or 1."""
+    result = SearchResult([UNREACHED] * size, [UNREACHED] * size if paths else None)
+    distances, parents = result.distances, result.parents
+    queue: deque[int] = deque()
+    for start in starts:
+        distances[start] = 0
+        queue.append(start)
+    done = bytearray(size)
+    while queue:
+        if counters.enabled:
+            counters.peak("queue peak", len(queue))
+        state = queue.popleft()
+        if done[state]:
+            if counters.enabled:
+                counters.add("stale pops")
+            continue
+        done[state] = True
+        if counters.enabled:
+            counters.add("expanded")
+        if is_goal is not None and is_goal(state):
+            result.goal = state
+            break
+        distance = distances[state]
+        for next_state, cost in moves(state):
+            next_distance = distance + cost
+            known = distances[next_state]
+            if known == UNREACHED or next_distance < known:
+                distances[next_state] = next_distance
+                if parents is not None:
+                    parents[next_state] = state
+                # Free moves go first, so the queue stays sorted by distance
+                if cost == 0:
+                    queue.appendleft(next_state)
+                else:
+                    queue.append(next_state)
+    return result
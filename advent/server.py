@@ -0,0 +1,254 @@
+"""A warm solver service on a Unix domain socket.
+
+`serve` keeps every day it has been asked about imported and the most recently
+parsed inputs in memory, so a request only pays for the solve itself instead of
+Python startup, imports (NumPy for the grid days) and parsing. Requests are
+answered one after another on the main thread, so part timeouts keep working.
+
+The protocol is one JSON object per line in each direction. A request is
+`{"op": "solve", "day": "2023/05", "part": "part_one", "input": PATH}` (or
+`"text"` with the input itself instead of `"input"`; without either, the day's own
+input is used). The response holds the answer and the time per phase, in seconds:
+
+    {"answer": "...", "error": null,
+     "timings": {"load": 0.0, "parse": 0.0008, "solve": 0.0021, "total": 0.0029}}
+
+"load" is the import of the day (zero once it is warm) and "parse" the time spent
+in `given()`. `{"op": "ping"}` and `{"op": "shutdown"}` are answered as well.
+
+Usage: python -m advent.server serve [--socket PATH] [--preload YEAR ...]
+                                     [--timeout SECONDS] [--memory-entries N]
+       python -m advent.server solve YEAR/DAY [part_one | part_two] [INPUT] [--socket PATH]
+       python -m advent.server ping | shutdown [--socket PATH]
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional
+
+from advent import cache
+from advent.days import PARTS, ROOT, Day, discover, load, solve, working_directory
+from advent.util import PartTimeout, time_limit
+
+SOCKET = ROOT / ".cache" / "solver.sock"
+
+
+class Solver:
+    """The warm state: imported days and a directory for inputs sent as text."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self.days = {day.name: day for day in discover()}
+        self.modules: dict[str, ModuleType] = {}
+        self.texts = tempfile.TemporaryDirectory(prefix="advent-server-")
+        # Seconds spent in the current request's given() calls
+        self.parse_seconds = 0.0
+
+    def module(self, name: str) -> tuple[ModuleType, float]:
+        """The imported day and how long importing it took now (0 if warm)."""
+        if name in self.modules:
+            return self.modules[name], 0.0
+        day = self.days[name]
+        t0 = time.perf_counter()
+        module = load(day)
+        if callable(getattr(module, "given", None)):
+            module.given = self.timed(module.given)
+        self.modules[name] = module
+        return module, time.perf_counter() - t0
+
+    def timed(self, given):
+        """Wrap a day's `given()` to add up the time spent parsing."""
+
+        @functools.wraps(given)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return given(*args, **kwargs)
+            finally:
+                self.parse_seconds += time.perf_counter() - t0
+
+        return wrapper
+
+    def input_path(self, request: dict[str, Any], day: Day) -> Path:
+        if "text" in request:
+            text = request["text"].encode()
+            # Named by content, so that the same text hits the parse cache again
+            path = Path(self.texts.name) / hashlib.sha256(text).hexdigest()
+            if not path.exists():
+                path.write_bytes(text)
+            return path
+        if "input" in request:
+            return Path(request["input"]).resolve()
+        return day.path.parent / f"{day.day:02d}_input"
+
+    def solve(self, request: dict[str, Any]) -> dict[str, Any]:
+        name, part = request.get("day"), request.get("part", "part_one")
+        if name not in self.days or part not in PARTS:
+            return {"answer": None, "error": f"No such day or part: {name} {part}"}
+        t0 = time.perf_counter()
+        module, load_seconds = self.module(name)
+        day = self.days[name]
+        if hasattr(module, "FILE_TO_READ"):
+            module.FILE_TO_READ = str(self.input_path(request, day))
+        answer, error = None, None
+        self.parse_seconds = 0.0
+        t1 = time.perf_counter()
+        try:
+            with working_directory(day.path.parent), time_limit(self.timeout):
+                answer = str(solve(module, part))
+        except PartTimeout:
+            error = f"timeout: no answer after {self.timeout} s"
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        t2 = time.perf_counter()
+        return {
+            "answer": answer,
+            "error": error,
+            "timings": {
+                "load": load_seconds,
+                "parse": self.parse_seconds,
+                "solve": t2 - t1 - self.parse_seconds,
+                "total": t2 - t0,
+            },
+        }
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                op = request.get("op", "solve")
+            except (ValueError, AttributeError) as exc:
+                request, op = {}, f"invalid request ({exc})"
+            if op == "solve":
+                response = self.server.solver.solve(request)
+            elif op == "ping":
+                response = {"pong": True}
+            elif op == "shutdown":
+                response = {"shutdown": True}
+                self.server.stopping = True
+            else:
+                response = {"error": f"Unknown op: {op}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.stopping:
+                return
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, solver: Solver):
+        self.solver = solver
+        self.stopping = False
+        super().__init__(str(path), Handler)
+
+
+def serve(
+    path: Path = SOCKET,
+    preload: Optional[list[str]] = None,
+    timeout: Optional[float] = None,
+    memory_entries: int = 64,
+) -> None:
+    cache.keep_in_memory(memory_entries)
+    solver = Solver(timeout)
+    for day in discover(selectors=preload) if preload else []:
+        solver.module(day.name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    with Server(path, solver) as server:
+        print(f"Serving on {path} ({len(solver.modules)} days preloaded)", file=sys.stderr)
+        try:
+            # One connection at a time, each with any number of requests
+            while not server.stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+            solver.texts.cleanup()
+
+
+class Client:
+    """A connection to a running server; requests are sent one at a time."""
+
+    def __init__(self, path: Path = SOCKET):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(str(path))
+        self.file = self.socket.makefile("rwb")
+
+    def request(self, **request: Any) -> dict[str, Any]:
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def solve(
+        self, day: str, part: str, input: Optional[str] = None, text: Optional[str] = None
+    ) -> dict[str, Any]:
+        request = {"op": "solve", "day": day, "part": part}
+        if input is not None:
+            request["input"] = str(Path(input).resolve())
+        if text is not None:
+            request["text"] = text
+        return self.request(**request)
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m advent.server", description=__doc__)
+    parser.add_argument("command", choices=["serve", "solve", "ping", "shutdown"])
+    parser.add_argument("day", nargs="?", help="the day to solve, e.g. 2023/05")
+    parser.add_argument("part", nargs="?", choices=PARTS, default="part_one")
+    parser.add_argument("input", nargs="?", help="input file (default: the day's own)")
+    parser.add_argument("--socket", type=Path, default=SOCKET)
+    parser.add_argument("--preload", nargs="*", metavar="YEAR", help="days to import up front")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per part")
+    parser.add_argument(
+        "--memory-entries", type=int, default=64, help="parsed inputs kept in memory"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.command == "serve":
+        serve(args.socket, args.preload, args.timeout, args.memory_entries)
+        return
+    if args.command == "solve" and not args.day:
+        sys.exit("solve needs a day, e.g. 2023/05")
+    try:
+        client = Client(args.socket)
+    except OSError as exc:
+        sys.exit(f"No server on {args.socket}: {exc}")
+    with client:
+        t0 = time.perf_counter()
+        if args.command == "solve":
+            response = client.solve(args.day, args.part, args.input)
+        else:
+            response = client.request(op=args.command)
+        round_trip = time.perf_counter() - t0
+    print(json.dumps(response))
+    print(f"Round trip: {round_trip * 1000:.3f} ms", file=sys.stderr)
+    if response.get("error"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Small helpers shared by the tooling modules."""
+
+import contextlib
+import importlib.util
+import os
+import signal
+import sys
+from types import ModuleType
+from typing import Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+class PartTimeout(Exception):
+    pass
+
+
+def tf(seconds: float) -> str:
+    """Format a duration the same way the 2020 scripts do."""
+    return f"{round(seconds * 1000, 5)} ms"
+
+
+def mf(size: int) -> str:
+    """Format a memory size in bytes."""
+    return f"{round(size / 2**20, 3)} MiB"
+
+
+@contextlib.contextmanager
+def quiet_broken_pipe() -> Iterator[None]:
+    """Exit quietly when the reader of stdout goes away, e.g. `... | head`.
+
+    stdout is pointed at devnull, as the Python docs on SIGPIPE suggest, so that
+    the flush at interpreter exit does not raise again.
+    """
+    try:
+        yield
+        sys.stdout.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def _raise_timeout(signum, frame):
+    raise PartTimeout()
+
+
+@contextlib.contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    """Raise `PartTimeout` if the block runs longer than `seconds` (main thread only)."""
+    if not seconds:
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def alternative(part: str) -> Callable[[F], F]:
+    """Mark a function as another implementation of `part`, to be compared with it
+    by `advent.differential`."""
+
+    def mark(function: F) -> F:
+        function.alternative_of = part
+        return function
+
+    return mark
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module only once one of its attributes is first used.
+
+    For heavy dependencies (NumPy) of modules that should stay cheap to import.
+    Annotations naming the module's types must then not be evaluated at import
+    time (`from __future__ import annotations`).
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    _lazy_modules.append(module)
+    return module
+
+
+_lazy_modules: list[ModuleType] = []
+
+
+def finish_lazy_imports() -> None:
+    """Import the modules of all `lazy_import` calls so far, if not done yet.
+
+    Lazy modules are not safe to be first used by several threads at once (before
+    Python 3.12), so threads call this before they share them.
+    """
+    for module in _lazy_modules:
+        # Any attribute access executes the module
+        getattr(module, "__doc__")